@@ -1,72 +1,405 @@
 """Advent of code 2025 solver CLI."""
 
 import argparse
-import dataclasses
 import importlib
 import pathlib
-from typing import TYPE_CHECKING, cast
+import sys
+from typing import TYPE_CHECKING, NamedTuple, cast
+
+from . import base
 
 if TYPE_CHECKING:
-    from . import base
+    from collections.abc import Generator, Iterable, Sequence
 
+    from .limits import Limits
 
-@dataclasses.dataclass
-class Args:
-    day: str
-    input: pathlib.Path
+DAYS: tuple[str, ...] = tuple(f"{day:0>2}" for day in range(1, 13))
+EXECUTORS: tuple[str, ...] = ("process", "interpreter", "thread", "serial")
+# The days whose dependencies, numpy and scipy, cannot be imported by subinterpreters
+INTERPRETER_UNSUPPORTED_DAYS: tuple[str, ...] = ("08", "09", "10")
+PROFILERS: tuple[str, ...] = ("cprofile", "sample", "tracemalloc")
+FORMATS: tuple[str, ...] = ("text", "json", "ndjson")
+COMMANDS: dict[str, str] = {
+    "bench": ".bench",
+    "diff": ".differential",
+    "generate": ".generators",
+    "scale": ".scale",
+    "serve": ".server",
+}
 
 
-def parse_args() -> Args:
-    """Parses the CLI args.
+def parse_day(x: str) -> str:
+    """Validates a day and formats it to a two-digit string.
 
-    Retruns:
-        The parsed args.
+    If the day is valid and the day is single digit, a leading
+    zero is added.
+
+    Args:
+        x: The input day.
+
+    Returns:
+        A two-character string of the validated day.
+    Raises:
+        argparse.ArgumentTypeError: If the input day is not a number
+            or not in [1, 12].
+    """
+    if not x.isnumeric():
+        raise argparse.ArgumentTypeError(f"The day must be a number. Got: {x}")
+
+    if not 1 <= int(x) <= 12:
+        raise argparse.ArgumentTypeError(
+            f"The day must be a number within the range [1, 12]. Got: {x}"
+        )
+
+    return f"{x:0>2}"
+
+
+def parse_days(x: str) -> list[str]:
+    """Validates the days to solve.
+
+    The days are either `all` or a comma separated list of days and
+    inclusive day ranges, e.g. `1,4,8-10`.
+
+    Args:
+        x: The input days.
+
+    Returns:
+        The sorted, unique two-character strings of the validated days.
+    Raises:
+        argparse.ArgumentTypeError: If any day is invalid or a range
+            is empty.
     """
+    if x == "all":
+        return list(DAYS)
+
+    result: set[str] = set()
+    for item in x.split(","):
+        start, separator, end = item.partition("-")
+        start = parse_day(start)
+        end = parse_day(end) if separator else start
+        if start > end:
+            raise argparse.ArgumentTypeError(
+                f"The day range must not be empty. Got: {item}"
+            )
+
+        result.update(d for d in DAYS if start <= d <= end)
 
-    def day(x: str) -> str:
-        """Validates a day and formats it to a two-digit string.
+    return sorted(result)
 
-        If the day is valid and the day is single digit, a leading
-        zero is added.
+
+def input_path(template: str | None, day: str, multiple: bool = False) -> pathlib.Path:
+    """Gets the input path for a day.
+
+    Any `{day}` in the template is replaced with the two-digit day. If no
+    template was provided, `input.txt` is used when solving a single day and
+    `inputs/day_{day}.txt` when solving multiple days.
+
+    Args:
+        template: The input path template.
+        day: The two-digit day.
+        multiple: Whether multiple days are being solved.
+
+    Returns:
+        The input path for the day.
+    """
+    if template is None:
+        template = "inputs/day_{day}.txt" if multiple else "input.txt"
+
+    return pathlib.Path(template.format(day=day))
+
+
+# Not a dataclass, as importing dataclasses slows down the CLI's startup
+class Args(NamedTuple):
+    days: list[str]
+    input: str | None
+    inputs: list[str]
+    executor: str
+    jobs: int | None
+    format: str
+    cache: bool
+    cache_dir: pathlib.Path | None
+    no_cache: bool
+    clear_cache: bool
+    result_cache: str | None
+    no_result_cache: bool
+    clear_result_cache: bool
+    profile: str | None
+    profile_output: pathlib.Path | None
+    profile_interval: float
+    startup_report: bool
+    remote: pathlib.Path | None
+    limits: Limits | None
+
+    def input_path(self, day: str) -> pathlib.Path:
+        """Gets the input path for a day. See `input_path`.
 
         Args:
-            x: The input day.
+            day: The two-digit day.
 
         Returns:
-            A two-character string of the validated day.
-        Raises:
-            argparse.ArgumentTypeError: If the input day is not a number
-                or not in [1, 12].
+            The input path for the day.
         """
-        if not x.isnumeric():
-            raise argparse.ArgumentTypeError(f"The day must be a number. Got: {x}")
+        return input_path(self.input, day, multiple=len(self.days) > 1)
 
-        if not 1 <= int(x) <= 12:
-            raise argparse.ArgumentTypeError(
-                f"The day must be a number within the range [1, 12]. Got: {x}"
-            )
+    def input_source(self, day: str) -> base.Input:
+        """Gets the input for a day, reading stdin if the input is `-`.
+
+        Args:
+            day: The two-digit day.
+
+        Returns:
+            The input path or the input read from stdin.
+        """
+        if self.input == "-":
+            return sys.stdin.buffer.read()
+
+        return self.input_path(day)
+
+    def input_name(self, day: str) -> str:
+        """Gets the name of the input for a day, `-` for stdin.
+
+        Args:
+            day: The two-digit day.
+
+        Returns:
+            The input name.
+        """
+        return "-" if self.input == "-" else str(self.input_path(day))
+
+
+def parse_args(argv: Sequence[str] | None = None) -> Args:
+    """Parses the CLI args.
+
+    Args:
+        argv: The CLI args. If not provided, `sys.argv` is used.
+
+    Retruns:
+        The parsed args.
+    """
 
-        return f"{x:0>2}"
+    from . import limits
 
     parser = argparse.ArgumentParser(description="Advent of code 2025 solver.")
 
     _ = parser.add_argument(
-        "day",
-        type=day,
-        help="The day to run the solver for.",
+        "days",
+        nargs="?",
+        type=parse_days,
+        help=(
+            "The days to run the solver for. "
+            "Either `all` or a comma separated list of days and ranges, e.g. 1,4,8-10."
+        ),
     )
     _ = parser.add_argument(
         "--input",
         "-i",
+        nargs="+",
+        help=(
+            "Path to the input file. Any `{day}` is replaced with the two-digit day. "
+            "Defaults to input.txt for a single day and inputs/day_{day}.txt "
+            "otherwise. "
+            "Use - to read a single day's input from stdin. "
+            "A single day can be solved for multiple inputs in parallel."
+        ),
+    )
+    _ = parser.add_argument(
+        "--executor",
+        choices=EXECUTORS,
+        default="process",
+        help="The executor used to solve multiple days or inputs in parallel.",
+    )
+    _ = parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="The maximum number of workers. Defaults to the executor's default.",
+    )
+
+    _ = parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="text",
+        help=(
+            "The output format. json and ndjson record the answer, input hash, "
+            "wall and CPU time and peak memory of each part, see "
+            "advent_of_code_2025.output."
+        ),
+    )
+
+    cache_group = parser.add_mutually_exclusive_group()
+    _ = cache_group.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache precomputed structures on disk, e.g. day 8's edges.",
+    )
+    _ = cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the disk cache, even if enabled through the environment.",
+    )
+    _ = parser.add_argument(
+        "--cache-dir",
         type=pathlib.Path,
-        help="Path to the input file.",
-        default="input.txt",
+        help=(
+            "The disk cache directory. Implies --cache. "
+            "Defaults to ~/.cache/advent_of_code_2025/arrays."
+        ),
+    )
+    _ = parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Remove the structures in the disk cache before solving.",
+    )
+
+    result_cache_group = parser.add_mutually_exclusive_group()
+    _ = result_cache_group.add_argument(
+        "--result-cache",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help=(
+            "Cache the answers, keyed by the input and the solver's code. "
+            "Defaults to ~/.cache/advent_of_code_2025/results.sqlite3."
+        ),
+    )
+    _ = result_cache_group.add_argument(
+        "--no-result-cache",
+        action="store_true",
+        help="Bypass the answer cache, even if enabled through the environment.",
+    )
+    _ = parser.add_argument(
+        "--clear-result-cache",
+        action="store_true",
+        help="Remove every cached answer before solving.",
+    )
+
+    _ = parser.add_argument(
+        "--profile",
+        choices=PROFILERS,
+        help=(
+            "Profile the parse and each part separately, solving the days serially. "
+            "The reports are printed to stderr unless --profile-output is provided."
+        ),
+    )
+    _ = parser.add_argument(
+        "--profile-output",
+        type=pathlib.Path,
+        help=(
+            "The directory to save the profiles to, as .pstats for cprofile, "
+            "collapsed stacks for sample and snapshots for tracemalloc."
+        ),
+    )
+    _ = parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=1.0,
+        help="The time between samples in ms of the sampling profiler.",
+    )
+    _ = parser.add_argument(
+        "--remote",
+        nargs="?",
+        const="",
+        metavar="SOCKET",
+        help=(
+            "Solve through a daemon started by `solver serve`. "
+            "Defaults to the daemon's default socket."
+        ),
+    )
+    _ = parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help=(
+            "Report the import cost of each module needed to solve the days, "
+            "defaulting to all days, instead of solving them."
+        ),
+    )
+
+    _ = parser.add_argument(
+        "--time-limit",
+        action="append",
+        type=limits.parse_time_limit,
+        default=[],
+        metavar="[DAY[.PART]=]SECONDS",
+        help=(
+            "Abort the parse or a part once it runs for longer than the limit. "
+            "Repeat to limit a day or part, e.g. --time-limit 5 --time-limit 11.1=30. "
+            "Each input is solved in its own supervised process."
+        ),
+    )
+    _ = parser.add_argument(
+        "--memory-limit",
+        action="append",
+        type=limits.parse_memory_limit,
+        default=[],
+        metavar="[DAY[.PART]=]SIZE",
+        help=(
+            "Abort the parse or a part once the solving process's address space "
+            "exceeds the limit, e.g. 512M. Repeat to limit a day or part."
+        ),
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.days is None and not args.startup_report:
+        parser.error("the following arguments are required: days")
+
+    days = cast("list[str] | None", args.days) or list(DAYS)
+    inputs = cast("list[str] | None", args.input) or []
+    if len(inputs) > 1 and (len(days) > 1 or args.remote is not None):
+        parser.error("multiple inputs require a single day solved locally")
+
+    if "-" in inputs and (len(days) > 1 or len(inputs) > 1 or args.remote is not None):
+        parser.error(
+            "reading the input from stdin requires a single day solved locally"
+        )
+
+    if args.format != "text" and (args.profile or args.remote is not None):
+        parser.error("--format requires solving locally without profiling")
+
+    time_limits = cast("list[tuple[limits.Key, float]]", args.time_limit)
+    memory_limits = cast("list[tuple[limits.Key, int]]", args.memory_limit)
+    if (time_limits or memory_limits) and (args.profile or args.remote is not None):
+        parser.error("the limits require solving locally without profiling")
+
+    # The limits solve each input in a supervised process instead
+    unsupported = [day for day in days if day in INTERPRETER_UNSUPPORTED_DAYS]
+    if (
+        args.executor == "interpreter"
+        and unsupported
+        and not (time_limits or memory_limits)
+    ):
+        parser.error(
+            "the interpreter executor cannot solve the days using numpy or "
+            f"scipy: {', '.join(day.lstrip('0') for day in unsupported)}"
+        )
+
+    remote: pathlib.Path | None = None
+    if args.remote is not None:
+        from . import server
+
+        remote = pathlib.Path(args.remote) if args.remote else server.default_socket()
+
     return Args(
-        day=cast("str", args.day),
-        input=cast("pathlib.Path", args.input),
+        days=days,
+        input=inputs[0] if len(inputs) == 1 else None,
+        inputs=inputs if len(inputs) > 1 else [],
+        executor=cast("str", args.executor),
+        jobs=cast("int | None", args.jobs),
+        format=cast("str", args.format),
+        cache=cast("bool", args.cache),
+        cache_dir=cast("pathlib.Path | None", args.cache_dir),
+        no_cache=cast("bool", args.no_cache),
+        clear_cache=cast("bool", args.clear_cache),
+        result_cache=cast("str | None", args.result_cache),
+        no_result_cache=cast("bool", args.no_result_cache),
+        clear_result_cache=cast("bool", args.clear_result_cache),
+        profile=cast("str | None", args.profile),
+        profile_output=cast("pathlib.Path | None", args.profile_output),
+        profile_interval=cast("float", args.profile_interval) / 1e3,
+        startup_report=cast("bool", args.startup_report),
+        remote=remote,
+        limits=limits.Limits(dict(time_limits), dict(memory_limits))
+        if time_limits or memory_limits
+        else None,
     )
 
 
@@ -83,6 +416,267 @@ def get_solver(day: str) -> type[base.Solver]:
     return cast("type[base.Solver]", getattr(module, "Solver"))
 
 
-def main() -> None:
-    args = parse_args()
-    _ = get_solver(args.day)(args.input)
+def configure_disk_cache(args: Args) -> None:
+    """Configures the disk cache for this process and its workers.
+
+    Args:
+        args: The parsed CLI args.
+    """
+    if not (args.cache or args.cache_dir or args.no_cache or args.clear_cache):
+        return
+
+    from . import disk_cache
+
+    if args.clear_cache:
+        disk_cache.clear(args.cache_dir)
+
+    if args.no_cache:
+        disk_cache.disable()
+    elif args.cache or args.cache_dir:
+        disk_cache.enable(args.cache_dir)
+
+
+def configure_result_cache(args: Args) -> None:
+    """Configures the answer cache for this process and its workers.
+
+    Args:
+        args: The parsed CLI args.
+    """
+    if not (
+        args.result_cache is not None or args.no_result_cache or args.clear_result_cache
+    ):
+        return
+
+    from . import result_cache
+
+    path = pathlib.Path(args.result_cache) if args.result_cache else None
+    if args.clear_result_cache:
+        result_cache.clear(path)
+
+    if args.no_result_cache:
+        result_cache.disable()
+    elif args.result_cache is not None:
+        result_cache.enable(path)
+
+
+def profile(args: Args) -> None:
+    """Solves the days serially, profiling the parse and each part separately.
+
+    The answer cache is disabled, as cached answers would skip the profiled
+    work.
+
+    Args:
+        args: The parsed CLI args.
+    """
+    from . import profiler, result_cache
+
+    assert args.profile is not None
+    with result_cache.disabled():
+        for i, day in enumerate(args.days):
+            solver = get_solver(day)()
+            source = args.input_source(day)
+
+            with profiler.profiling(
+                args.profile,
+                f"day_{day}_parse",
+                args.profile_output,
+                args.profile_interval,
+            ):
+                solver.parse(source)
+
+            results: list[int | str] = []
+            for part in (solver.part_1, solver.part_2):
+                with profiler.profiling(
+                    args.profile,
+                    f"day_{day}_{part.__name__}",
+                    args.profile_output,
+                    args.profile_interval,
+                ):
+                    results.append(part(source))
+
+            if i:
+                print()
+
+            base.report(day.lstrip("0"), *results)
+
+
+def solve_many(args: Args) -> None:
+    """Solves a day for each input, printing each report as it is solved.
+
+    Args:
+        args: The parsed CLI args.
+    """
+    from . import runner
+
+    (day,) = args.days
+    failed = False
+    outcomes = runner.solve_many(
+        get_solver(day),
+        [pathlib.Path(path) for path in args.inputs],
+        args.executor,
+        args.jobs,
+        limits=args.limits,
+    )
+    for i, (index, outcome) in enumerate(outcomes):
+        if i:
+            print()
+
+        print(f"Input: {args.inputs[index]}")
+        if isinstance(outcome, Exception):
+            failed = True
+            base.report(day.lstrip("0"), outcome, outcome)
+        else:
+            base.report(outcome.day, outcome.part_1, outcome.part_2)
+
+    if failed:
+        sys.exit(1)
+
+
+def solve_days(args: Args) -> None:
+    """Solves each day in a supervised process, enforcing the limits.
+
+    Args:
+        args: The parsed CLI args.
+    """
+    from . import runner
+
+    outcomes = dict(
+        runner.solve_days(
+            {day: args.input_source(day) for day in args.days},
+            args.executor,
+            args.jobs,
+            limits=args.limits,
+        )
+    )
+    for i, day in enumerate(args.days):
+        if i:
+            print()
+
+        outcome = outcomes[day]
+        if isinstance(outcome, Exception):
+            base.report(day.lstrip("0"), outcome, outcome)
+        else:
+            base.report(outcome.day, outcome.part_1, outcome.part_2)
+
+    if any(isinstance(outcome, Exception) for outcome in outcomes.values()):
+        sys.exit(1)
+
+
+def write_records(args: Args) -> None:
+    """Solves the days or inputs, writing the records of each phase.
+
+    The peak memory of each phase is traced. See `output`.
+
+    Args:
+        args: The parsed CLI args.
+    """
+    from . import output, runner
+
+    failed = False
+
+    def make_records() -> Generator[output.Record]:
+        nonlocal failed
+
+        outcomes: Iterable[tuple[str, str, base.Results | Exception, base.Input]]
+        if args.inputs:
+            (day,) = args.days
+            sources = [pathlib.Path(path) for path in args.inputs]
+            outcomes = (
+                (day, args.inputs[index], outcome, sources[index])
+                for index, outcome in runner.solve_many(
+                    get_solver(day),
+                    sources,
+                    args.executor,
+                    args.jobs,
+                    True,
+                    args.limits,
+                )
+            )
+        elif len(args.days) == 1 and args.limits is None:
+            day = args.days[0]
+            source = args.input_source(day)
+            try:
+                outcome = get_solver(day)().solve(
+                    source, trace_memory=True, verbose=False
+                )
+            except base.SOLVER_ERRORS as e:
+                outcome = e
+
+            outcomes = [(day, args.input_name(day), outcome, source)]
+        else:
+            sources = {day: base.load(args.input_source(day)) for day in args.days}
+            outcomes = (
+                (day, args.input_name(day), outcome, sources[day])
+                for day, outcome in runner.solve_days(
+                    sources, args.executor, args.jobs, True, args.limits
+                )
+            )
+
+        for day, name, outcome, source in outcomes:
+            failed = failed or isinstance(outcome, Exception)
+            yield from output.make_records(day, outcome, name, source)
+
+    output.write(make_records(), args.format)
+    if failed:
+        sys.exit(1)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        module = importlib.import_module(COMMANDS[argv[0]], __name__)
+        module.main(argv[1:])
+        return
+
+    args = parse_args(argv)
+    if args.startup_report:
+        from . import startup
+
+        startup.report(startup.measure(args.days))
+        return
+
+    configure_disk_cache(args)
+    configure_result_cache(args)
+    if args.profile:
+        profile(args)
+        return
+
+    if args.format != "text":
+        write_records(args)
+        return
+
+    if args.inputs:
+        solve_many(args)
+        return
+
+    if args.limits is not None:
+        solve_days(args)
+        return
+
+    if len(args.days) == 1 and args.remote is None:
+        day = args.days[0]
+        _ = get_solver(day)(args.input_source(day))
+        return
+
+    inputs = {day: args.input_path(day) for day in args.days}
+    if args.remote is not None:
+        from . import server
+
+        outcomes = server.request(args.remote, inputs)
+    else:
+        from . import runner
+
+        outcomes = runner.run(inputs, executor=args.executor, jobs=args.jobs)
+
+    for i, (day, (part_1, part_2)) in enumerate(outcomes.items()):
+        if i:
+            print()
+
+        base.report(day.lstrip("0"), part_1, part_2)
+
+    if any(
+        isinstance(outcome, Exception)
+        for day_outcomes in outcomes.values()
+        for outcome in day_outcomes
+    ):
+        sys.exit(1)
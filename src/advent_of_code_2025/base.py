@@ -1,70 +1,751 @@
 """This module contains the base solver."""
 
 import abc
-import inspect
-from typing import TYPE_CHECKING
+import collections
+import contextlib
+import functools
+import io
+import pathlib
+import sys
+import threading
+import time
+from typing import IO, TYPE_CHECKING, Concatenate, NamedTuple, Self, cast
 
 if TYPE_CHECKING:
-    import pathlib
+    from collections.abc import Callable, Generator, Hashable, Iterable
+    import mmap
+    import re
+    from types import TracebackType
+
+    Input = pathlib.Path | str | bytes | bytearray | memoryview | IO[str] | IO[bytes]
+
+# The errors of solving a bad input, e.g. a missing file or a malformed line,
+# which are reported as the outcome. Other errors are bugs and propagate.
+SOLVER_ERRORS: tuple[type[Exception], ...] = (
+    ArithmeticError,
+    LookupError,
+    MemoryError,
+    OSError,
+    RuntimeError,
+    TypeError,
+    ValueError,
+)
+
+
+def load(source: Input) -> pathlib.Path | bytes:
+    """Loads an input into a form that can be read repeatedly.
+
+    Files are left on disk. Text is encoded and streams are read to the end,
+    so a stream can only be loaded once.
+
+    Args:
+        source: The input. Either a filepath, the text or bytes of the input,
+            or a text or binary file-like object.
+
+    Returns:
+        The filepath or the bytes of the input.
+    """
+    match source:
+        case pathlib.Path():
+            return source
+        case bytes():
+            return source
+        case str():
+            return source.encode(sys.getdefaultencoding())
+        case bytearray() | memoryview():
+            return bytes(source)
+        case _:
+            data = source.read()
+            if isinstance(data, str):
+                return data.encode(sys.getdefaultencoding())
+
+            return data
+
+
+def open_input(source: Input) -> IO[str]:
+    """Opens an input as text.
+
+    Args:
+        source: The input. See `load`.
+
+    Returns:
+        The opened input, which must be closed.
+    """
+    source = load(source)
+    if isinstance(source, bytes):
+        return io.StringIO(source.decode(sys.getdefaultencoding()))
+
+    return open(source, encoding=sys.getdefaultencoding())
+
+
+def input_digest(source: Input) -> str:
+    """Hashes the contents of an input.
+
+    Args:
+        source: The input. See `load`.
+
+    Returns:
+        The hex digest of the input's contents.
+    """
+    import hashlib
+
+    source = load(source)
+    if isinstance(source, bytes):
+        return hashlib.blake2b(source).hexdigest()
+
+    with open(source, "rb") as file:
+        return hashlib.file_digest(file, "blake2b").hexdigest()
+
+
+class MappedInput:
+    """Read-only memory map of an input.
+
+    The iterators yield `memoryview` slices of the map, so no bytes are copied
+    or decoded. The slices can be compared against `bytes` and passed to `int`
+    directly, e.g. `int(line[1:])`. Inputs that are not files are viewed in
+    memory instead.
+
+    Must be used as a context manager. Slices still referenced on exit keep
+    the map open until they are garbage collected.
+    """
+
+    def __init__(self, source: Input) -> None:
+        """
+        Read-only memory map of an input.
+
+        Args:
+            source: The input. See `load`.
+        """
+        self.source: pathlib.Path | bytes = load(source)
+        self._map: mmap.mmap | None = None
+        self._buffer: mmap.mmap | bytes = b""
+        self._data: memoryview = memoryview(b"")
+
+    def __enter__(self) -> Self:
+        import mmap
+
+        if isinstance(self.source, bytes):
+            self._buffer = self.source
+            self._data = memoryview(self.source)
+            return self
+
+        with open(self.source, "rb") as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty files cannot be mapped
+                return self
+
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._map.madvise(mmap.MADV_SEQUENTIAL)
+
+        self._buffer = self._map
+        self._data = memoryview(self._map)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._data.release()
+        self._data = memoryview(b"")
+        self._buffer = b""
+        if self._map is not None:
+            with contextlib.suppress(BufferError):  # A slice is still referenced
+                self._map.close()
+
+            self._map = None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def data(self) -> memoryview:
+        """The contents of the input."""
+        return self._data
+
+    def lines(self, start: int = 0, end: int | None = None) -> Generator[memoryview]:
+        """Iterates the lines within the byte range.
+
+        Args:
+            start: The start of the byte range. Must be the start of a line.
+            end: The end of the byte range, exclusive. If not provided,
+                the end of the input.
+
+        Yields:
+            Each line without its line ending.
+        """
+        end = len(self) if end is None else end
+        while start < end:
+            newline = self._buffer.find(b"\n", start, end)
+            stop = end if newline == -1 else newline
+            if stop > start and self._data[stop - 1] == ord("\r"):
+                yield self._data[start : stop - 1]
+            else:
+                yield self._data[start:stop]
+
+            start = stop + 1
+
+    def fields(
+        self, separators: bytes = b",", start: int = 0, end: int | None = None
+    ) -> Generator[memoryview]:
+        """Iterates the fields within the byte range.
+
+        Fields are separated by any of the separators or whitespace. Empty
+        fields are skipped.
+
+        Args:
+            separators: The bytes that separate fields.
+            start: The start of the byte range.
+            end: The end of the byte range, exclusive. If not provided,
+                the end of the input.
+
+        Yields:
+            Each field.
+        """
+        pattern = _field_pattern(separators)
+        for match in pattern.finditer(
+            self._buffer, start, len(self) if end is None else end
+        ):
+            yield self._data[match.start() : match.end()]
+
+    def ranges(self, count: int) -> Generator[tuple[int, int]]:
+        """Splits the input into byte ranges of whole lines.
+
+        Args:
+            count: The number of ranges to split into. Fewer ranges are
+                produced if there are not enough lines.
+
+        Yields:
+            The start and exclusive end of each non-empty range.
+        """
+        start = 0
+        for i in range(1, count + 1):
+            end = len(self) * i // count
+            if i < count and end > start:
+                newline = self._buffer.find(b"\n", end - 1, len(self))
+                end = len(self) if newline == -1 else newline + 1
+
+            if end > start:
+                yield start, end
+                start = end
+
+
+@functools.cache
+def _field_pattern(separators: bytes) -> re.Pattern[bytes]:
+    """Compiles the pattern matching the fields between the separators.
+
+    Args:
+        separators: The bytes that separate fields.
+
+    Returns:
+        The compiled pattern.
+    """
+    import re
+
+    return re.compile(rb"[^\s" + re.escape(separators) + rb"]+")
+
+
+class InputCache:
+    """Least recently used cache of parsed inputs."""
+
+    def __init__(self, maxsize: int = 8) -> None:
+        """
+        Least recently used cache of parsed inputs.
+
+        Args:
+            maxsize: The maximum number of parsed inputs to keep.
+        """
+        self.maxsize: int = maxsize
+        self._entries: collections.OrderedDict[Hashable, object] = (
+            collections.OrderedDict()
+        )
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get[R](self, key: Hashable, parse: Callable[[], R]) -> R:
+        """Gets a parsed input, parsing it if it is not cached.
+
+        Args:
+            key: The cache key of the parsed input.
+            parse: Parses the input on a cache miss.
+
+        Returns:
+            The parsed input.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return cast("R", self._entries[key])
+
+        result = parse()
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                _ = self._entries.popitem(last=False)
+
+        return result
+
+    def clear(self) -> None:
+        """Removes all parsed inputs."""
+        with self._lock:
+            self._entries.clear()
+
+
+def parser[S: Solver, **P, R](
+    func: Callable[Concatenate[S, Input, P], R],
+) -> Callable[Concatenate[S, Input, P], R]:
+    """Parses an input once per content, sharing the result between parts.
+
+    The result is cached in `Solver.input_cache` keyed by the parser, the
+    content hash of the input and the remaining arguments. As the result is
+    shared, the parser must return an immutable result and callers must copy
+    it before making changes.
+
+    Args:
+        func: The parser to cache.
+
+    Returns:
+        The cached parser.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self: S, filepath: Input, *args: P.args, **kwargs: P.kwargs) -> R:
+        filepath = load(filepath)
+        key = (
+            func.__module__,
+            func.__qualname__,
+            input_digest(filepath),
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        return Solver.input_cache.get(
+            key, lambda: func(self, filepath, *args, **kwargs)
+        )
+
+    return wrapper
+
+
+def report(day: str, part_1: object, part_2: object) -> None:
+    """Prints the results of a day.
+
+    Args:
+        day: The day that was solved.
+        part_1: The outcome of part 1.
+        part_2: The outcome of part 2.
+    """
+    print(f"Day {day}")
+    print("Part 1:", part_1)
+    print("===========================")
+    print("Part 2:", part_2)
+
+
+# Not dataclasses, as importing dataclasses slows down the CLI's startup
+class Phase(NamedTuple):
+    """The metrics of a phase of solving."""
+
+    name: str
+    wall: float
+    cpu: float
+    peak: int | None
+    counters: dict[str, int]
+
+
+class Results(NamedTuple):
+    """The answers of a day and the metrics of each phase run to get them."""
+
+    day: str
+    part_1: int | str
+    part_2: int | str
+    phases: list[Phase]
+    counters: dict[str, int]
+
+
+class _Recording(threading.local):
+    """The phases recorded by a thread."""
+
+    def __init__(self) -> None:
+        self.phases: list[Phase] | None = None
+        self.child_peaks: list[int] = []
+        self.names: list[str] = []
+        self.listener: Callable[[tuple[str, ...]], None] | None = None
+        self.counters: list[collections.Counter[str]] = []
+
+
+_recording = _Recording()
+
+
+@contextlib.contextmanager
+def recording(
+    trace_memory: bool = False,
+    listener: Callable[[tuple[str, ...]], None] | None = None,
+) -> Generator[list[Phase]]:
+    """Records the phases run by this thread within the context.
+
+    Phases are only measured while recording, so marking a phase is free
+    otherwise.
+
+    Args:
+        trace_memory: Whether to trace memory allocations to measure the peak
+            memory of each phase. Tracing slows down allocations. The peak is
+            also measured if tracemalloc is already tracing.
+        listener: Called with the names of the running phases, outermost
+            first, whenever a phase starts or finishes. A phase that raises
+            does not notify, so the listener last sees the phase that raised.
+            If not provided, the listener of the enclosing recording is kept.
+
+    Yields:
+        The recorded phases in the order they finished, which grows as the
+        phases finish.
+    """
+    previous = (
+        _recording.phases,
+        _recording.child_peaks,
+        _recording.names,
+        _recording.listener,
+    )
+    _recording.phases, _recording.child_peaks, _recording.names = [], [], []
+    _recording.listener = listener or _recording.listener
+
+    import tracemalloc
+
+    start_tracing = trace_memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+
+    try:
+        yield _recording.phases
+    finally:
+        if start_tracing:
+            tracemalloc.stop()
+
+        (
+            _recording.phases,
+            _recording.child_peaks,
+            _recording.names,
+            _recording.listener,
+        ) = previous
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Adds to a counter of the work done, e.g. the states a search expanded.
+
+    The counts are only kept while counting, e.g. within a recorded phase,
+    so counting is free otherwise. Hot loops should tally locally and count
+    the total once, rather than count every iteration.
+
+    Args:
+        name: The name of the counter, e.g. "states_expanded".
+        amount: The amount to add.
+    """
+    counters = _recording.counters
+    if counters:
+        counters[-1][name] += amount
+
+
+def counting_enabled() -> bool:
+    """Checks whether this thread is counting. See `count`.
+
+    Returns:
+        True if the counts are kept.
+    """
+    return bool(_recording.counters)
+
+
+@contextlib.contextmanager
+def counting() -> Generator[collections.Counter[str]]:
+    """Counts the work done by this thread within the context. See `count`.
+
+    The counts are also added to the enclosing counts, if any.
+
+    Yields:
+        The counters, which grow as the work is counted.
+    """
+    counters = _recording.counters
+    counter: collections.Counter[str] = collections.Counter()
+    counters.append(counter)
+    try:
+        yield counter
+    finally:
+        _ = counters.pop()
+        if counters:
+            counters[-1].update(counter)
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Generator[None]:
+    """Measures the code run within the context as a phase.
+
+    The wall time, the CPU time of this thread and, if tracemalloc is
+    tracing, the peak memory allocated above the memory in use on entry are
+    measured, along with the work counted within the phase. Phases may be
+    nested, in which case the outer phase includes the inner phase.
+
+    Args:
+        name: The name of the phase.
+
+    Yields:
+        Nothing, the phase runs within the context.
+    """
+    phases = _recording.phases
+    if phases is None:
+        yield
+        return
+
+    import tracemalloc
+
+    tracing = tracemalloc.is_tracing()
+    child_peaks = _recording.child_peaks
+    current = 0
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        if child_peaks:
+            child_peaks[-1] = max(child_peaks[-1], peak)
+
+        tracemalloc.reset_peak()
+        child_peaks.append(current)
+
+    names, listener = _recording.names, _recording.listener
+    names.append(name)
+    if listener:
+        listener(tuple(names))
+
+    cpu = time.thread_time()
+    wall = time.perf_counter()
+    try:
+        with counting() as counters:
+            yield
+    finally:
+        wall = time.perf_counter() - wall
+        cpu = time.thread_time() - cpu
+        peak = None
+        if tracing:
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, child_peaks.pop())
+            if child_peaks:
+                child_peaks[-1] = max(child_peaks[-1], peak)
+
+            peak -= current
+
+        phases.append(Phase(name, wall, cpu, peak, dict(counters)))
+        _ = names.pop()
+
+    if listener:
+        listener(tuple(names))
+
+
+def _parsing[S: Solver](func: Callable[[S, Input], None]) -> Callable[[S, Input], None]:
+    """Loads the input before parsing it. See `load`.
+
+    The parse is skipped if the answers of both parts are cached, see
+    `result_cache`.
+
+    Args:
+        func: The solver's parse.
+
+    Returns:
+        The parse taking any input.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self: S, filepath: Input) -> None:
+        from . import result_cache
+
+        filepath = load(filepath)
+        if not result_cache.has_answers(self, filepath):
+            func(self, filepath)
+
+    return wrapper
+
+
+def _answering[S: Solver, **P](
+    part: int, func: Callable[Concatenate[S, Input, P], int | str]
+) -> Callable[Concatenate[S, Input, P], int | str]:
+    """Loads the input before solving a part. See `load`.
+
+    The answer is served from the cache if it is enabled, see `result_cache`.
+
+    Args:
+        part: The part.
+        func: The solver's part.
+
+    Returns:
+        The part taking any input.
+    """
+
+    @functools.wraps(func)
+    def wrapper(
+        self: S, filepath: Input, *args: P.args, **kwargs: P.kwargs
+    ) -> int | str:
+        from . import result_cache
+
+        filepath = load(filepath)
+        return result_cache.answer(
+            self,
+            part,
+            filepath,
+            lambda: func(self, filepath, *args, **kwargs),
+            args,
+            kwargs,
+        )
+
+    return wrapper
 
 
 class Solver(abc.ABC):
     """Base solver."""
 
+    input_cache: InputCache = InputCache()
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Loads the input given to the parse and each part. See `load`.
+
+        Streams are read once, so the solver's parsers can all read the input.
+        The answers are cached if enabled, see `result_cache`.
+        """
+        super().__init_subclass__(**kwargs)
+        if "parse" in cls.__dict__:
+            cls.parse = _parsing(cls.__dict__["parse"])
+
+        for part in (1, 2):
+            if f"part_{part}" in cls.__dict__:
+                setattr(
+                    cls, f"part_{part}", _answering(part, cls.__dict__[f"part_{part}"])
+                )
+
     @abc.abstractmethod
-    def part_1(self, filepath: pathlib.Path) -> int | str:
+    def part_1(self, filepath: Input) -> int | str:
         """
         Solves part 1.
 
         Args:
-            filepath: The path to the data file.
+            filepath: The input. Either a filepath, the text or bytes of the
+                input, or a text or binary file-like object.
 
         Returns:
             The solution to part 1.
         """
 
     @abc.abstractmethod
-    def part_2(self, filepath: pathlib.Path) -> int | str:
+    def part_2(self, filepath: Input) -> int | str:
         """
         Solves part 2.
 
         Args:
-            filepath: The path to the data file.
+            filepath: The input. See `part_1`.
 
         Returns:
             The solution to part 2.
         """
 
+    def parse(self, filepath: Input) -> None:
+        """
+        Parses the input ahead of solving.
+
+        Solvers that share a parsed input between parts override this to
+        warm `input_cache`, so the parse can be timed apart from the parts.
+
+        Args:
+            filepath: The input. See `part_1`.
+        """
+
     @property
     def day(self) -> str:
         """The day of the solver."""
-        solver_module = inspect.getmodule(self)
+        solver_module = sys.modules.get(type(self).__module__)
         if solver_module and solver_module.__package__:
             return solver_module.__package__[-2:].lstrip("0")
 
         raise ValueError("Unable to extract the day.")
 
-    def solve(self, file: pathlib.Path) -> None:
+    @staticmethod
+    def phase(name: str) -> contextlib.AbstractContextManager[None]:
+        """Measures the code run within the context as a phase. See `phase`.
+
+        Args:
+            name: The name of the phase, e.g. "build".
+
+        Returns:
+            The context manager measuring the phase.
+        """
+        return phase(name)
+
+    def solve(
+        self, file: Input, trace_memory: bool = False, verbose: bool = True
+    ) -> Results:
         """
         Run the solver.
 
+        The parse and each part are measured as phases, along with any
+        phases marked by the solver and the work counted by the solver.
+
+        Args:
+            file: The input. See `part_1`.
+            trace_memory: Whether to measure the peak memory of each phase.
+            verbose: Whether to print the report.
+
+        Returns:
+            The answers and the metrics of each phase.
+        """
+        file = load(file)
+        with recording(trace_memory) as phases, counting() as counters:
+            with phase("parse"):
+                self.parse(file)
+
+            with phase("part_1"):
+                part_1 = self.part_1(file)
+
+            with phase("part_2"):
+                part_2 = self.part_2(file)
+
+        if verbose:
+            report(self.day, part_1, part_2)
+
+        return Results(self.day, part_1, part_2, phases, dict(counters))
+
+    def solve_many(
+        self,
+        files: Iterable[Input],
+        jobs: int | None = None,
+        executor: str = "process",
+        trace_memory: bool = False,
+    ) -> Generator[tuple[int, Results | Exception]]:
+        """
+        Run the solver on many inputs, spreading the inputs across workers.
+
+        Each worker imports the solver once and reuses its caches between
+        inputs. The reports are not printed.
+
         Args:
-            file: The path to the data file.
+            files: The inputs. See `part_1`. Streams are read upfront.
+            jobs: The maximum number of workers. If not provided, the
+                executor's default is used.
+            executor: The executor type. One of
+                `advent_of_code_2025.EXECUTORS`.
+            trace_memory: Whether to measure the peak memory of each phase.
+
+        Yields:
+            The index of each input and its outcome, as soon as it is solved.
+            An outcome is either the results or the exception raised while
+            solving the input.
         """
-        print(f"Day {self.day}")
-        print("Part 1:", self.part_1(file))
-        print("===========================")
-        print("Part 2:", self.part_2(file))
+        from . import runner
+
+        yield from runner.solve_many(type(self), files, executor, jobs, trace_memory)
 
-    def __init__(self, file: pathlib.Path | None = None) -> None:
+    def __init__(self, file: Input | None = None) -> None:
         """
         Base solver.
 
         Args:
-            file: The path to the data file. If not provided, do nothing.
-                If a file is provided, immediately solve.
+            file: The input. See `part_1`. If not provided, do nothing.
+                If an input is provided, immediately solve.
         """
-        if not file:
+        if file is None:
             return
 
         self.solve(file)
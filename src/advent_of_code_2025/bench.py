@@ -0,0 +1,329 @@
+"""This module contains the benchmark harness.
+
+Run `solver bench <DAYS>` to time the parse and each part of the given days.
+"""
+
+import argparse
+import dataclasses
+import json
+import math
+import pathlib
+import platform
+import statistics
+import sys
+import time
+from typing import TYPE_CHECKING, cast
+
+from . import base, disk_cache, get_solver, input_path, parse_days, result_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+PHASES: tuple[str, ...] = ("parse", "part_1", "part_2")
+
+
+@dataclasses.dataclass
+class Args:
+    days: list[str]
+    input: str | None
+    warmup: int
+    repeat: int
+    output: pathlib.Path | None
+    compare: pathlib.Path | None
+    threshold: float
+    min_difference: float
+
+
+@dataclasses.dataclass
+class Stats:
+    """Summary of the timings of a phase in seconds."""
+
+    min: float
+    median: float
+    p95: float
+    samples: list[float]
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> Stats:
+        """Summarises the timings.
+
+        Args:
+            samples: The timings. Must not be empty.
+
+        Returns:
+            The summary of the timings.
+        """
+        ordered = sorted(samples)
+        position = 0.95 * (len(ordered) - 1)
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        p95 = ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+        return cls(
+            min=ordered[0],
+            median=statistics.median(ordered),
+            p95=p95,
+            samples=samples,
+        )
+
+
+@dataclasses.dataclass
+class Regression:
+    """A phase that got slower than its baseline."""
+
+    day: str
+    phase: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """The relative change of the median timing."""
+        if not self.baseline:
+            return math.inf
+
+        return self.current / self.baseline - 1
+
+
+def parse_args(argv: Sequence[str] | None = None) -> Args:
+    """Parses the CLI args.
+
+    Args:
+        argv: The CLI args. If not provided, `sys.argv` is used.
+
+    Returns:
+        The parsed args.
+    """
+    parser = argparse.ArgumentParser(
+        prog="solver bench", description="Advent of code 2025 benchmark."
+    )
+
+    _ = parser.add_argument(
+        "days",
+        type=parse_days,
+        help=(
+            "The days to benchmark. "
+            "Either `all` or a comma separated list of days and ranges, e.g. 1,4,8-10."
+        ),
+    )
+    _ = parser.add_argument(
+        "--input",
+        "-i",
+        help=(
+            "Path to the input file. Any `{day}` is replaced with the two-digit day. "
+            "Defaults to input.txt for a single day and inputs/day_{day}.txt otherwise."
+        ),
+    )
+    _ = parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="The number of untimed runs before timing.",
+    )
+    _ = parser.add_argument(
+        "--repeat",
+        "-r",
+        type=int,
+        default=5,
+        help="The number of timed runs.",
+    )
+    _ = parser.add_argument(
+        "--output",
+        "-o",
+        type=pathlib.Path,
+        help="Path to write the results to as JSON.",
+    )
+    _ = parser.add_argument(
+        "--compare",
+        type=pathlib.Path,
+        help="Path to the baseline results to compare against.",
+    )
+    _ = parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="The relative slowdown of the median timing that is a regression.",
+    )
+    _ = parser.add_argument(
+        "--min-difference",
+        type=float,
+        default=0.5,
+        help="The smallest slowdown of the median timing in ms that is a regression.",
+    )
+
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    return Args(
+        days=cast("list[str]", args.days),
+        input=cast("str | None", args.input),
+        warmup=cast("int", args.warmup),
+        repeat=cast("int", args.repeat),
+        output=cast("pathlib.Path | None", args.output),
+        compare=cast("pathlib.Path | None", args.compare),
+        threshold=cast("float", args.threshold),
+        min_difference=cast("float", args.min_difference) / 1e3,
+    )
+
+
+def benchmark(
+    day: str, filepath: pathlib.Path, warmup: int = 1, repeat: int = 5
+) -> dict[str, Stats]:
+    """Times the parse and each part of a day.
+
+    The input cache is cleared before every run so that each run parses the
+    input once, in the parse phase.
+
+    Args:
+        day: The two-digit day to benchmark.
+        filepath: The path to the data file.
+        warmup: The number of untimed runs before timing.
+        repeat: The number of timed runs.
+
+    Returns:
+        The phases mapped to the summary of its timings.
+    """
+    solver = get_solver(day)()
+    phases: dict[str, Callable[[pathlib.Path], object]] = {
+        "parse": solver.parse,
+        "part_1": solver.part_1,
+        "part_2": solver.part_2,
+    }
+    samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+
+    for run in range(warmup + repeat):
+        base.Solver.input_cache.clear()
+        for phase, func in phases.items():
+            start = time.perf_counter()
+            _ = func(filepath)
+            elapsed = time.perf_counter() - start
+
+            if run >= warmup:
+                samples[phase].append(elapsed)
+
+    base.Solver.input_cache.clear()
+    return {phase: Stats.from_samples(samples[phase]) for phase in PHASES}
+
+
+def compare(
+    results: dict[str, dict[str, Stats]],
+    baseline: dict[str, dict[str, Stats]],
+    threshold: float,
+    min_difference: float = 0.0,
+) -> list[Regression]:
+    """Finds the phases whose median timing regressed against the baseline.
+
+    Phases missing from the baseline are skipped.
+
+    Args:
+        results: The days mapped to the timings of each phase.
+        baseline: The baseline days mapped to the timings of each phase.
+        threshold: The relative slowdown that is a regression.
+        min_difference: The smallest absolute slowdown in seconds that is a
+            regression. Avoids flagging noise on very fast phases.
+
+    Returns:
+        The regressions.
+    """
+    regressions: list[Regression] = []
+    for day, phases in results.items():
+        for phase, stats in phases.items():
+            if phase not in baseline.get(day, {}):
+                continue
+
+            expected = baseline[day][phase].median
+            if (
+                stats.median > expected * (1 + threshold)
+                and stats.median - expected >= min_difference
+            ):
+                regressions.append(Regression(day, phase, expected, stats.median))
+
+    return regressions
+
+
+def load(filepath: pathlib.Path) -> dict[str, dict[str, Stats]]:
+    """Loads results written by `dump`.
+
+    The summaries are recomputed from the stored timings.
+
+    Args:
+        filepath: The path to the results.
+
+    Returns:
+        The days mapped to the timings of each phase.
+    """
+    with open(filepath, encoding=sys.getdefaultencoding()) as file:
+        data = cast(
+            "dict[str, dict[str, dict[str, dict[str, list[float]]]]]", json.load(file)
+        )
+
+    return {
+        day: {
+            phase: Stats.from_samples(stats["samples"])
+            for phase, stats in phases.items()
+        }
+        for day, phases in data["days"].items()
+    }
+
+
+def dump(results: dict[str, dict[str, Stats]], filepath: pathlib.Path) -> None:
+    """Writes the results as JSON.
+
+    Args:
+        results: The days mapped to the timings of each phase.
+        filepath: The path to write to.
+    """
+    data = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "days": {
+            day: {phase: dataclasses.asdict(stats) for phase, stats in phases.items()}
+            for day, phases in results.items()
+        },
+    }
+    with open(filepath, "w", encoding=sys.getdefaultencoding()) as file:
+        json.dump(data, file, indent=2)
+        _ = file.write("\n")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    baseline = load(args.compare) if args.compare else {}
+
+    results: dict[str, dict[str, Stats]] = {}
+    print(
+        f"{'Day':>3} {'Phase':<6} {'Min (ms)':>10} {'Median (ms)':>12} "
+        f"{'P95 (ms)':>10} {'Change':>8}"
+    )
+    for day in args.days:
+        filepath = input_path(args.input, day, multiple=len(args.days) > 1)
+        # Cached answers and structures would skip the timed work
+        with result_cache.disabled(), disk_cache.disabled():
+            results[day] = benchmark(day, filepath, args.warmup, args.repeat)
+
+        for phase, stats in results[day].items():
+            change = ""
+            if phase in baseline.get(day, {}) and baseline[day][phase].median:
+                change = f"{stats.median / baseline[day][phase].median - 1:+.1%}"
+
+            print(
+                f"{day:>3} {phase:<6} {stats.min * 1e3:>10.3f} "
+                f"{stats.median * 1e3:>12.3f} {stats.p95 * 1e3:>10.3f} {change:>8}"
+            )
+
+    if args.output:
+        dump(results, args.output)
+
+    regressions = compare(results, baseline, args.threshold, args.min_difference)
+    for regression in regressions:
+        print(
+            f"Regression: day {regression.day} {regression.phase} "
+            f"{regression.baseline * 1e3:.3f} ms -> {regression.current * 1e3:.3f} ms "
+            f"({regression.change:+.1%})",
+            file=sys.stderr,
+        )
+
+    if regressions:
+        sys.exit(1)
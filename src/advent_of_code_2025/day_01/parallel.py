@@ -0,0 +1,156 @@
+"""Day 1 chunk-parallel solver.
+
+The dial's position depends on every earlier rotation, but a chunk of
+rotations can be summarised as a function of the position it starts at: the
+net offset of the dial and, for each of the 100 starting positions, the
+number of times the dial ends at and passes 0. Summaries compose in order, so
+the chunks of a large input are summarised in parallel and reduced, see
+`mapreduce.map_reduce`.
+"""
+
+from typing import TYPE_CHECKING, NamedTuple, override
+
+from .. import base, mapreduce
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+POSITIONS: int = 100
+START: int = 50
+
+
+class Summary(NamedTuple):
+    """The effect of a chunk of rotations on each starting position.
+
+    Attributes:
+        offset: The net offset of the dial, modulo the number of positions.
+        zeros: The number of rotations ending at 0 for each starting position.
+        crossings: The number of times the dial points at 0 during the
+            rotations for each starting position.
+    """
+
+    offset: int
+    zeros: tuple[int, ...]
+    crossings: tuple[int, ...]
+
+
+def summarise(lines: Iterable[memoryview]) -> Summary:
+    """Summarises a chunk of rotations.
+
+    This is a module level function so that it can be sent to the workers.
+
+    Each rotation counts for the starting positions that put the dial at 0,
+    or move it past 0, a range of positions that is added to a difference
+    array. So the chunk is read once rather than once per starting position.
+
+    Args:
+        lines: The rotations, e.g. `L68`.
+
+    Returns:
+        The summary.
+    """
+    offset = 0
+    full_rotations = 0
+    zeros = [0] * POSITIONS
+    differences = [0] * (POSITIONS + 1)
+    for line in lines:
+        amount = int(line[1:])
+        full_rotations += amount // POSITIONS
+        amount %= POSITIONS
+        if line[0] == ord("L"):
+            low, high = 1, amount
+            amount = -amount
+        else:
+            low, high = POSITIONS - amount, POSITIONS - 1
+
+        if low <= high:  # The dial passes 0 from positions in [low, high]
+            start = (low - offset) % POSITIONS
+            end = start + high - low + 1
+            differences[start] += 1
+            if end <= POSITIONS:
+                differences[end] -= 1
+            else:  # The range wraps around
+                differences[0] += 1
+                differences[end - POSITIONS] -= 1
+
+        offset = (offset + amount) % POSITIONS
+        zeros[-offset % POSITIONS] += 1
+
+    crossings: list[int] = []
+    total = full_rotations
+    for difference in differences[:POSITIONS]:
+        total += difference
+        crossings.append(total)
+
+    return Summary(offset, tuple(zeros), tuple(crossings))
+
+
+def compose(first: Summary, second: Summary) -> Summary:
+    """Composes the summaries of consecutive chunks.
+
+    Args:
+        first: The summary of the earlier chunk.
+        second: The summary of the following chunk.
+
+    Returns:
+        The summary of both chunks.
+    """
+    return Summary(
+        (first.offset + second.offset) % POSITIONS,
+        tuple(
+            count + second.zeros[(start + first.offset) % POSITIONS]
+            for start, count in enumerate(first.zeros)
+        ),
+        tuple(
+            count + second.crossings[(start + first.offset) % POSITIONS]
+            for start, count in enumerate(first.crossings)
+        ),
+    )
+
+
+def summarise_input(
+    source: base.Input,
+    jobs: int | None = None,
+    executor: str | None = None,
+    chunk_size: int = mapreduce.CHUNK_SIZE,
+) -> Summary:
+    """Summarises the rotations of an input in parallel.
+
+    Args:
+        source: The input. See `base.load`.
+        jobs: The maximum number of workers. See `mapreduce.map_reduce`.
+        executor: The executor type. See `mapreduce.map_reduce`.
+        chunk_size: The minimum number of bytes per chunk.
+
+    Returns:
+        The summary.
+    """
+    return mapreduce.map_reduce(source, summarise, compose, jobs, executor, chunk_size)
+
+
+class Solver(base.Solver):
+    """Day 1 chunk-parallel solver."""
+
+    @base.parser
+    def _get_summary(self, filepath: base.Input) -> Summary:
+        """Summarises the input, sharing the summary between parts.
+
+        Args:
+            filepath: The input.
+
+        Returns:
+            The summary.
+        """
+        return summarise_input(filepath)
+
+    @override
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._get_summary(filepath)
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        return self._get_summary(filepath).zeros[START]
+
+    @override
+    def part_2(self, filepath: base.Input) -> int | str:
+        return self._get_summary(filepath).crossings[START]
@@ -1,11 +1,6 @@
 """Day 1 solver."""
 
-import sys
-from typing import TYPE_CHECKING, override
-
-if TYPE_CHECKING:
-    from collections.abc import Generator
-    import pathlib
+from typing import override
 
 from .. import base
 
@@ -13,18 +8,21 @@ from .. import base
 class Solver(base.Solver):
     """Day 1 solver."""
 
-    def _parse_input(self, filepath: pathlib.Path) -> Generator[tuple[int, int]]:
+    @base.parser
+    def _parse_input(self, filepath: base.Input) -> tuple[tuple[int, int], ...]:
         """Parses the input.
 
         Args:
-            filepath: The input filepath.
+            filepath: The input.
 
-        Yields:
-            The amount to shift and the total number of full rotations respectively.
+        Returns:
+            The amount to shift and the total number of full rotations respectively
+            for each rotation.
         """
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
-            for line in file:
-                negative = line[0] == "L"
+        rotations: list[tuple[int, int]] = []
+        with base.MappedInput(filepath) as mapped:
+            for line in mapped.lines():
+                negative = line[0] == ord("L")
                 amount = int(line[1:])
 
                 full_rotations = amount // 100
@@ -32,10 +30,16 @@ class Solver(base.Solver):
                 if negative:
                     amount = -amount
 
-                yield amount, full_rotations
+                rotations.append((amount, full_rotations))
+
+        return tuple(rotations)
+
+    @override
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._parse_input(filepath)
 
     @override
-    def part_1(self, filepath: pathlib.Path) -> int | str:
+    def part_1(self, filepath: base.Input) -> int | str:
         result = 0
         current = 50
 
@@ -48,7 +52,7 @@ class Solver(base.Solver):
         return result
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
+    def part_2(self, filepath: base.Input) -> int | str:
         result = 0
         current = 50
 
@@ -0,0 +1,111 @@
+"""Day 1 streaming solver.
+
+`DialTracker` applies rotations as they arrive, e.g. from a live feed, with
+both parts' counts available at any moment in constant memory:
+
+    tracker = DialTracker()
+    for part_1, part_2 in tracker.follow(sys.stdin):
+        print(part_1, part_2)
+"""
+
+import dataclasses
+from typing import IO, TYPE_CHECKING, override
+
+from .. import base
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    Rotation = str | bytes | memoryview
+
+
+@dataclasses.dataclass
+class DialTracker:
+    """The dial's position and both parts' counts after the rotations so far.
+
+    Attributes:
+        position: The position the dial points at.
+        part_1: The number of rotations that ended at 0.
+        part_2: The number of times the dial pointed at 0, including during
+            rotations.
+    """
+
+    position: int = 50
+    part_1: int = 0
+    part_2: int = 0
+
+    def rotate(self, rotation: Rotation) -> None:
+        """Applies a rotation.
+
+        Args:
+            rotation: The rotation, e.g. `L68`.
+        """
+        negative = rotation[0] in ("L", ord("L"))
+        full_rotations, amount = divmod(int(rotation[1:]), 100)
+        if negative:
+            amount = -amount
+
+        current = self.position
+        self.part_2 += full_rotations + (
+            current != 0 and (current + amount <= 0 or current + amount >= 100)
+        )
+        self.position = (current + amount) % 100
+        self.part_1 += self.position == 0
+
+    def rotate_all(self, rotations: Iterable[Rotation]) -> None:
+        """Applies a batch of rotations.
+
+        Args:
+            rotations: The rotations, in order.
+        """
+        for rotation in rotations:
+            self.rotate(rotation)
+
+    def follow(self, file: IO[str] | IO[bytes]) -> Generator[tuple[int, int]]:
+        """Applies the rotations of each line as it is read, e.g. from a pipe.
+
+        Blank lines are skipped.
+
+        Args:
+            file: The file to read, until its end.
+
+        Yields:
+            The part 1 and part 2 counts after each rotation.
+        """
+        for line in file:
+            line = line.strip()
+            if line:
+                self.rotate(line)
+                yield self.part_1, self.part_2
+
+
+class Solver(base.Solver):
+    """Day 1 streaming solver."""
+
+    @base.parser
+    def _track(self, filepath: base.Input) -> tuple[int, int]:
+        """Tracks the dial through the input, one line at a time.
+
+        Args:
+            filepath: The input.
+
+        Returns:
+            The part 1 and part 2 counts.
+        """
+        tracker = DialTracker()
+        with base.MappedInput(filepath) as mapped:
+            tracker.rotate_all(mapped.lines())
+
+        return tracker.part_1, tracker.part_2
+
+    @override
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._track(filepath)
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        return self._track(filepath)[0]
+
+    @override
+    def part_2(self, filepath: base.Input) -> int | str:
+        return self._track(filepath)[1]
@@ -0,0 +1,99 @@
+"""Day 1 vectorized solver.
+
+The rotations are parsed into arrays in a single pass over the input's bytes,
+so both parts are solved with array operations rather than a loop per
+rotation.
+"""
+
+from typing import TYPE_CHECKING, override
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing
+
+from .. import base
+
+
+class Solver(base.Solver):
+    """Day 1 vectorized solver."""
+
+    @base.parser
+    def _parse_input(
+        self, filepath: base.Input
+    ) -> tuple[numpy.typing.NDArray[numpy.int64], ...]:
+        """Parses the input.
+
+        The digits of every rotation are found at once, each weighted by its
+        place value, and summed per rotation.
+
+        Args:
+            filepath: The input.
+
+        Returns:
+            A tuple with the:
+                - Amount to shift of each rotation, within (-100, 100).
+                - Number of full rotations of each rotation.
+        """
+        import numpy
+
+        with base.MappedInput(filepath) as mapped:
+            data = numpy.frombuffer(mapped.data, dtype=numpy.uint8)
+            starts = numpy.flatnonzero((data == ord("L")) | (data == ord("R")))
+            negative = data[starts] == ord("L")
+            positions = numpy.flatnonzero((data >= ord("0")) & (data <= ord("9")))
+            digits = data[positions].astype(numpy.int64) - ord("0")
+            del data  # Release the map
+
+        if not len(starts):
+            empty = numpy.zeros(0, dtype=numpy.int64)
+            return empty, empty
+
+        rotations = numpy.searchsorted(starts, positions, side="right")
+        is_last = numpy.append(rotations[1:] != rotations[:-1], True)
+        firsts = numpy.flatnonzero(numpy.append(True, is_last[:-1]))
+        places = positions[is_last][numpy.cumsum(is_last) - is_last] - positions
+        amounts = numpy.add.reduceat(
+            digits * numpy.power(10, places, dtype=numpy.int64), firsts
+        )
+
+        full_rotations, amounts = numpy.divmod(amounts, 100)
+        amounts[negative] *= -1
+
+        result = amounts, full_rotations
+        for array in result:
+            array.flags.writeable = False
+
+        return result
+
+    @override
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._parse_input(filepath)
+
+    def _get_positions(self, filepath: base.Input) -> numpy.typing.NDArray[numpy.int64]:
+        """Gets the dial's position after each rotation.
+
+        Args:
+            filepath: The input.
+
+        Returns:
+            The position after each rotation.
+        """
+        import numpy
+
+        amounts, _ = self._parse_input(filepath)
+        return (50 + numpy.cumsum(amounts)) % 100
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        return int((self._get_positions(filepath) == 0).sum())
+
+    @override
+    def part_2(self, filepath: base.Input) -> int | str:
+        import numpy
+
+        amounts, full_rotations = self._parse_input(filepath)
+        current = numpy.append(50, self._get_positions(filepath)[:-1])
+        shifted = current + amounts
+        crossings = (current != 0) & ((shifted <= 0) | (shifted >= 100))
+
+        return int(full_rotations.sum() + crossings.sum())
@@ -0,0 +1,135 @@
+"""Day 2 closed-form solver.
+
+The numbers with `n` digits made of a block of `d` digits repeated `n / d`
+times are `block * (10^n - 1) / (10^d - 1)` for every `d`-digit block, so the
+ones within a range are an arithmetic series that is summed directly. The
+runtime depends on the number of ranges and their digits rather than on the
+magnitude of the IDs.
+
+A number repeating a block of `d` digits also repeats every block whose
+length is a multiple of `d`, e.g. `111111` repeats `1`, `11` and `111`. So
+part 2 removes the double counting by Möbius inversion over the number of
+repeats.
+"""
+
+import functools
+from typing import override
+
+from .. import base
+
+
+@functools.cache
+def mobius(n: int) -> int:
+    """Computes the Möbius function.
+
+    Args:
+        n: A positive integer.
+
+    Returns:
+        0 if n has a squared prime factor, otherwise -1 or 1 for an odd or even
+        number of prime factors respectively.
+    """
+    result = 1
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:
+                return 0
+
+            result = -result
+
+        factor += 1
+
+    return -result if n > 1 else result
+
+
+def sum_repeats(start: int, end: int, digits: int, block: int) -> int:
+    """Sums the numbers within a range that repeat a block of digits.
+
+    Args:
+        start: The start of the range, inclusive.
+        end: The end of the range, inclusive.
+        digits: The number of digits of the numbers.
+        block: The number of digits of the repeated block. Must divide
+            `digits`.
+
+    Returns:
+        The sum of the numbers.
+    """
+    multiplier = (10**digits - 1) // (10**block - 1)
+    low = max(10 ** (block - 1), -(-start // multiplier))
+    high = min(10**block - 1, end // multiplier)
+    if low > high:
+        return 0
+
+    return multiplier * (low + high) * (high - low + 1) // 2
+
+
+class Solver(base.Solver):
+    """Day 2 closed-form solver."""
+
+    @base.parser
+    def _make_intervals(self, filepath: base.Input) -> tuple[tuple[int, int], ...]:
+        """Makes the disjoint intervals from the input.
+
+        Overlapping ranges are merged, so each number is counted once.
+
+        Args:
+            filepath: The input.
+
+        Returns:
+            The sorted disjoint intervals, inclusive.
+        """
+        with base.MappedInput(filepath) as mapped:
+            numbers = (int(field) for field in mapped.fields(b",-"))
+            ranges = sorted(zip(numbers, numbers, strict=True))
+
+        intervals: list[tuple[int, int]] = []
+        for start, end in ranges:
+            if intervals and start <= intervals[-1][1]:
+                intervals[-1] = intervals[-1][0], max(intervals[-1][1], end)
+            else:
+                intervals.append((start, end))
+
+        return tuple(intervals)
+
+    def _generic_solve(self, filepath: base.Input, repeat_once: bool) -> int:
+        """Generic solver for both parts.
+
+        Args:
+            filepath: The input.
+            repeat_once: If true, only sum numbers that repeat a block twice.
+                If false, sum numbers that repeat a block at least twice.
+
+        Returns:
+            The solution to the problem.
+        """
+        result = 0
+        for start, end in self._make_intervals(filepath):
+            for digits in range(len(str(max(start, 1))), len(str(end)) + 1):
+                if repeat_once:
+                    if digits % 2 == 0:
+                        result += sum_repeats(start, end, digits, digits // 2)
+
+                    continue
+
+                for repeats in range(2, digits + 1):
+                    if digits % repeats == 0 and mobius(repeats):
+                        result -= mobius(repeats) * sum_repeats(
+                            start, end, digits, digits // repeats
+                        )
+
+        return result
+
+    @override
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._make_intervals(filepath)
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        return self._generic_solve(filepath, repeat_once=True)
+
+    @override
+    def part_2(self, filepath: base.Input) -> int | str:
+        return self._generic_solve(filepath, repeat_once=False)
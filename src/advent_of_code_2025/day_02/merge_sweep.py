@@ -0,0 +1,124 @@
+"""Day 2 merge-sweep solver.
+
+The ranges are parsed in a single pass over the input. The invalid numbers of
+both parts are generated together in ascending order and merged against the
+sorted intervals in one linear sweep, rather than bisecting the intervals for
+every number.
+"""
+
+from typing import TYPE_CHECKING, override
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+from .. import base
+
+SEPARATORS: bytes = bytes.maketrans(b",-", b"  ")
+
+
+class Solver(base.Solver):
+    """Day 2 merge-sweep solver."""
+
+    def _parse_input(self, filepath: base.Input) -> Generator[tuple[int, int]]:
+        """Parses the input.
+
+        The ranges are split in a single pass over the input.
+
+        Args:
+            filepath: The input.
+
+        Yields:
+            The start and end of the range inclusively.
+        """
+        with base.MappedInput(filepath) as mapped:
+            fields = bytes(mapped.data).translate(SEPARATORS).split()
+
+        numbers = map(int, fields)
+        yield from zip(numbers, numbers, strict=True)
+
+    @base.parser
+    def _make_intervals(self, filepath: base.Input) -> tuple[tuple[int, int], ...]:
+        """Makes the intervals array from the input.
+
+        Args:
+            filepath: The input.
+
+        Returns:
+            The sorted invervals array.
+        """
+        return tuple(sorted(interval for interval in self._parse_input(filepath)))
+
+    def _generate_invalid_nums(self, max_num: int) -> Generator[tuple[int, bool]]:
+        """Generates all invalid numbers up to and including the maximum number
+        in ascending order.
+
+        The numbers of each length are generated together, as a number can
+        repeat subsequences of several lengths, e.g. `1111`.
+
+        Args:
+            max_num: The maximum number in the input.
+
+        Yields:
+            A number that has a repeated subsequence and whether a subsequence
+            repeats once.
+        """
+        length = 2
+        while 10 ** (length - 1) <= max_num:
+            nums: dict[int, bool] = {}
+            for sequence_length in range(1, length // 2 + 1):
+                if length % sequence_length:
+                    continue
+
+                mask = (10**length - 1) // (10**sequence_length - 1)
+                start_num = 10 ** (sequence_length - 1)
+                end_num = min(start_num * 10 - 1, max_num // mask)
+                repeat_once = length == 2 * sequence_length
+                nums.update(
+                    dict.fromkeys(
+                        range(start_num * mask, end_num * mask + 1, mask), repeat_once
+                    )
+                )
+
+            yield from sorted(nums.items())
+            length += 1
+
+    @base.parser
+    def _solve(self, filepath: base.Input) -> tuple[int, int]:
+        """Solves both parts in a single sweep.
+
+        The invalid numbers and the intervals are both sorted, so they are
+        merged in one pass.
+
+        Args:
+            filepath: The input.
+
+        Returns:
+            The solution to each part.
+        """
+        intervals = self._make_intervals(filepath)
+        max_num = intervals[-1][1]
+
+        part_1 = part_2 = 0
+        i = 0
+        for num, repeat_once in self._generate_invalid_nums(max_num):
+            while intervals[i][1] < num:
+                i += 1
+
+            if intervals[i][0] <= num:
+                part_2 += num
+                if repeat_once:
+                    part_1 += num
+
+        return part_1, part_2
+
+    @override
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._make_intervals(filepath)
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        return self._solve(filepath)[0]
+
+    @override
+    def part_2(self, filepath: base.Input) -> int | str:
+        return self._solve(filepath)[1]
@@ -1,12 +1,10 @@
 """Day 2 solver."""
 
 import bisect
-import sys
 from typing import TYPE_CHECKING, override
 
 if TYPE_CHECKING:
     from collections.abc import Generator
-    import pathlib
 
 from .. import base
 
@@ -14,43 +12,30 @@ from .. import base
 class Solver(base.Solver):
     """Day 2 solver."""
 
-    def _parse_input(self, filepath: pathlib.Path) -> Generator[tuple[int, int]]:
+    def _parse_input(self, filepath: base.Input) -> Generator[tuple[int, int]]:
         """Parses the input.
 
         Args:
-            filepath: The input filepath.
+            filepath: The input.
 
         Yields:
             The start and end of the range inclusively.
         """
-        result = [0, 0]
-        i = 0
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
-            char = file.read(1)
-            while char != "":
-                if char == ",":
-                    yield result[0], result[1]
-                    result = [0, 0]
-                    i = 0
-                elif char.isdigit():
-                    result[i] = result[i] * 10 + int(char)
-                else:
-                    i += 1
-
-                char = file.read(1)
-
-        yield result[0], result[1]
-
-    def _make_intervals(self, filepath: pathlib.Path) -> list[tuple[int, int]]:
+        with base.MappedInput(filepath) as mapped:
+            numbers = (int(field) for field in mapped.fields(b",-"))
+            yield from zip(numbers, numbers, strict=True)
+
+    @base.parser
+    def _make_intervals(self, filepath: base.Input) -> tuple[tuple[int, int], ...]:
         """Makes the intervals array from the input.
 
         Args:
-            filepath: The input filepath.
+            filepath: The input.
 
         Returns:
             The sorted invervals array.
         """
-        return sorted(interval for interval in self._parse_input(filepath))
+        return tuple(sorted(interval for interval in self._parse_input(filepath)))
 
     def _generate_invalid_nums(
         self, max_num: int, repeat_once: bool = False
@@ -91,12 +76,12 @@ class Solver(base.Solver):
             mask = start_num * 10 + 1
 
     def _generic_solve(
-        self, filepath: pathlib.Path, repeat_subsequence_once: bool
+        self, filepath: base.Input, repeat_subsequence_once: bool
     ) -> int:
         """Generic solver for both parts.
 
         Args:
-            filepath: The input filepath.
+            filepath: The input.
             repeat_once: If true, only check numbers that have a subsequence
                 that repeats once. If false, check numbers where the subsequence can repeat
                 multiple times.
@@ -118,9 +103,13 @@ class Solver(base.Solver):
         return result
 
     @override
-    def part_1(self, filepath: pathlib.Path) -> int | str:
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._make_intervals(filepath)
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
         return self._generic_solve(filepath, repeat_subsequence_once=True)
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
+    def part_2(self, filepath: base.Input) -> int | str:
         return self._generic_solve(filepath, repeat_subsequence_once=False)
@@ -1,62 +1,66 @@
 """Day 3 solver."""
 
-import sys
-from typing import TYPE_CHECKING, override
+import functools
+from typing import override
 
-if TYPE_CHECKING:
-    import pathlib
+from .. import base, mapreduce
 
-from .. import base
 
+def _get_maximum_number_from_line(sequence_length: int, line: memoryview) -> int:
+    """Gets the maximum number for the given line.
 
-class Solver(base.Solver):
-    """Day 3 solver."""
+    This is a module level function so that it can be sent to the workers.
 
-    def _generic_solve(self, filepath: pathlib.Path, sequence_length: int) -> int:
-        """Generic solver for both parts.
+    Args:
+        sequence_length: The sequence length to extract for the problem.
+        line: The line to extract the score for.
 
-        Args:
-            filepath: The input filepath.
-            sequence_length: The sequence length to extract for the problem.
+    Returns:
+        The maximum number in the line.
+    """
+    # Skip anything but digits, e.g. trailing whitespace or a carriage return
+    digits = [c - 48 for c in line if 48 <= c <= 57]  # ord("0"), ord("9")
+    n = len(digits)
 
-        Returns:
-            The solution to the problem.
-        """
+    stack: list[int] = []
+    for i, x in enumerate(digits):
+        while stack and len(stack) + n - i > sequence_length and x > stack[-1]:
+            _ = stack.pop()
 
-        def get_maximum_number_from_line(line: str) -> int:
-            """Gets the maximum number for the given line.
+        if len(stack) < sequence_length:
+            stack.append(x)
 
-            Args:
-                line: The line to extract the score fore.
+    num = 0
+    for x in stack:
+        num = num * 10 + x
 
-            Returns:
-                The maximum number in the line.
-            """
-            line = line.strip()
-            n = len(line)
+    return num
 
-            stack: list[int] = []
-            for i, c in enumerate(line):
-                x = int(c)
-                while stack and len(stack) + n - i > sequence_length and x > stack[-1]:
-                    _ = stack.pop()
 
-                if len(stack) < sequence_length:
-                    stack.append(x)
+class Solver(base.Solver):
+    """Day 3 solver."""
+
+    def _generic_solve(self, filepath: base.Input, sequence_length: int) -> int:
+        """Generic solver for both parts.
 
-            num = 0
-            for x in stack:
-                num = num * 10 + x
+        The lines are solved in parallel on large inputs.
 
-            return num
+        Args:
+            filepath: The input.
+            sequence_length: The sequence length to extract for the problem.
 
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
-            return sum(get_maximum_number_from_line(line) for line in file)
+        Returns:
+            The solution to the problem.
+        """
+        return mapreduce.sum_lines(
+            filepath,
+            functools.partial(_get_maximum_number_from_line, sequence_length),
+        )
 
     @override
-    def part_1(self, filepath: pathlib.Path) -> int | str:
+    def part_1(self, filepath: base.Input) -> int | str:
         return self._generic_solve(filepath, 2)
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
+    def part_2(self, filepath: base.Input) -> int | str:
         return self._generic_solve(filepath, 12)
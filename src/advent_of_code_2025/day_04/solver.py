@@ -1,12 +1,10 @@
 """Day 4 solver."""
 
 import itertools
-import sys
 from typing import TYPE_CHECKING, override
 
 if TYPE_CHECKING:
     from collections.abc import Generator
-    import pathlib
 
 from .. import base
 
@@ -32,17 +30,20 @@ class Solver(base.Solver):
 
             yield i + d_i, j + d_j
 
-    def _get_surrounding_counts(self, filepath: pathlib.Path) -> list[list[int]]:
+    @base.parser
+    def _get_surrounding_counts(
+        self, filepath: base.Input
+    ) -> tuple[tuple[int, ...], ...]:
         """Gets the number of surrounding rolls for each cell in the grid.
 
         Args:
-            filepath: The input filepath.
+            filepath: The input.
 
         Returns:
             A grid matching the input file with the count of surrounding
             rolls. If the cell was not a roll, the count will be -1.
         """
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
+        with base.open_input(filepath) as file:
             grid = [line.strip() for line in file]
 
         m = len(grid)
@@ -63,16 +64,20 @@ class Solver(base.Solver):
 
                 counts[i][j] = count
 
-        return counts
+        return tuple(tuple(row) for row in counts)
 
     @override
-    def part_1(self, filepath: pathlib.Path) -> int | str:
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._get_surrounding_counts(filepath)
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
         counts = self._get_surrounding_counts(filepath)
         return sum(sum(x != -1 and x < 4 for x in row) for row in counts)
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
-        counts = self._get_surrounding_counts(filepath)
+    def part_2(self, filepath: base.Input) -> int | str:
+        counts = [list(row) for row in self._get_surrounding_counts(filepath)]
 
         m = len(counts)
         n = len(counts[0])
@@ -87,6 +92,7 @@ class Solver(base.Solver):
                 stack.append((i, j))
 
         result = 0
+        decrements = 0
         while stack:
             result += 1
             i, j = stack.pop()
@@ -96,8 +102,10 @@ class Solver(base.Solver):
                     continue
 
                 counts[n_i][n_j] -= 1
+                decrements += 1
                 if counts[n_i][n_j] < 4:
                     counts[n_i][n_j] = -1
                     stack.append((n_i, n_j))
 
+        base.count("neighbor_decrements", decrements)
         return result
@@ -1,12 +1,10 @@
 """Day 5 solver."""
 
 import bisect
-import sys
 from typing import TYPE_CHECKING, override
 
 if TYPE_CHECKING:
     from collections.abc import Generator
-    import pathlib
     from typing import TextIO
 
 from .. import base
@@ -50,23 +48,43 @@ class Solver(base.Solver):
 
         return intervals
 
-    @override
-    def part_1(self, filepath: pathlib.Path) -> int | str:
-        result: int = 0
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
+    @base.parser
+    def _parse_input(
+        self, filepath: base.Input
+    ) -> tuple[tuple[tuple[int, int], ...], tuple[int, ...]]:
+        """Parses the input.
+
+        Args:
+            filepath: The input.
+
+        Returns:
+            A tuple with:
+                - The merged intervals.
+                - The ingredient IDs.
+        """
+        with base.open_input(filepath) as file:
             intervals = self._get_intervals(file)
+            ids = tuple(int(line) for line in file)
 
-            for line in file:
-                line = line.strip()
-                x = int(line)
-                i = bisect.bisect_left(intervals, x, key=lambda x: x[1])
-                result += i < len(intervals) and intervals[i][0] <= x <= intervals[i][1]
+        return tuple(intervals), ids
+
+    @override
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._parse_input(filepath)
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        intervals, ids = self._parse_input(filepath)
+
+        result: int = 0
+        for x in ids:
+            i = bisect.bisect_left(intervals, x, key=lambda x: x[1])
+            result += i < len(intervals) and intervals[i][0] <= x <= intervals[i][1]
 
         return result
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
-            intervals = self._get_intervals(file)
+    def part_2(self, filepath: base.Input) -> int | str:
+        intervals, _ = self._parse_input(filepath)
 
         return sum(end - start + 1 for start, end in intervals)
@@ -1,11 +1,9 @@
 """Day 6 solver."""
 
 import itertools
-import sys
 from typing import TYPE_CHECKING, override
 
 if TYPE_CHECKING:
-    import pathlib
     from typing import Callable
 
 from .. import base
@@ -15,7 +13,7 @@ class Solver(base.Solver):
     """Day 6 solver."""
 
     def _parse_input(
-        self, filepath: pathlib.Path, transpose: bool
+        self, filepath: base.Input, transpose: bool
     ) -> tuple[list[list[int]], list[str]]:
         """Parses the input file into a list of number groups and operators.
 
@@ -29,7 +27,7 @@ class Solver(base.Solver):
                   group of numbers.
                 - A list of strings representing the group's respective operator.
         """
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
+        with base.open_input(filepath) as file:
             *values, operators = (line.strip("\n") for line in file)
 
             prev = 0
@@ -64,7 +62,7 @@ class Solver(base.Solver):
 
             return numbers, operators
 
-    def _generic_solve(self, filepath: pathlib.Path, transpose: bool) -> int:
+    def _generic_solve(self, filepath: base.Input, transpose: bool) -> int:
         """Generic solve for both parts.
 
         Args:
@@ -106,9 +104,9 @@ class Solver(base.Solver):
         return sum(apply(*args) for args in zip(numbers, operators))
 
     @override
-    def part_1(self, filepath: pathlib.Path) -> int | str:
+    def part_1(self, filepath: base.Input) -> int | str:
         return self._generic_solve(filepath, transpose=False)
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
+    def part_2(self, filepath: base.Input) -> int | str:
         return self._generic_solve(filepath, transpose=True)
@@ -1,11 +1,8 @@
 """Day 7 solver."""
 
 import collections
-import sys
-from typing import TYPE_CHECKING, override
-
-if TYPE_CHECKING:
-    import pathlib
+import types
+from typing import override
 
 from .. import base
 
@@ -13,11 +10,14 @@ from .. import base
 class Solver(base.Solver):
     """Day 7 solver."""
 
-    def _generic_solve(self, filepath: pathlib.Path) -> tuple[dict[int, int], int]:
+    @base.parser
+    def _generic_solve(
+        self, filepath: base.Input
+    ) -> tuple[types.MappingProxyType[int, int], int]:
         """Generic solver for both parts.
 
         Args:
-            filepath: The input filepath.
+            filepath: The input.
 
         Returns:
             Tuple with:
@@ -26,7 +26,7 @@ class Solver(base.Solver):
         """
         start_char = "S"
         splitter_char = "^"
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
+        with base.open_input(filepath) as file:
             line = file.readline().strip()
             positions: dict[int, int] = {line.index(start_char): 1}
             splits = 0
@@ -45,14 +45,14 @@ class Solver(base.Solver):
 
                 positions = new_positions
 
-        return positions, splits
+        return types.MappingProxyType(positions), splits
 
     @override
-    def part_1(self, filepath: pathlib.Path) -> int | str:
+    def part_1(self, filepath: base.Input) -> int | str:
         _, splits = self._generic_solve(filepath)
         return splits
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
+    def part_2(self, filepath: base.Input) -> int | str:
         positions, _ = self._generic_solve(filepath)
         return sum(positions.values())
@@ -1,15 +1,14 @@
 """Day 8 solver."""
 
 import dataclasses
-import functools
 import heapq
-import sys
 from typing import TYPE_CHECKING, override
 
 if TYPE_CHECKING:
-    import pathlib
+    import numpy
+    import numpy.typing
 
-from .. import base
+from .. import base, disk_cache
 
 
 class UnionFind:
@@ -38,7 +37,7 @@ class UnionFind:
         self.parents[y] = x
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class Point:
     x: int
     y: int
@@ -48,56 +47,68 @@ class Point:
 class Solver(base.Solver):
     """Day 8 solver."""
 
-    _cache_limit: int = 1
-
-    def _distance(self, /, a: Point, b: Point) -> int:
-        """Calculates the square distance between two points.
+    @base.parser
+    def _parse_inputs(self, filepath: base.Input) -> tuple[Point, ...]:
+        """Parses the input.
 
         Args:
-            a: The first point.
-            b: The second point.
+            filepath: The input.
 
         Returns:
-            The squared distance between the two points.
+            The points.
         """
-        # Unrolling is faster than using sum and zip
-        return (a.x - b.x) ** 2 + (a.y - b.y) ** 2 + (a.z - b.z) ** 2
+        points: list[Point] = []
+        with base.open_input(filepath) as file:
+            for line in file:
+                x, y, z = (int(x) for x in line.strip().split(","))
+                points.append(Point(x, y, z))
 
-    @functools.lru_cache(_cache_limit)
-    def _parse_inputs(
-        self, filepath: pathlib.Path
-    ) -> tuple[list[Point], list[tuple[int, int, int]]]:
-        """Parses the input.
+        return tuple(points)
+
+    @base.parser
+    @disk_cache.arrays("edges")
+    def _get_edges(
+        self, filepath: base.Input
+    ) -> tuple[numpy.typing.NDArray[numpy.int64], ...]:
+        """Gets the edges between every pair of points, shortest first.
+
+        Edges of equal length are ordered by their base points.
 
         Args:
-            filepath: The input filepath.
+            filepath: The input.
 
         Returns:
             A tuple with the:
-                - List of points.
-                - List of edges and its base points.
+                - First base point of each edge.
+                - Second base point of each edge.
         """
-        points: list[Point] = []
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
-            for line in file:
-                x, y, z = (int(x) for x in line.strip().split(","))
-                points.append(Point(x, y, z))
+        import numpy
 
-        edges = [
-            (self._distance(points[i], points[j]), i, j)
-            for i in range(len(points))
-            for j in range(i)
-        ]
+        points = numpy.array(
+            [(p.x, p.y, p.z) for p in self._parse_inputs(filepath)], dtype=numpy.int64
+        )
+        with self.phase("edges"):
+            i, j = numpy.tril_indices(len(points), k=-1)
+            distances = ((points[i] - points[j]) ** 2).sum(axis=1)
+            order = numpy.argsort(distances, kind="stable")
 
-        return points, edges
+        result = i[order], j[order]
+        for array in result:
+            array.flags.writeable = False
+
+        return result
+
+    @override
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._get_edges(filepath)
 
     @override
-    def part_1(self, filepath: pathlib.Path, pairs: int = 1000) -> int | str:
-        points, edges = self._parse_inputs(filepath)
+    def part_1(self, filepath: base.Input, pairs: int = 1000) -> int | str:
+        points = self._parse_inputs(filepath)
+        first, second = self._get_edges(filepath)
         uf = UnionFind(len(points))
 
-        edges = heapq.nsmallest(pairs, edges)
-        for _, i, j in edges:
+        for i, j in zip(first[:pairs].tolist(), second[:pairs].tolist(), strict=True):
             uf.union(i, j)
 
         circuits = {uf.find(i) for i in range(len(points))}
@@ -105,16 +116,20 @@ class Solver(base.Solver):
         return a * b * c
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
-        points, edges = self._parse_inputs(filepath)
+    def part_2(self, filepath: base.Input) -> int | str:
+        points = self._parse_inputs(filepath)
+        first, second = self._get_edges(filepath)
         uf = UnionFind(len(points))
 
         result = 0
 
-        heapq.heapify(edges)
-        while uf.components > 1:
-            _, i, j = heapq.heappop(edges)
+        processed = 0
+        for i, j in zip(first.tolist(), second.tolist(), strict=True):
+            processed += 1
             uf.union(i, j)
             result = points[i].x * points[j].x
+            if uf.components == 1:
+                break
 
+        base.count("edges_processed", processed)
         return result
@@ -1,52 +1,70 @@
 """Day 9 solver."""
 
 import bisect
-import sys
 from typing import TYPE_CHECKING, override
 
 if TYPE_CHECKING:
-    import pathlib
+    import numpy
+    import numpy.typing
 
     Point = tuple[int, int]
     Line = tuple[int, int, int]
 
-from .. import base
+from .. import base, disk_cache
 
 
 class Solver(base.Solver):
     """Day 9 solver."""
 
-    def _parse_input(self, filepath: pathlib.Path) -> list[Point]:
+    @base.parser
+    def _parse_input(self, filepath: base.Input) -> tuple[Point, ...]:
         """Parses the input file.
 
         Args:
-            filepath: The input filepath.
+            filepath: The input.
 
         Returns:
             The points in the input.
         """
         points: list[Point] = []
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
+        with base.open_input(filepath) as file:
             for line in file:
                 line = line.strip()
                 x, y = line.split(",")
                 points.append((int(x), int(y)))
 
-        return points
+        return tuple(points)
 
-    def _area(self, /, a: Point, b: Point) -> int:
-        """Calculates the area for the rectangle.
-
-        The area includes the perimeter grid cells.
+    @base.parser
+    @disk_cache.arrays("areas")
+    def _get_areas(
+        self, filepath: base.Input
+    ) -> tuple[numpy.typing.NDArray[numpy.int64], ...]:
+        """Gets the area of the rectangle formed by every pair of points,
+        largest first.
 
         Args:
-            a: Coordinates of one corner of the rectangle (x, y).
-            b: Coordinates of the opposite corner of the rectangle (x, y).
+            filepath: The input.
 
         Returns:
-            The area of the rectangle including its perimeter.
+            A tuple with the:
+                - Area of each rectangle.
+                - Index of the first corner of each rectangle.
+                - Index of the opposite corner of each rectangle.
         """
-        return (abs(a[0] - b[0]) + 1) * (abs(a[1] - b[1]) + 1)
+        import numpy
+
+        points = numpy.array(self._parse_input(filepath), dtype=numpy.int64)
+        i, j = numpy.tril_indices(len(points), k=-1)
+        areas = (numpy.abs(points[i] - points[j]) + 1).prod(axis=1)
+        with self.phase("sort"):
+            order = numpy.argsort(-areas, kind="stable")
+            result = areas[order], i[order], j[order]
+
+        for array in result:
+            array.flags.writeable = False
+
+        return result
 
     def _are_all_lines_outside_the_rectangle(
         self, lines: tuple[list[Line], list[Line]], /, a: Point, b: Point
@@ -87,17 +105,17 @@ class Solver(base.Solver):
         return True
 
     @override
-    def part_1(self, filepath: pathlib.Path) -> int | str:
-        points = self._parse_input(filepath)
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._get_areas(filepath)
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        areas, _, _ = self._get_areas(filepath)
 
-        return max(
-            self._area(points[i], points[j])
-            for i in range(len(points))
-            for j in range(i)
-        )
+        return int(areas[0])
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
+    def part_2(self, filepath: base.Input) -> int | str:
         points = self._parse_input(filepath)
 
         lines: tuple[list[Line], list[Line]] = [], []
@@ -112,16 +130,12 @@ class Solver(base.Solver):
         for axis in range(2):
             lines[axis].sort()
 
-        areas = sorted(
-            (
-                (self._area(points[i], points[j]), i, j)
-                for i in range(len(points))
-                for j in range(i)
-            ),
-            reverse=True,
-        )
-        for area, i, j in areas:
+        areas, first, second = self._get_areas(filepath)
+        rectangles = zip(areas.tolist(), first.tolist(), second.tolist(), strict=True)
+        for rejected, (area, i, j) in enumerate(rectangles):
             if self._are_all_lines_outside_the_rectangle(lines, points[i], points[j]):
+                base.count("rectangles_rejected", rejected)
                 return area
 
+        base.count("rectangles_rejected", len(areas))
         return 0
@@ -1,135 +1,147 @@
 """Day 10 solver."""
 
 import collections
-import sys
 from typing import TYPE_CHECKING, cast, override
 
-import scipy.optimize
-
 if TYPE_CHECKING:
-    import pathlib
     from typing import Literal
 
+    Machine = tuple[int, tuple[frozenset[int], ...], tuple[int, ...]]
 
-from .. import base
+from .. import base, mapreduce
 
+CHUNK_SIZE: int = 1 << 12  # Each machine is slow to solve
 
-class Solver(base.Solver):
-    """Day 10 solver."""
 
-    def _parse_line(self, line: str) -> tuple[int, list[set[int]], list[int]]:
-        """Parses the input line.
+def _parse_line(line: memoryview) -> Machine:
+    """Parses the input line.
 
-        Args:
-            line: The input line.
+    Args:
+        line: The input line.
 
-        Returns:
-            A tuple with:
-                - The binary mask of the indicator lights.
-                    Each bit represents whether a light is on (1)
-                        or off (0).
-                    The bits are read right to left.
-                - The buttons with each set representing
-                    the set of indices it toggles..
-                - The target values for the position counter.
-        """
-        line = line.strip()
-        indicator, *buttons, counter = line.split()
+    Returns:
+        A tuple with:
+            - The binary mask of the indicator lights.
+                Each bit represents whether a light is on (1)
+                    or off (0).
+                The bits are read right to left.
+            - The buttons with each set representing
+                the set of indices it toggles..
+            - The target values for the position counter.
+    """
+    indicator, *buttons, counter = line.tobytes().split()
 
-        indicator_state = 0
-        for i, c in enumerate(indicator[1:-1]):
-            if c == ".":
-                continue
+    indicator_state = 0
+    for i, c in enumerate(indicator[1:-1]):
+        if c == ord("."):
+            continue
 
-            indicator_state |= 1 << i
+        indicator_state |= 1 << i
 
-        buttons = [{int(x) for x in button[1:-1].split(",")} for button in buttons]
+    buttons = tuple(
+        frozenset(int(x) for x in button[1:-1].split(b",")) for button in buttons
+    )
 
-        counter = [int(x) for x in counter[1:-1].split(",")]
+    counter = tuple(int(x) for x in counter[1:-1].split(b","))
 
-        return indicator_state, buttons, counter
+    return indicator_state, buttons, counter
 
-    @override
-    def part_1(self, filepath: pathlib.Path) -> int | str:
-        def solve(line: str) -> int:
-            """Gets the minimum number of button presses
-            to reach the desired state in the input line.
 
-            Args:
-                line: The input line.
+def _get_fewest_toggles(line: memoryview) -> int:
+    """Gets the minimum number of button presses
+    to reach the desired state of a machine.
+
+    This is a module level function so that it can be sent to the workers.
+
+    Args:
+        line: The input line of the machine.
+
+    Returns:
+        The minimum number of button presses to
+        reach the desired state.
+    """
+    target, buttons, _ = _parse_line(line)
+
+    toggles: set[int] = set()
+    for button in buttons:
+        toggle = 0
+        for i in button:
+            toggle ^= 1 << i
+
+        toggles.add(toggle)
+
+    num_bits = max(max(button) for button in buttons) + 1
 
-            Returns:
-                The minimum number of button presses to
-                reach the desired state.
-            """
-            target, buttons, _ = self._parse_line(line)
+    visited = [False] * (1 << num_bits)
+    visited[0] = True
+    queue = collections.deque([0])
+    depth = 1
+    expanded = 0  # Tallied per level to keep the search loop free of counting
+    while queue:
+        popped = 0
+        for popped in range(1, len(queue) + 1):
+            state = queue.popleft()
 
-            toggles: set[int] = set()
-            for button in buttons:
-                toggle = 0
-                for i in button:
-                    toggle ^= 1 << i
+            for toggle in toggles:
+                next_state = state ^ toggle
+                if next_state == target:
+                    base.count("states_expanded", expanded + popped)
+                    return depth
 
-                toggles.add(toggle)
+                if visited[next_state]:
+                    continue
 
-            num_bits = max(max(button) for button in buttons) + 1
+                visited[next_state] = True
+                queue.append(next_state)
 
-            visited = [False] * (1 << num_bits)
-            visited[0] = True
-            queue = collections.deque([0])
-            depth = 1
-            while queue:
-                for _ in range(len(queue)):
-                    state = queue.popleft()
+        expanded += popped
+        depth += 1
 
-                    for toggle in toggles:
-                        next_state = state ^ toggle
-                        if next_state == target:
-                            return depth
+    raise ValueError("Target state was never reached")
 
-                        if visited[next_state]:
-                            continue
 
-                        visited[next_state] = True
-                        queue.append(next_state)
+def _get_fewest_increments(line: memoryview) -> int:
+    """Gets the minimum number of button presses
+    to reach the desired counts of a machine.
 
-                depth += 1
+    This is a module level function so that it can be sent to the workers.
 
-            raise ValueError("Target state was never reached")
+    Args:
+        line: The input line of the machine.
 
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
-            return sum(solve(line) for line in file)
+    Returns:
+        The minimum number of button presses to
+        reach the desired counts.
+    """
+    import scipy.optimize  # Deferred, as importing scipy is slow
+
+    _, buttons, target = _parse_line(line)
+
+    weights: list[Literal[1]] = [1] * len(buttons)
+    variable_type: list[Literal[1]] = [1] * len(buttons)
+    button_matrix = [[i in button for button in buttons] for i in range(len(target))]
+    milp_result: scipy.optimize.OptimizeResult = scipy.optimize.milp(
+        weights,
+        integrality=variable_type,
+        constraints=(
+            scipy.optimize.LinearConstraint(button_matrix, lb=target, ub=target),
+        ),
+    )
+    return int(cast("float", milp_result.fun))
+
+
+class Solver(base.Solver):
+    """Day 10 solver.
+
+    The machines are solved in parallel on large inputs.
+    """
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        return mapreduce.sum_lines(filepath, _get_fewest_toggles, chunk_size=CHUNK_SIZE)
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
-        def solve(line: str) -> int:
-            """Gets the minimum number of button presses
-            to reach the desired counts in the input line.
-
-            Args:
-                line: The input line.
-
-            Returns:
-                The minimum number of button presses to
-                reach the desired counts.
-            """
-            _, buttons, target = self._parse_line(line)
-
-            weights: list[Literal[1]] = [1] * len(buttons)
-            variable_type: list[Literal[1]] = [1] * len(buttons)
-            button_matrix = [
-                [i in button for button in buttons] for i in range(len(target))
-            ]
-            milp_result: scipy.optimize.OptimizeResult = scipy.optimize.milp(
-                weights,
-                integrality=variable_type,
-                constraints=(
-                    scipy.optimize.LinearConstraint(
-                        button_matrix, lb=target, ub=target
-                    ),
-                ),
-            )
-            return int(cast("float", milp_result.fun))
-
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
-            return sum(solve(line) for line in file)
+    def part_2(self, filepath: base.Input) -> int | str:
+        return mapreduce.sum_lines(
+            filepath, _get_fewest_increments, chunk_size=CHUNK_SIZE
+        )
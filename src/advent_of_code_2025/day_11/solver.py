@@ -1,12 +1,7 @@
 """Day 11 solver."""
 
 import collections
-import sys
-from typing import TYPE_CHECKING, override
-
-if TYPE_CHECKING:
-    from collections.abc import Generator
-    import pathlib
+from typing import override
 
 from .. import base
 
@@ -14,28 +9,38 @@ from .. import base
 class Solver(base.Solver):
     """Day 11 solver."""
 
+    @base.parser
     def _get_source_and_destinations(
-        self, filepath: pathlib.Path
-    ) -> Generator[tuple[str, list[str]]]:
-        """Parses the input yielding the source and destinations from
+        self, filepath: base.Input
+    ) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        """Parses the input into the source and destinations from
         each input line.
 
         Args:
-            filepath: The input filepath.
+            filepath: The input.
 
-        Yields:
-            A tuple with:
+        Returns:
+            A tuple of tuples with:
                 - The source node.
-                - The list of destination nodes.
+                - The destination nodes.
         """
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
+        result: list[tuple[str, tuple[str, ...]]] = []
+        with base.open_input(filepath) as file:
             for line in file:
                 source, destinations = line.strip().split(": ")
-                yield source, destinations.split()
+                result.append((source, tuple(destinations.split())))
+
+        return tuple(result)
+
+    @override
+    def parse(self, filepath: base.Input) -> None:
+        _ = self._get_source_and_destinations(filepath)
 
     @override
-    def part_1(self, filepath: pathlib.Path) -> int | str:
-        graph: dict[str, list[str]] = dict(self._get_source_and_destinations(filepath))
+    def part_1(self, filepath: base.Input) -> int | str:
+        graph: dict[str, tuple[str, ...]] = dict(
+            self._get_source_and_destinations(filepath)
+        )
 
         result = 0
         stack = ["you"]
@@ -51,7 +56,7 @@ class Solver(base.Solver):
         return result
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
+    def part_2(self, filepath: base.Input) -> int | str:
         nodes: list[str] = ["out"]
         graph: dict[str, list[str]] = collections.defaultdict(list)
         degrees: dict[str, int] = collections.Counter()
@@ -1,38 +1,41 @@
 """Day 12 solver."""
 
-import sys
-from typing import TYPE_CHECKING, override
+from typing import override
 
-if TYPE_CHECKING:
-    import pathlib
+from .. import base, mapreduce
 
-from .. import base
 
+def _check(line: memoryview) -> int:
+    """Checks if the blocks can be greedily placed in its own
+    3x3 space.
 
-class Solver(base.Solver):
-    """Day 12 solver."""
+    This is a module level function so that it can be sent to the workers.
 
-    @override
-    def part_1(self, filepath: pathlib.Path) -> int | str:
-        def check(line: str) -> bool:
-            """Checks if the blocks can be greedily placed in its own
-            3x3 space.
+    Args:
+        line: The input line.
+
+    Returns:
+        1 if each block of a region line can be placed in its own 3x3 block,
+        otherwise 0.
+    """
+    region = line.tobytes()
+    if b"x" not in region:  # A shape line
+        return 0
 
-            Args:
-                line: The input line.
+    dimensions, counts = region.split(b": ")
+    row, col = (int(x) for x in dimensions.split(b"x"))
+    counts = [int(x) for x in counts.split()]
 
-            Returns:
-                True if each block can be placed in its own 3x3 block.
-            """
-            dimensions, counts = line.split(": ")
-            row, col = (int(x) for x in dimensions.split("x"))
-            counts = [int(x) for x in counts.split()]
+    return int(col // 3 * row // 3 >= sum(counts))
 
-            return col // 3 * row // 3 >= sum(counts)
 
-        with open(filepath, "r", encoding=sys.getdefaultencoding()) as file:
-            return sum(check(line) for line in file if "x" in line)
+class Solver(base.Solver):
+    """Day 12 solver."""
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        return mapreduce.sum_lines(filepath, _check)
 
     @override
-    def part_2(self, filepath: pathlib.Path) -> int | str:
+    def part_2(self, filepath: base.Input) -> int | str:
         return ""
@@ -0,0 +1,311 @@
+"""This module contains the differential testing of the engines.
+
+The `solver` module of each day is the reference engine. Every other module of
+a day's package that defines its own `Solver` is an alternative engine, e.g. a
+vectorized or parallel one, which must give the same answers. Run
+`solver diff <DAYS>` to solve generated inputs with every engine and compare
+each answer to the reference's.
+
+An input with a mismatch is shrunk by removing lines and then the comma
+separated fields of each line, e.g. day 2's ranges, while the mismatch
+remains. Inputs the reference fails to solve are skipped, as they are outside
+the puzzle's constraints.
+"""
+
+import argparse
+import dataclasses
+import importlib
+import pkgutil
+import sys
+from typing import TYPE_CHECKING, cast
+
+from . import base, disk_cache, get_solver, parse_days, result_cache
+from .generators import get_generator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+
+PARTS: tuple[int, ...] = (1, 2)
+
+
+@dataclasses.dataclass
+class Args:
+    days: list[str]
+    sizes: list[int]
+    seeds: int
+
+
+@dataclasses.dataclass
+class Mismatch:
+    """A shrunk input on which an engine's answer differs from the reference's."""
+
+    day: str
+    engine: str
+    part: int
+    lines: list[str]
+    expected: int | str
+    actual: int | str
+
+
+def get_engines(day: str) -> dict[str, type[base.Solver]]:
+    """Gets the alternative engines of a day.
+
+    Args:
+        day: The two-digit day.
+
+    Returns:
+        The names of the engines' modules mapped to their solver classes.
+    """
+    package = importlib.import_module(f".day_{day}", __package__)
+    engines: dict[str, type[base.Solver]] = {}
+    for module_info in pkgutil.iter_modules(package.__path__):
+        if module_info.name == "solver":
+            continue
+
+        module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+        solver = getattr(module, "Solver", None)
+        if (
+            isinstance(solver, type)
+            and issubclass(solver, base.Solver)
+            and solver.__module__ == module.__name__
+        ):
+            engines[module_info.name] = solver
+
+    return engines
+
+
+def solve_part(solver: base.Solver, part: int, data: bytes) -> int | str | Exception:
+    """Solves a part, returning the exception it raises instead.
+
+    Args:
+        solver: The solver.
+        part: The part.
+        data: The input.
+
+    Returns:
+        The answer or the exception.
+    """
+    try:
+        return cast("int | str", getattr(solver, f"part_{part}")(data))
+    except base.SOLVER_ERRORS as e:
+        return e
+
+
+def compare(
+    reference: base.Solver,
+    engine: base.Solver,
+    lines: Sequence[str],
+    parts: Iterable[int] = PARTS,
+) -> dict[int, tuple[int | str, int | str | Exception]]:
+    """Compares an engine's answers to the reference's.
+
+    Args:
+        reference: The reference solver.
+        engine: The engine's solver.
+        lines: The input lines.
+        parts: The parts to compare.
+
+    Returns:
+        The mismatching parts mapped to the expected answer and the engine's
+        answer or exception. Parts the reference fails to solve are skipped.
+    """
+    data = "".join(f"{line}\n" for line in lines).encode()
+    mismatches: dict[int, tuple[int | str, int | str | Exception]] = {}
+    for part in parts:
+        expected = solve_part(reference, part, data)
+        if isinstance(expected, Exception):
+            continue
+
+        actual = solve_part(engine, part, data)
+        if isinstance(actual, Exception) or actual != expected:
+            mismatches[part] = expected, actual
+
+    return mismatches
+
+
+def _reduce[T](items: list[T], failing: Callable[[list[T]], bool]) -> list[T]:
+    """Removes chunks of items, halving the chunk size down to single items,
+    while the remaining items still fail.
+
+    Args:
+        items: The failing items.
+        failing: Whether some items fail.
+
+    Returns:
+        The remaining items, of which none can be removed alone.
+    """
+    chunk = len(items) // 2
+    while chunk:
+        start = 0
+        while start < len(items):
+            candidate = items[:start] + items[start + chunk :]
+            if candidate and failing(candidate):
+                items = candidate
+            else:
+                start += chunk
+
+        chunk //= 2
+
+    return items
+
+
+def shrink(lines: Sequence[str], failing: Callable[[list[str]], bool]) -> list[str]:
+    """Shrinks a failing input.
+
+    Lines are removed first, then the comma separated fields of each line.
+
+    Args:
+        lines: The lines of the failing input.
+        failing: Whether an input, given as lines, fails.
+
+    Returns:
+        The lines of the shrunk input, which still fails.
+    """
+    lines = _reduce(list(lines), failing)
+    for i, line in enumerate(lines):
+        fields = line.split(",")
+        if len(fields) < 2:
+            continue
+
+        def failing_fields(fields: list[str], i: int = i) -> bool:
+            return failing([*lines[:i], ",".join(fields), *lines[i + 1 :]])
+
+        lines[i] = ",".join(_reduce(fields, failing_fields))
+
+    return lines
+
+
+def check(
+    day: str,
+    engine: type[base.Solver],
+    sizes: Iterable[int],
+    seeds: Iterable[int],
+) -> list[Mismatch]:
+    """Compares an engine to the reference on generated inputs.
+
+    The answer and disk caches should be disabled, so that the engine solves
+    every part itself.
+
+    Args:
+        day: The two-digit day.
+        engine: The engine's solver class.
+        sizes: The sizes of the generated inputs. See `solver generate`.
+        seeds: The random seeds of the generated inputs of each size.
+
+    Returns:
+        The first mismatch of each part, shrunk.
+    """
+    reference, solver = get_solver(day)(), engine()
+    generator = get_generator(day)
+    parts = list(PARTS)
+    result: list[Mismatch] = []
+    seeds = list(seeds)
+    for size in sizes:
+        for seed in seeds:
+            lines = list(generator(size, seed))
+            for part in compare(reference, solver, lines, parts):
+                parts.remove(part)
+                shrunk = shrink(
+                    lines,
+                    lambda lines, part=part: (
+                        part in compare(reference, solver, lines, (part,))
+                    ),
+                )
+                expected, actual = compare(reference, solver, shrunk, (part,))[part]
+                result.append(
+                    Mismatch(
+                        day,
+                        engine.__module__.rpartition(".")[2],
+                        part,
+                        shrunk,
+                        expected,
+                        f"{type(actual).__name__}: {actual}"
+                        if isinstance(actual, Exception)
+                        else actual,
+                    )
+                )
+
+            if not parts:
+                return result
+
+    return result
+
+
+def parse_args(argv: Sequence[str] | None = None) -> Args:
+    """Parses the CLI args.
+
+    Args:
+        argv: The CLI args. If not provided, `sys.argv` is used.
+
+    Returns:
+        The parsed args.
+    """
+    parser = argparse.ArgumentParser(
+        prog="solver diff",
+        description="Advent of code 2025 differential testing of the engines.",
+    )
+
+    _ = parser.add_argument(
+        "days",
+        type=parse_days,
+        help="The days to test. Either `all` or a comma separated list of days and"
+        " ranges, e.g. 1,4,8-10.",
+    )
+    _ = parser.add_argument(
+        "--size",
+        "-n",
+        dest="sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="The sizes of the generated inputs. See `solver generate`.",
+    )
+    _ = parser.add_argument(
+        "--seeds",
+        "-s",
+        type=int,
+        default=10,
+        help="The number of generated inputs of each size.",
+    )
+
+    args = parser.parse_args(argv)
+    return Args(
+        days=cast("list[str]", args.days),
+        sizes=cast("list[int]", args.sizes),
+        seeds=cast("int", args.seeds),
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    failed = False
+    for day in args.days:
+        engines = get_engines(day)
+        if not engines:
+            print(f"Day {day}: no engines")
+            continue
+
+        for name, engine in engines.items():
+            # Cached answers would hide the engine's answers
+            with result_cache.disabled(), disk_cache.disabled():
+                mismatches = check(day, engine, args.sizes, range(args.seeds))
+            if not mismatches:
+                print(
+                    f"Day {day} {name}: matches on "
+                    f"{len(args.sizes) * args.seeds} inputs"
+                )
+                continue
+
+            failed = True
+            for mismatch in mismatches:
+                print(f"Day {day} {name}: part {mismatch.part} mismatch")
+                print(f"  Expected: {mismatch.expected}")
+                print(f"  Actual: {mismatch.actual}")
+                print("  Input:")
+                for line in mismatch.lines:
+                    print(f"    {line}")
+
+    if failed:
+        sys.exit(1)
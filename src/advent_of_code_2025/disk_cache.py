@@ -0,0 +1,221 @@
+"""This module contains the opt-in on-disk cache of precomputed structures.
+
+The cache is enabled by setting `ENVIRONMENT_VARIABLE` to `1`, which uses
+`DEFAULT_DIRECTORY`, or to the cache directory. Being an environment variable,
+the setting is inherited by worker processes.
+
+Each entry is keyed by the package version, the day, the content hash of the
+input and the structure's name, i.e. `<version>/day_<day>/<digest>/<name>/`
+within the cache directory. The structures are stored as `.npy` arrays, named
+`<index>-of-<count>.npy`, and are memory-mapped when loaded. An incomplete
+entry, e.g. one being removed by `clear`, is rebuilt.
+"""
+
+import contextlib
+import functools
+import hashlib
+import os
+import pathlib
+from typing import TYPE_CHECKING, Concatenate, ParamSpec, TypeVar
+
+from . import base
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    import numpy
+    import numpy.typing
+
+    Arrays = tuple[numpy.typing.NDArray[numpy.int64], ...]
+
+P = ParamSpec("P")
+S = TypeVar("S", bound=base.Solver)
+
+ENVIRONMENT_VARIABLE: str = "ADVENT_OF_CODE_2025_CACHE"
+DEFAULT_DIRECTORY: pathlib.Path = (
+    pathlib.Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    / "advent_of_code_2025"
+    / "arrays"
+)
+
+
+def get_directory() -> pathlib.Path | None:
+    """Gets the cache directory.
+
+    Returns:
+        The cache directory if the cache is enabled, otherwise None.
+    """
+    value = os.environ.get(ENVIRONMENT_VARIABLE, "")
+    if value in ("", "0"):
+        return None
+
+    if value == "1":
+        return DEFAULT_DIRECTORY
+
+    return pathlib.Path(value).expanduser()
+
+
+def enable(directory: pathlib.Path | None = None) -> None:
+    """Enables the cache.
+
+    Args:
+        directory: The cache directory. If not provided, `DEFAULT_DIRECTORY`
+            is used.
+    """
+    os.environ[ENVIRONMENT_VARIABLE] = str(directory) if directory else "1"
+
+
+def disable() -> None:
+    """Disables the cache."""
+    os.environ[ENVIRONMENT_VARIABLE] = "0"
+
+
+@contextlib.contextmanager
+def disabled() -> Generator[None]:
+    """Disables the cache within the context, e.g. while timing the solvers.
+
+    Yields:
+        Nothing, the cache is restored to its previous setting on exit.
+    """
+    previous = os.environ.get(ENVIRONMENT_VARIABLE)
+    disable()
+    try:
+        yield
+    finally:
+        if previous is None:
+            _ = os.environ.pop(ENVIRONMENT_VARIABLE, None)
+        else:
+            os.environ[ENVIRONMENT_VARIABLE] = previous
+
+
+def clear(directory: pathlib.Path | None = None) -> None:
+    """Removes every cached structure.
+
+    Only the arrays of the entries are removed, along with the directories
+    they leave empty, so anything else in the cache directory is kept.
+
+    Args:
+        directory: The cache directory. If not provided, the enabled
+            directory or `DEFAULT_DIRECTORY` is used.
+    """
+    directory = directory or get_directory() or DEFAULT_DIRECTORY
+    emptied: set[pathlib.Path] = set()
+    for filepath in directory.glob("*/day_[0-9][0-9]/*/*/*.npy"):
+        filepath.unlink(missing_ok=True)
+        emptied.update(filepath.parents[:4])  # The entry up to its version
+
+    for path in sorted(emptied, key=lambda path: len(path.parts), reverse=True):
+        with contextlib.suppress(OSError):  # Not empty
+            path.rmdir()
+
+
+@functools.cache
+def version() -> str:
+    """Gets the package version used to key the cache.
+
+    Returns:
+        The installed package version.
+    """
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("advent-of-code-2025")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _load(entry: pathlib.Path) -> Arrays | None:
+    """Loads the arrays of an entry.
+
+    Args:
+        entry: The entry directory.
+
+    Returns:
+        The memory-mapped arrays or None if the entry is missing or incomplete.
+    """
+    import numpy
+
+    names = {path.name for path in entry.glob("*.npy")}
+    count = min(names, default="").removesuffix(".npy").rpartition("-of-")[2]
+    if not count.isdecimal() or names != {
+        f"{i}-of-{count}.npy" for i in range(int(count))
+    }:
+        return None
+
+    try:
+        return tuple(
+            numpy.load(entry / f"{i}-of-{count}.npy", mmap_mode="r")
+            for i in range(int(count))
+        )
+    except FileNotFoundError:  # Removed since, see `clear`
+        return None
+
+
+def arrays(
+    name: str,
+) -> Callable[
+    [Callable[Concatenate[S, base.Input, P], Arrays]],
+    Callable[Concatenate[S, base.Input, P], Arrays],
+]:
+    """Caches the arrays built from an input on disk.
+
+    If the cache is disabled, the arrays are built as usual.
+
+    Args:
+        name: The name of the structure. Must be unique within the day.
+
+    Returns:
+        A decorator to cache the arrays built by a solver's method.
+    """
+
+    def decorator(
+        func: Callable[Concatenate[S, base.Input, P], Arrays],
+    ) -> Callable[Concatenate[S, base.Input, P], Arrays]:
+        @functools.wraps(func)
+        def wrapper(
+            self: S, filepath: base.Input, *args: P.args, **kwargs: P.kwargs
+        ) -> Arrays:
+            filepath = base.load(filepath)
+            directory = get_directory()
+            if directory is None:
+                return func(self, filepath, *args, **kwargs)
+
+            import shutil
+            import tempfile
+
+            import numpy
+
+            key = name
+            if args or kwargs:
+                arguments = repr((args, sorted(kwargs.items()))).encode()
+                key += "-" + hashlib.blake2b(arguments, digest_size=8).hexdigest()
+
+            entry = (
+                directory
+                / version()
+                / f"day_{self.day:0>2}"
+                / base.input_digest(filepath)
+                / key
+            )
+            stored = _load(entry)
+            if stored is not None:
+                return stored
+
+            shutil.rmtree(entry, ignore_errors=True)  # If incomplete
+            result = func(self, filepath, *args, **kwargs)
+
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            staging = pathlib.Path(tempfile.mkdtemp(dir=entry.parent))
+            for i, array in enumerate(result):
+                numpy.save(staging / f"{i}-of-{len(result)}.npy", array)
+
+            try:
+                staging.rename(entry)
+            except OSError:  # Another process stored the entry first
+                shutil.rmtree(staging, ignore_errors=True)
+
+            return result
+
+        return wrapper
+
+    return decorator
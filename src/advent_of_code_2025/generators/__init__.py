@@ -0,0 +1,112 @@
+"""Seeded synthetic input generators, one per day.
+
+Run `solver generate <DAY> --size <SIZE>` to write a generated input.
+"""
+
+import argparse
+import dataclasses
+import importlib
+import pathlib
+import sys
+from typing import TYPE_CHECKING, Protocol, cast
+
+from .. import parse_day
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import TextIO
+
+
+class Generator(Protocol):
+    def __call__(self, size: int, seed: int = 0) -> Iterable[str]: ...
+
+
+@dataclasses.dataclass
+class Args:
+    day: str
+    size: int
+    seed: int
+    output: pathlib.Path | None
+
+
+def get_generator(day: str) -> Generator:
+    """Gets the input generator for the given day.
+
+    Args:
+        day: The two-digit day of the generator to get.
+
+    Returns:
+        The generator, which yields the input lines given a size and seed.
+    """
+    module = importlib.import_module(f".day_{day}", __name__)
+    return cast("Generator", module.generate)
+
+
+def write(day: str, size: int, file: TextIO, seed: int = 0) -> None:
+    """Writes a generated input.
+
+    Args:
+        day: The two-digit day to generate the input for.
+        size: The size of the input. See each day's generator.
+        file: The file to write to.
+        seed: The random seed.
+    """
+    file.writelines(f"{line}\n" for line in get_generator(day)(size, seed))
+
+
+def parse_args(argv: Sequence[str] | None = None) -> Args:
+    """Parses the CLI args.
+
+    Args:
+        argv: The CLI args. If not provided, `sys.argv` is used.
+
+    Returns:
+        The parsed args.
+    """
+    parser = argparse.ArgumentParser(
+        prog="solver generate", description="Advent of code 2025 input generator."
+    )
+
+    _ = parser.add_argument(
+        "day",
+        type=parse_day,
+        help="The day to generate an input for.",
+    )
+    _ = parser.add_argument(
+        "--size",
+        "-n",
+        type=int,
+        default=1000,
+        help="The size of the input, usually the number of lines.",
+    )
+    _ = parser.add_argument(
+        "--seed",
+        "-s",
+        type=int,
+        default=0,
+        help="The random seed.",
+    )
+    _ = parser.add_argument(
+        "--output",
+        "-o",
+        type=pathlib.Path,
+        help="Path to write the input to. Defaults to stdout.",
+    )
+
+    args = parser.parse_args(argv)
+    return Args(
+        day=cast("str", args.day),
+        size=cast("int", args.size),
+        seed=cast("int", args.seed),
+        output=cast("pathlib.Path | None", args.output),
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.output is None:
+        write(args.day, args.size, sys.stdout, args.seed)
+        return
+
+    with open(args.output, "w", encoding=sys.getdefaultencoding()) as file:
+        write(args.day, args.size, file, args.seed)
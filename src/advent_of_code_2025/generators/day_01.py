@@ -0,0 +1,22 @@
+"""Day 1 input generator."""
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(size: int, seed: int = 0) -> Generator[str]:
+    """Generates a rotation log.
+
+    Args:
+        size: The number of rotations.
+        seed: The random seed.
+
+    Yields:
+        A rotation, e.g. `L68`.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield f"{rng.choice('LR')}{rng.randint(1, 999)}"
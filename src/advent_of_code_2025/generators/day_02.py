@@ -0,0 +1,33 @@
+"""Day 2 input generator."""
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(size: int, seed: int = 0) -> Generator[str]:
+    """Generates a list of disjoint ID ranges.
+
+    The ranges are shuffled and their widths and gaps span several orders
+    of magnitude.
+
+    Args:
+        size: The number of ranges.
+        seed: The random seed.
+
+    Yields:
+        The comma separated ranges on a single line, e.g. `11-22,95-115`.
+    """
+    rng = random.Random(seed)
+    ranges: list[str] = []
+    start = 1
+    for _ in range(size):
+        start += int(10 ** rng.uniform(0, 6))
+        end = start + int(10 ** rng.uniform(0, 5))
+        ranges.append(f"{start}-{end}")
+        start = end + 1
+
+    rng.shuffle(ranges)
+    yield ",".join(ranges)
@@ -0,0 +1,23 @@
+"""Day 3 input generator."""
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(size: int, seed: int = 0, width: int = 100) -> Generator[str]:
+    """Generates banks of batteries.
+
+    Args:
+        size: The number of banks.
+        seed: The random seed.
+        width: The number of batteries in each bank.
+
+    Yields:
+        A bank of battery joltages, e.g. `987654321111111`.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield "".join(rng.choices("123456789", k=width))
@@ -0,0 +1,26 @@
+"""Day 4 input generator."""
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(
+    size: int, seed: int = 0, width: int = 140, density: float = 0.6
+) -> Generator[str]:
+    """Generates a grid of paper rolls.
+
+    Args:
+        size: The number of rows.
+        seed: The random seed.
+        width: The number of columns.
+        density: The probability that a cell is a roll.
+
+    Yields:
+        A row of the grid, e.g. `..@@.@@@@.`.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield "".join("@" if rng.random() < density else "." for _ in range(width))
@@ -0,0 +1,29 @@
+"""Day 5 input generator."""
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(size: int, seed: int = 0, limit: int = 10**15) -> Generator[str]:
+    """Generates the fresh ingredient ranges followed by the available IDs.
+
+    Args:
+        size: The number of ranges and the number of IDs.
+        seed: The random seed.
+        limit: The largest ID.
+
+    Yields:
+        A range, e.g. `3-5`, a blank line and then an ID, e.g. `17`.
+    """
+    rng = random.Random(seed)
+    width = max(1, limit // max(size, 1))
+    for _ in range(size):
+        start = rng.randint(1, limit)
+        yield f"{start}-{min(limit, start + rng.randint(0, width))}"
+
+    yield ""
+    for _ in range(size):
+        yield str(rng.randint(1, limit))
@@ -0,0 +1,38 @@
+"""Day 6 input generator."""
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(size: int, seed: int = 0, rows: int = 4) -> Generator[str]:
+    """Generates a worksheet of problems.
+
+    Each problem is a column of numbers, each aligned either left or right
+    within the column, with its operator below.
+
+    Args:
+        size: The number of problems.
+        seed: The random seed.
+        rows: The number of numbers in each problem.
+
+    Yields:
+        A row of the worksheet, e.g. `123 328  51 64`, ending with
+        the operators, e.g. `*   +   *   +`.
+    """
+    rng = random.Random(seed)
+    lines: list[list[str]] = [[] for _ in range(rows + 1)]
+    for _ in range(size):
+        numbers = [str(rng.randint(1, 9999)) for _ in range(rows)]
+        width = max(len(number) for number in numbers)
+        for line, number in zip(lines, numbers, strict=False):  # Not the operators
+            line.append(
+                number.ljust(width) if rng.random() < 0.5 else number.rjust(width)
+            )
+
+        lines[-1].append(rng.choice("+*").ljust(width))
+
+    for line in lines:
+        yield " ".join(line)
@@ -0,0 +1,35 @@
+"""Day 7 input generator."""
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(
+    size: int, seed: int = 0, width: int = 141, density: float = 0.3
+) -> Generator[str]:
+    """Generates a tachyon manifold.
+
+    The start is centered in the first row and every other row may contain
+    splitters.
+
+    Args:
+        size: The number of rows.
+        seed: The random seed.
+        width: The number of columns.
+        density: The probability that a cell in a splitter row is a splitter.
+
+    Yields:
+        A row of the manifold, e.g. `.......S.......`.
+    """
+    rng = random.Random(seed)
+    empty = "." * width
+    for i in range(size):
+        if i == 0:
+            yield empty[: width // 2] + "S" + empty[width // 2 + 1 :]
+        elif i % 2:
+            yield empty
+        else:
+            yield "".join("^" if rng.random() < density else "." for _ in range(width))
@@ -0,0 +1,23 @@
+"""Day 8 input generator."""
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(size: int, seed: int = 0, limit: int = 100_000) -> Generator[str]:
+    """Generates the positions of junction boxes.
+
+    Args:
+        size: The number of junction boxes.
+        seed: The random seed.
+        limit: The exclusive upper bound of each coordinate.
+
+    Yields:
+        A position, e.g. `162,817,812`.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield ",".join(str(rng.randrange(limit)) for _ in range(3))
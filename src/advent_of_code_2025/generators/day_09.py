@@ -0,0 +1,59 @@
+"""Day 9 input generator."""
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(size: int, seed: int = 0, height: int = 100_000) -> Generator[str]:
+    """Generates the red tiles of a simple rectilinear polygon.
+
+    The polygon is made of columns, each with its own top and bottom, so that
+    the top and bottom edges form staircases that never cross.
+
+    Args:
+        size: The number of red tiles, rounded down to a multiple of 4.
+            At least 4 tiles are generated.
+        seed: The random seed.
+        height: The exclusive upper bound of the y coordinates. Must be at least 4.
+
+    Yields:
+        A red tile in clockwise order, e.g. `7,1`.
+    """
+    rng = random.Random(seed)
+    columns = max(1, size // 4)
+    middle = height // 2
+
+    xs = [0]
+    for _ in range(columns):
+        xs.append(xs[-1] + rng.randint(1, 100))
+
+    def heights(low: int, high: int) -> list[int]:
+        """Generates the column heights, with adjacent columns differing.
+
+        Args:
+            low: The smallest height.
+            high: The largest height. Must be larger than `low`.
+
+        Returns:
+            The height of each column.
+        """
+        result = [rng.randint(low, high)]
+        while len(result) < columns:
+            y = rng.randint(low, high - 1)
+            result.append(y + (y >= result[-1]))
+
+        return result
+
+    tops = heights(middle + 1, height - 1)
+    bottoms = heights(0, middle)
+
+    for i, top in enumerate(tops):
+        yield f"{xs[i]},{top}"
+        yield f"{xs[i + 1]},{top}"
+
+    for i in reversed(range(columns)):
+        yield f"{xs[i + 1]},{bottoms[i]}"
+        yield f"{xs[i]},{bottoms[i]}"
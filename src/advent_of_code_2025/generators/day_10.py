@@ -0,0 +1,54 @@
+"""Day 10 input generator."""
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(
+    size: int, seed: int = 0, max_lights: int = 10, max_presses: int = 20
+) -> Generator[str]:
+    """Generates machines whose indicator lights and joltages are reachable.
+
+    Args:
+        size: The number of machines.
+        seed: The random seed.
+        max_lights: The largest number of indicator lights in a machine.
+        max_presses: The largest number of times a button is pressed to
+            make the joltage requirements.
+
+    Yields:
+        A machine, e.g. `[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}`.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        lights = rng.randint(2, max_lights)
+        buttons = [
+            sorted(rng.sample(range(lights), rng.randint(1, lights)))
+            for _ in range(rng.randint(2, lights + 3))
+        ]
+        # Every light must be wired to a button
+        for light in set(range(lights)).difference(*buttons):
+            buttons[rng.randrange(len(buttons))].append(light)
+
+        indicator = 0
+        while indicator == 0:
+            for button in rng.sample(buttons, rng.randint(1, len(buttons))):
+                for light in button:
+                    indicator ^= 1 << light
+
+        joltages = [0] * lights
+        for button in buttons:
+            presses = rng.randint(0, max_presses)
+            for light in button:
+                joltages[light] += presses
+
+        yield " ".join(
+            [
+                "[" + "".join(".#"[indicator >> i & 1] for i in range(lights)) + "]",
+                *("(" + ",".join(str(x) for x in sorted(b)) + ")" for b in buttons),
+                "{" + ",".join(str(x) for x in joltages) + "}",
+            ]
+        )
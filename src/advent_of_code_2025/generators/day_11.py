@@ -0,0 +1,65 @@
+"""Day 11 input generator."""
+
+import itertools
+import math
+import random
+import string
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(
+    size: int,
+    seed: int = 0,
+    max_outputs: int = 3,
+    window: int = 20,
+    you_distance: int = 40,
+) -> Generator[str]:
+    """Generates a directed acyclic graph of devices.
+
+    The devices are placed in a random order with `svr` at the start,
+    `fft` and `dac` in between and `out` at the end. Each device connects to
+    the next device and others up to `window` places after it, so every device
+    reaches every later device.
+    The number of paths grows exponentially with the distance between devices,
+    so `you` is placed `you_distance` places before `out`.
+
+    Args:
+        size: The number of devices with outputs, i.e. lines. At least 4.
+        seed: The random seed.
+        max_outputs: The largest number of outputs of a device.
+        window: How far ahead a device may connect.
+        you_distance: How many places `you` is before `out`.
+
+    Yields:
+        A device and its outputs, e.g. `aaa: you hhh`.
+    """
+    rng = random.Random(seed)
+    special = {"svr", "you", "fft", "dac", "out"}
+    length = max(3, math.ceil(math.log(size + len(special), 26)))
+    names = (
+        "".join(letters)
+        for letters in itertools.product(string.ascii_lowercase, repeat=length)
+    )
+    nodes = [
+        "svr",
+        *itertools.islice(
+            (name for name in names if name not in special), max(size - 4, 0)
+        ),
+    ]
+    for name in ("fft", "dac"):
+        nodes.insert(rng.randint(1, len(nodes)), name)
+
+    nodes.insert(max(1, len(nodes) + 1 - you_distance), "you")
+    nodes.append("out")
+    for i, node in enumerate(nodes[:-1]):
+        # Connecting to the next device makes every later device reachable
+        ahead = nodes[i + 2 : i + 1 + window]
+        outputs = [
+            nodes[i + 1],
+            *rng.sample(ahead, min(len(ahead), rng.randint(0, max_outputs - 1))),
+        ]
+        rng.shuffle(outputs)
+        yield f"{node}: {' '.join(outputs)}"
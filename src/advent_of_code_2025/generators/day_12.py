@@ -0,0 +1,44 @@
+"""Day 12 input generator."""
+
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+def generate(
+    size: int, seed: int = 0, shapes: int = 6, max_side: int = 50
+) -> Generator[str]:
+    """Generates the present shapes followed by the regions under the trees.
+
+    Args:
+        size: The number of regions.
+        seed: The random seed.
+        shapes: The number of present shapes.
+        max_side: The largest width or length of a region.
+
+    Yields:
+        A line of a shape, e.g. `##.`, and then a region with the number of
+        presents of each shape, e.g. `12x5: 1 0 1 0 2 2`.
+    """
+    rng = random.Random(seed)
+    for i in range(shapes):
+        yield f"{i}:"
+        cells = [True] * 7 + [False] * 2
+        rng.shuffle(cells)
+        for row in range(3):
+            yield "".join("#" if cell else "." for cell in cells[row * 3 : row * 3 + 3])
+
+        yield ""
+
+    for _ in range(size):
+        width = rng.randint(3, max_side)
+        length = rng.randint(3, max_side)
+        # Around the number of presents that fit, so either answer is common
+        presents = rng.randint(0, width * length // 7)
+        counts = [0] * shapes
+        for _ in range(presents):
+            counts[rng.randrange(shapes)] += 1
+
+        yield f"{width}x{length}: {' '.join(str(x) for x in counts)}"
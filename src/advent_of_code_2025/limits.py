@@ -0,0 +1,298 @@
+"""This module contains the time and memory limits of solving.
+
+Each input is solved in its own supervised worker process. The time limit of
+a phase is enforced by killing the worker. The memory limit caps the
+worker's address space, see `resource.RLIMIT_AS`, so the allocation that
+exceeds it raises `MemoryError`, or `ImportError` if it maps an extension
+module. Either way, the error reports the phases
+that were running.
+
+The limits apply to each top-level phase, i.e. the parse and each part.
+A limit is given for every day, a day or a day's part, e.g. `5`, `11=5` or
+`11.1=5`, with the most specific limit applying. The parse uses the day's
+limit.
+"""
+
+import argparse
+import errno
+import time
+from typing import TYPE_CHECKING, NamedTuple, cast, override
+
+from . import base, parse_day
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    import pathlib
+
+    Key = tuple[str | None, int | None]
+
+UNITS: dict[str, int] = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+class LimitExceededError(RuntimeError):
+    """A phase exceeded its time or memory limit."""
+
+    def __init__(self, kind: str, limit: float, phases: tuple[str, ...]) -> None:
+        """
+        A phase exceeded its time or memory limit.
+
+        Args:
+            kind: Either "time" or "memory".
+            limit: The limit in seconds or bytes.
+            phases: The names of the running phases, outermost first.
+        """
+        super().__init__(kind, limit, phases)
+        self.kind: str = kind
+        self.limit: float = limit
+        self.phases: tuple[str, ...] = phases
+
+    @override
+    def __str__(self) -> str:
+        phase = " > ".join(self.phases) or "startup"
+        if self.kind == "time":
+            limit = f"{self.limit:g} s"
+        else:
+            unit = max(
+                (unit for unit, size in UNITS.items() if size <= self.limit),
+                key=UNITS.__getitem__,
+            )
+            limit = (
+                f"{self.limit / UNITS[unit]:g} {unit}iB"
+                if unit
+                else f"{self.limit:g} B"
+            )
+
+        return f"{phase} exceeded the {self.kind} limit of {limit}"
+
+
+def parse_key(x: str) -> Key:
+    """Parses the day and part a limit applies to.
+
+    Args:
+        x: Either empty for every day, a day or a day and part, e.g. `11.1`.
+
+    Returns:
+        The two-digit day, or None for every day, and the part, or None for
+        both parts.
+
+    Raises:
+        argparse.ArgumentTypeError: If the day or part is invalid.
+    """
+    if not x:
+        return None, None
+
+    day, separator, part = x.partition(".")
+    if separator and part not in ("1", "2"):
+        raise argparse.ArgumentTypeError(f"The part must be 1 or 2. Got: {part}")
+
+    return parse_day(day), int(part) if separator else None
+
+
+def parse_time_limit(x: str) -> tuple[Key, float]:
+    """Parses a time limit, e.g. `11.1=5`.
+
+    Args:
+        x: The optional day and part, followed by the limit in seconds.
+
+    Returns:
+        The day and part the limit applies to, and the limit.
+
+    Raises:
+        argparse.ArgumentTypeError: If the limit is invalid.
+    """
+    key, _, value = x.rpartition("=")
+    try:
+        limit = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"The time limit must be a number of seconds. Got: {value}"
+        ) from None
+
+    if limit <= 0:
+        raise argparse.ArgumentTypeError(f"The time limit must be positive. Got: {x}")
+
+    return parse_key(key), limit
+
+
+def parse_memory_limit(x: str) -> tuple[Key, int]:
+    """Parses a memory limit, e.g. `10=512M`.
+
+    Args:
+        x: The optional day and part, followed by the limit in bytes with an
+            optional binary unit, one of K, M, G or T.
+
+    Returns:
+        The day and part the limit applies to, and the limit in bytes.
+
+    Raises:
+        argparse.ArgumentTypeError: If the limit is invalid.
+    """
+    key, _, value = x.rpartition("=")
+    value = value.upper().removesuffix("B").removesuffix("I")
+    unit = value[-1:] if value[-1:] in UNITS else ""
+    number = value.removesuffix(unit)
+    if not number.isdecimal() or not int(number):
+        raise argparse.ArgumentTypeError(
+            f"The memory limit must be a positive size, e.g. 512M. Got: {x}"
+        )
+
+    return parse_key(key), int(number) * UNITS[unit]
+
+
+class Limits(NamedTuple):
+    """The time and memory limits of each day and part."""
+
+    time: dict[Key, float]
+    memory: dict[Key, int]
+
+    def get(self, kind: str, day: str, phase: str) -> float | None:
+        """Gets the limit of a phase.
+
+        Args:
+            kind: Either "time" or "memory".
+            day: The two-digit day.
+            phase: The name of the top-level phase.
+
+        Returns:
+            The most specific limit or None if the phase is unlimited.
+        """
+        limits: dict[Key, float] = self.time if kind == "time" else self.memory
+        part = int(phase[-1]) if phase in ("part_1", "part_2") else None
+        for key in ((day, part), (day, None), (None, None)):
+            if key in limits:
+                return limits[key]
+
+        return None
+
+
+def _work(
+    connection: Connection,
+    solver: type[base.Solver],
+    source: pathlib.Path | bytes,
+    limits: Limits,
+    trace_memory: bool,
+) -> None:
+    """Solves an input, sending the running phases and the outcome.
+
+    This is a module level function so that it can be sent to the worker.
+
+    Args:
+        connection: The connection to the supervisor.
+        solver: The solver class.
+        source: The loaded input.
+        limits: The limits.
+        trace_memory: Whether to measure the peak memory of each phase.
+    """
+    import pickle
+    import resource
+
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    instance = solver()
+    day = f"{instance.day:0>2}"
+    running: tuple[str, ...] = ()
+
+    def listener(names: tuple[str, ...]) -> None:
+        nonlocal running
+
+        running = names
+        if len(names) == 1:
+            limit = limits.get("memory", day, names[0])
+            resource.setrlimit(
+                resource.RLIMIT_AS, (hard if limit is None else int(limit), hard)
+            )
+
+        connection.send(names)
+
+    try:
+        with base.recording(listener=listener):
+            outcome = instance.solve(source, trace_memory=trace_memory, verbose=False)
+    except (ImportError, *base.SOLVER_ERRORS) as e:
+        resource.setrlimit(resource.RLIMIT_AS, (hard, hard))
+        limit = limits.get("memory", day, running[0]) if running else None
+        # A deferred import, e.g. of numpy, fails to map its shared objects
+        # once the address space is capped.
+        if limit is not None and (
+            isinstance(e, MemoryError)
+            or (isinstance(e, OSError) and e.errno == errno.ENOMEM)
+            or (isinstance(e, ImportError) and not isinstance(e, ModuleNotFoundError))
+        ):
+            outcome = LimitExceededError("memory", limit, running)
+        elif isinstance(e, ImportError):
+            raise
+        else:
+            outcome = e
+
+    try:
+        connection.send(outcome)
+    except pickle.PicklingError, AttributeError, TypeError:  # Not picklable
+        connection.send(RuntimeError(f"{type(outcome).__name__}: {outcome}"))
+
+
+def supervise(
+    solver: type[base.Solver],
+    source: pathlib.Path | bytes,
+    trace_memory: bool = False,
+    limits: Limits | None = None,
+) -> base.Results:
+    """Solves an input in a supervised worker process.
+
+    Args:
+        solver: The solver class.
+        source: The loaded input. See `base.load`.
+        trace_memory: Whether to measure the peak memory of each phase.
+        limits: The limits. If not provided, the phases are unlimited.
+
+    Returns:
+        The answers and the metrics of each phase.
+
+    Raises:
+        LimitExceededError: If a phase exceeded its limit.
+        RuntimeError: If the worker died without an outcome.
+    """
+    import multiprocessing
+
+    limits = limits or Limits({}, {})
+    day = f"{solver().day:0>2}"
+    context = multiprocessing.get_context()
+    receiver, sender = context.Pipe(duplex=False)
+    worker = context.Process(
+        target=_work,
+        args=(sender, solver, source, limits, trace_memory),
+        daemon=True,
+    )
+    worker.start()
+    sender.close()
+
+    running: tuple[str, ...] = ()
+    limit: float | None = None
+    deadline: float | None = None
+    try:
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not receiver.poll(timeout):
+                assert limit is not None
+                raise LimitExceededError("time", limit, running)
+
+            try:
+                message = receiver.recv()
+            except EOFError:
+                worker.join()
+                raise RuntimeError(
+                    f"The worker exited with code {worker.exitcode} while running "
+                    f"{' > '.join(running) or 'startup'}"
+                ) from None
+
+            match message:
+                case base.Results():
+                    return message
+                case tuple():
+                    running = cast("tuple[str, ...]", message)
+                    if len(running) <= 1:
+                        limit = limits.get("time", day, running[0]) if running else None
+                        deadline = None if limit is None else time.monotonic() + limit
+                case _:
+                    raise cast("Exception", message)
+    finally:
+        worker.kill()
+        worker.join()
+        receiver.close()
@@ -0,0 +1,240 @@
+"""This module contains the parallel map-reduce engine for line-independent days.
+
+The input is split into byte ranges of whole lines. Each range is mapped to a
+partial result in a worker, which memory-maps the input itself, and the
+partial results are reduced in input order. The workers are shared by every
+call of the run, see `get_pool`. Calls within the runner's workers map
+serially instead, see `mark_worker`.
+"""
+
+import functools
+import operator
+import os
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+from . import base
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    import concurrent.futures
+    import pathlib
+
+CHUNK_SIZE: int = 1 << 20
+
+_pools: dict[tuple[str, int, int], concurrent.futures.Executor] = {}
+_pools_lock = threading.Lock()
+_in_worker: bool = False
+
+
+def free_threaded() -> bool:
+    """Checks whether the GIL is disabled.
+
+    Returns:
+        True if threads run Python code in parallel.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def default_executor() -> str:
+    """Gets the executor that runs Python code in parallel.
+
+    Returns:
+        "thread" on free-threaded builds, otherwise "process".
+    """
+    return "thread" if free_threaded() else "process"
+
+
+def get_pool(executor: str, jobs: int) -> concurrent.futures.Executor:
+    """Gets the pool of workers shared by the calls of this process.
+
+    The pool is made on first use and kept for the rest of the run, so each
+    call does not pay for starting the workers. A forked worker makes its own
+    pool rather than use its parent's. The pools are shut down at exit, or
+    by `shutdown`.
+
+    Args:
+        executor: The executor type. See `runner.make_executor`.
+        jobs: The number of workers.
+
+    Returns:
+        The pool.
+    """
+    key = executor, jobs, os.getpid()
+    with _pools_lock:
+        if key not in _pools:
+            from .runner import make_executor
+
+            _pools[key] = make_executor(executor, jobs)
+
+        return _pools[key]
+
+
+def mark_worker() -> None:
+    """Marks this process as a worker of the runner, so its calls map serially.
+
+    The runner already spreads its tasks across its workers, so a pool in
+    each worker would start a worker per CPU per worker, regardless of the
+    runner's number of jobs. See `runner.make_executor`.
+    """
+    global _in_worker
+    _in_worker = True
+
+
+def shutdown() -> None:
+    """Shuts down the pools of this process, waiting for their workers."""
+    with _pools_lock:
+        pools = [_pools.pop(key) for key in list(_pools) if key[-1] == os.getpid()]
+
+    for pool in pools:
+        pool.shutdown()
+
+
+def map_chunk[R](
+    mapper: Callable[[Iterable[memoryview]], R],
+    source: pathlib.Path | bytes,
+    start: int = 0,
+    end: int | None = None,
+) -> R:
+    """Maps the lines within a byte range to a partial result.
+
+    This is a module level function so that it can be sent to the workers.
+
+    Args:
+        mapper: Maps the lines, without their line endings, to a partial result.
+        source: The loaded input. See `base.load`.
+        start: The start of the byte range.
+        end: The end of the byte range, exclusive. If not provided, the end
+            of the input.
+
+    Returns:
+        The partial result.
+    """
+    with base.MappedInput(source) as mapped:
+        return mapper(mapped.lines(start, end))
+
+
+def _map_chunk_counting[R](
+    mapper: Callable[[Iterable[memoryview]], R],
+    source: pathlib.Path | bytes,
+    start: int = 0,
+    end: int | None = None,
+) -> tuple[R, dict[str, int]]:
+    """Maps the lines within a byte range, counting the work done.
+
+    See `map_chunk` and `base.count`.
+
+    Returns:
+        The partial result and the counts.
+    """
+    with base.counting() as counters:
+        result = map_chunk(mapper, source, start, end)
+
+    return result, dict(counters)
+
+
+def map_reduce[R](
+    source: base.Input,
+    mapper: Callable[[Iterable[memoryview]], R],
+    reducer: Callable[[R, R], R],
+    jobs: int | None = None,
+    executor: str | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> R:
+    """Maps chunks of lines to partial results in parallel and reduces them.
+
+    Inputs smaller than two chunks are mapped in this process, as starting
+    the workers would cost more than it saves, as are the calls within the
+    runner's workers, see `mark_worker`. The work counted by the
+    workers is added to this thread's counts, see `base.count`.
+
+    Args:
+        source: The input. See `base.load`.
+        mapper: Maps the lines of a chunk, without their line endings, to a
+            partial result. Must be picklable to run in processes, e.g. a
+            module level function or a `functools.partial` of one.
+        reducer: Combines two partial results. It is applied in input order,
+            so it only needs to be associative.
+        jobs: The number of workers of the shared pool, see `get_pool`. If
+            not provided, the number of CPUs is used.
+        executor: The executor type. One of `advent_of_code_2025.EXECUTORS`.
+            If not provided, see `default_executor`.
+        chunk_size: The minimum number of bytes per chunk.
+
+    Returns:
+        The reduced result.
+    """
+    source = base.load(source)
+    jobs = jobs or os.process_cpu_count() or 1
+    executor = "serial" if _in_worker else executor or default_executor()
+
+    with base.MappedInput(source) as mapped:
+        count = min(jobs, len(mapped) // max(chunk_size, 1))
+        ranges = list(mapped.ranges(count)) if count > 1 else []
+
+    if len(ranges) < 2 or executor == "serial":
+        return map_chunk(mapper, source)
+
+    if isinstance(source, bytes):  # Only send each worker its own chunk
+        sources = [source[start:end] for start, end in ranges]
+        ranges = [(0, len(chunk)) for chunk in sources]
+    else:
+        sources = [source] * len(ranges)
+
+    pool = get_pool(executor, jobs)
+    args = [mapper] * len(ranges), sources, *zip(*ranges, strict=True)
+    if not base.counting_enabled():
+        return functools.reduce(reducer, pool.map(map_chunk, *args))
+
+    outcomes = list(pool.map(_map_chunk_counting, *args))
+
+    for _, counters in outcomes:
+        for name, amount in counters.items():
+            base.count(name, amount)
+
+    return functools.reduce(reducer, (partial for partial, _ in outcomes))
+
+
+def _sum_lines(func: Callable[[memoryview], int], lines: Iterable[memoryview]) -> int:
+    """Sums a function over the lines.
+
+    Args:
+        func: The function of a line.
+        lines: The lines.
+
+    Returns:
+        The sum.
+    """
+    return sum(func(line) for line in lines)
+
+
+def sum_lines(
+    source: base.Input,
+    func: Callable[[memoryview], int],
+    jobs: int | None = None,
+    executor: str | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """Sums a function over the lines of an input in parallel.
+
+    Args:
+        source: The input. See `base.load`.
+        func: The function of a line, without its line ending. Must be
+            picklable to run in processes.
+        jobs: The maximum number of workers. See `map_reduce`.
+        executor: The executor type. See `map_reduce`.
+        chunk_size: The minimum number of bytes per chunk.
+
+    Returns:
+        The sum.
+    """
+    return map_reduce(
+        source,
+        functools.partial(_sum_lines, func),
+        operator.add,
+        jobs,
+        executor,
+        chunk_size,
+    )
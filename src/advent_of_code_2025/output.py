@@ -0,0 +1,114 @@
+"""This module contains the machine-readable output of the results.
+
+Each phase of solving an input is a record with:
+    - `day`: The day.
+    - `part`: The part for the `part_1` and `part_2` phases, otherwise null.
+    - `phase`: The name of the phase, e.g. "parse", "part_1" or a phase marked
+        by the solver, which is nested within another phase.
+    - `answer`: The answer of the part, otherwise null.
+    - `error`: The exception raised while solving, otherwise null.
+        A failed input has a single record without a phase.
+    - `input`: The input path, `-` for stdin.
+    - `input_hash`: The blake2b hex digest of the input's contents.
+    - `wall_time`/`cpu_time`: The wall and CPU time of the phase in seconds.
+    - `peak_memory`: The peak memory allocated by the phase in bytes, or null
+        if memory was not traced.
+    - `counters`: The work counted by the solver within the phase, e.g.
+        `{"states_expanded": 42}`. See `base.count`.
+"""
+
+import json
+import sys
+from typing import IO, TYPE_CHECKING
+
+from . import base
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    Record = dict[str, object]
+
+
+def make_records(
+    day: str,
+    outcome: base.Results | Exception,
+    name: str,
+    source: base.Input,
+) -> list[Record]:
+    """Makes the records of solving an input.
+
+    Args:
+        day: The day.
+        outcome: Either the results or the exception raised while solving.
+        name: The name of the input, e.g. its path.
+        source: The input, to hash.
+
+    Returns:
+        The record of each phase, in the order the phases finished, or a
+        single record of the error.
+    """
+    try:
+        digest = base.input_digest(source)
+    except OSError:
+        digest = None
+
+    def record(
+        part: int | None = None,
+        phase: base.Phase | None = None,
+        answer: int | str | None = None,
+        error: str | None = None,
+    ) -> Record:
+        return {
+            "day": int(day),
+            "part": part,
+            "phase": phase and phase.name,
+            "answer": answer,
+            "error": error,
+            "input": name,
+            "input_hash": digest,
+            "wall_time": phase and phase.wall,
+            "cpu_time": phase and phase.cpu,
+            "peak_memory": phase and phase.peak,
+            "counters": phase and phase.counters,
+        }
+
+    if isinstance(outcome, Exception):
+        return [record(error=f"{type(outcome).__name__}: {outcome}")]
+
+    answers = {"part_1": outcome.part_1, "part_2": outcome.part_2}
+    return [
+        record(
+            int(phase.name[-1]) if phase.name in answers else None,
+            phase,
+            answers.get(phase.name),
+        )
+        for phase in outcome.phases
+    ]
+
+
+def write(
+    records: Iterable[Record], output_format: str, file: IO[str] | None = None
+) -> None:
+    """Writes the records.
+
+    Args:
+        records: The records.
+        output_format: Either "json", writing a single array once every
+            record is made, or "ndjson", writing each record on its own line
+            as soon as it is made.
+        file: The file to write to. If not provided, stdout is used.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    file = file or sys.stdout
+    match output_format:
+        case "json":
+            json.dump(list(records), file, indent=2)
+            _ = file.write("\n")
+        case "ndjson":
+            for record in records:
+                _ = file.write(json.dumps(record) + "\n")
+                file.flush()
+        case _:
+            raise ValueError(f"Unsupported format: {output_format}")
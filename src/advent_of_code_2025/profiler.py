@@ -1,12 +1,20 @@
 """This module contains the profiler wrapper."""
 
+import collections
+import contextlib
 import cProfile
 import functools
 import io
 import pstats
-from typing import TYPE_CHECKING, ParamSpec, TypeVar
+import sys
+import threading
+import tracemalloc
+from typing import TYPE_CHECKING, ParamSpec, Self, TypeVar
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+    import pathlib
+    from types import FrameType, TracebackType
     from typing import Callable
 
 P = ParamSpec("P")
@@ -37,3 +45,163 @@ def profile(func: Callable[P, R]) -> Callable[P, R]:
         return result
 
     return wrapper
+
+
+class Sampler:
+    """Sampling profiler that records the stacks of a thread.
+
+    A background thread samples the profiled thread's stack at a fixed
+    interval, so the overhead does not depend on the number of calls made.
+    """
+
+    def __init__(self, interval: float = 0.001, thread_id: int | None = None) -> None:
+        """
+        Sampling profiler that records the stacks of a thread.
+
+        Args:
+            interval: The time between samples in seconds.
+            thread_id: The thread to sample. If not provided, the thread
+                entering the sampler is sampled.
+        """
+        self.interval: float = interval
+        self.thread_id: int | None = thread_id
+        self.stacks: collections.Counter[str] = collections.Counter()
+        self._stop: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def _label(frame: FrameType) -> str:
+        """Labels a frame.
+
+        Args:
+            frame: The frame to label.
+
+        Returns:
+            The frame's function, file and line of definition.
+        """
+        code = frame.f_code
+        return f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})"
+
+    def _sample(self) -> None:
+        """Samples the stack until stopped."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id or 0)  # noqa: SLF001
+            stack: list[str] = []
+            while frame is not None:
+                stack.append(self._label(frame))
+                frame = frame.f_back
+
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self) -> Self:
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def collapsed(self) -> str:
+        """Formats the samples as collapsed stacks.
+
+        Each line is a semicolon separated stack, outermost frame first,
+        followed by its sample count. Flamegraph tools, such as
+        `flamegraph.pl` and speedscope, read this format.
+
+        Returns:
+            The collapsed stacks.
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+@contextlib.contextmanager
+def profiling(
+    profiler: str,
+    name: str,
+    output: pathlib.Path | None = None,
+    interval: float = 0.001,
+) -> Generator[None]:
+    """Profiles the code run within the context.
+
+    The report is written to `output` if provided, otherwise it is printed
+    to stderr:
+        - cprofile: The stats, saved as `<name>.pstats`.
+        - sample: The collapsed stacks, saved as `<name>.folded`.
+        - tracemalloc: The top allocations and the peak memory, with the
+            snapshot saved as `<name>.tracemalloc`.
+
+    Args:
+        profiler: The profiler to use. One of `advent_of_code_2025.PROFILERS`.
+        name: The name of the profiled code.
+        output: The directory to save the report to.
+        interval: The time between samples in seconds of the sampling profiler.
+
+    Yields:
+        Nothing, the profiled code runs within the context.
+
+    Raises:
+        ValueError: If the profiler is not supported.
+    """
+    if output is not None:
+        output.mkdir(parents=True, exist_ok=True)
+
+    match profiler:
+        case "cprofile":
+            with cProfile.Profile() as pr:
+                yield
+
+            if output is not None:
+                pr.dump_stats(output / f"{name}.pstats")
+                return
+
+            print(f"Profile: {name}", file=sys.stderr)
+            ps = pstats.Stats(pr, stream=sys.stderr)
+            _ = ps.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(25)
+        case "sample":
+            with Sampler(interval) as sampler:
+                yield
+
+            if output is not None:
+                _ = (output / f"{name}.folded").write_text(
+                    sampler.collapsed(), encoding=sys.getdefaultencoding()
+                )
+                return
+
+            print(f"Profile: {name}", file=sys.stderr)
+            print(sampler.collapsed(), file=sys.stderr)
+        case "tracemalloc":
+            was_tracing = tracemalloc.is_tracing()
+            if not was_tracing:
+                tracemalloc.start(25)
+
+            tracemalloc.reset_peak()
+            try:
+                yield
+                _, peak = tracemalloc.get_traced_memory()
+                snapshot = tracemalloc.take_snapshot()
+            finally:
+                if not was_tracing:
+                    tracemalloc.stop()
+
+            if output is not None:
+                snapshot.dump(str(output / f"{name}.tracemalloc"))
+                return
+
+            print(f"Profile: {name}", file=sys.stderr)
+            print(f"Peak memory: {peak / 2**20:.3f} MiB", file=sys.stderr)
+            for stat in snapshot.statistics("lineno")[:25]:
+                print(stat, file=sys.stderr)
+        case _:
+            raise ValueError(f"Unsupported profiler: {profiler}")
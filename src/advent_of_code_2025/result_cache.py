@@ -0,0 +1,315 @@
+"""This module contains the opt-in cache of answers.
+
+The cache is enabled by setting `ENVIRONMENT_VARIABLE` to `1`, which uses
+`DEFAULT_PATH`, or to the database path. Being an environment variable, the
+setting is inherited by worker processes.
+
+Each answer is keyed by the day, the solver's class, the part, the content
+hash of the input, the extra arguments of the part and a fingerprint of the
+code the day depends on, so the engines of a day do not share answers and
+editing a solver or a shared module, e.g. `base`, invalidates its answers.
+The least recently used answers are evicted once there are more than
+`MAX_ENTRIES`.
+"""
+
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import pathlib
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from . import base
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    import sqlite3
+
+ENVIRONMENT_VARIABLE: str = "ADVENT_OF_CODE_2025_RESULT_CACHE"
+DEFAULT_PATH: pathlib.Path = (
+    pathlib.Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    / "advent_of_code_2025"
+    / "results.sqlite3"
+)
+MAX_ENTRIES: int = 10_000
+
+SCHEMA_VERSION: int = 2  # Databases of other versions are rebuilt
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS answers (
+    day TEXT NOT NULL,
+    solver TEXT NOT NULL,
+    part INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (day, solver, part, digest, arguments, fingerprint)
+)
+"""
+
+Key = tuple[str, str, int, str, str, str]
+
+
+def get_path() -> pathlib.Path | None:
+    """Gets the database path.
+
+    Returns:
+        The database path if the cache is enabled, otherwise None.
+    """
+    value = os.environ.get(ENVIRONMENT_VARIABLE, "")
+    if value in ("", "0"):
+        return None
+
+    if value == "1":
+        return DEFAULT_PATH
+
+    return pathlib.Path(value).expanduser()
+
+
+def enable(path: pathlib.Path | None = None) -> None:
+    """Enables the cache.
+
+    Args:
+        path: The database path. If not provided, `DEFAULT_PATH` is used.
+    """
+    os.environ[ENVIRONMENT_VARIABLE] = str(path) if path else "1"
+
+
+def disable() -> None:
+    """Disables the cache."""
+    os.environ[ENVIRONMENT_VARIABLE] = "0"
+
+
+@contextlib.contextmanager
+def disabled() -> Generator[None]:
+    """Disables the cache within the context, e.g. while timing the solvers.
+
+    Yields:
+        Nothing, the cache is restored to its previous setting on exit.
+    """
+    previous = os.environ.get(ENVIRONMENT_VARIABLE)
+    disable()
+    try:
+        yield
+    finally:
+        if previous is None:
+            _ = os.environ.pop(ENVIRONMENT_VARIABLE, None)
+        else:
+            os.environ[ENVIRONMENT_VARIABLE] = previous
+
+
+def clear(path: pathlib.Path | None = None) -> None:
+    """Removes every cached answer.
+
+    Args:
+        path: The database path. If not provided, the enabled path or
+            `DEFAULT_PATH` is used.
+    """
+    path = path or get_path() or DEFAULT_PATH
+    for suffix in ("", "-wal", "-shm"):
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def connect(path: pathlib.Path) -> sqlite3.Connection:
+    """Connects to the database, creating or rebuilding it if needed.
+
+    Args:
+        path: The database path.
+
+    Returns:
+        The connection, which must be closed.
+    """
+    import sqlite3
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30, autocommit=True)
+    _ = connection.execute("PRAGMA journal_mode=WAL")
+    _ = connection.execute("BEGIN IMMEDIATE")  # One process rebuilds it
+    try:
+        (version,) = connection.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            _ = connection.execute("DROP TABLE IF EXISTS answers")
+            _ = connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        _ = connection.execute(SCHEMA)
+        _ = connection.execute("COMMIT")
+    except sqlite3.Error:
+        connection.close()  # Rolls back the transaction
+        raise
+
+    return connection
+
+
+def source_files(solver: type[base.Solver]) -> list[pathlib.Path]:
+    """Gets the source files a solver's answers depend on.
+
+    Args:
+        solver: The solver class.
+
+    Returns:
+        The day package's modules and the package's shared modules, e.g.
+        `base`, `mapreduce` and `disk_cache`.
+    """
+    module = sys.modules[solver.__module__]
+    if module.__file__ is None:
+        return []
+
+    day_package = pathlib.Path(module.__file__).parent
+    return sorted([*day_package.parent.glob("*.py"), *day_package.glob("*.py")])
+
+
+@functools.cache
+def fingerprint(solver: type[base.Solver]) -> str:
+    """Hashes the code a solver's answers depend on. See `source_files`.
+
+    Args:
+        solver: The solver class.
+
+    Returns:
+        The hex digest of the source files.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for filepath in source_files(solver):
+        digest.update(filepath.name.encode())
+        digest.update(filepath.read_bytes())
+
+    return digest.hexdigest()
+
+
+def make_key(
+    solver: base.Solver,
+    part: int,
+    source: pathlib.Path | bytes,
+    args: tuple[object, ...] = (),
+    kwargs: dict[str, object] | None = None,
+) -> Key:
+    """Makes the key of an answer.
+
+    Args:
+        solver: The solver.
+        part: The part.
+        source: The loaded input. See `base.load`.
+        args: The extra positional arguments of the part.
+        kwargs: The extra keyword arguments of the part.
+
+    Returns:
+        The key.
+    """
+    return (
+        solver.day,
+        f"{type(solver).__module__}.{type(solver).__qualname__}",
+        part,
+        base.input_digest(source),
+        repr((args, sorted((kwargs or {}).items()))),
+        fingerprint(type(solver)),
+    )
+
+
+def get(path: pathlib.Path, key: Key) -> int | str | None:
+    """Gets a cached answer, marking it as recently used.
+
+    Args:
+        path: The database path.
+        key: The key of the answer.
+
+    Returns:
+        The answer or None if it is not cached.
+    """
+    connection = connect(path)
+    try:
+        row = connection.execute(
+            "UPDATE answers SET accessed = ? WHERE day = ? AND solver = ? "
+            "AND part = ? AND digest = ? AND arguments = ? AND fingerprint = ? "
+            "RETURNING answer",
+            (time.time(), *key),
+        ).fetchone()
+    finally:
+        connection.close()
+
+    if row is None:
+        return None
+
+    return json.loads(row[0])
+
+
+def put(
+    path: pathlib.Path,
+    key: Key,
+    answer: int | str,
+    max_entries: int = MAX_ENTRIES,
+) -> None:
+    """Caches an answer, evicting the least recently used answers.
+
+    Args:
+        path: The database path.
+        key: The key of the answer.
+        answer: The answer.
+        max_entries: The maximum number of answers to keep.
+    """
+    connection = connect(path)
+    try:
+        _ = connection.execute(
+            "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (*key, json.dumps(answer), time.time()),
+        )
+        _ = connection.execute(
+            "DELETE FROM answers WHERE rowid IN "
+            "(SELECT rowid FROM answers ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (max_entries,),
+        )
+    finally:
+        connection.close()
+
+
+def answer(
+    solver: base.Solver,
+    part: int,
+    source: pathlib.Path | bytes,
+    solve: Callable[[], int | str],
+    args: tuple[object, ...] = (),
+    kwargs: dict[str, object] | None = None,
+) -> int | str:
+    """Gets the answer of a part, solving it if it is not cached.
+
+    Args:
+        solver: The solver.
+        part: The part.
+        source: The loaded input. See `base.load`.
+        solve: Solves the part on a cache miss.
+        args: The extra positional arguments of the part.
+        kwargs: The extra keyword arguments of the part.
+
+    Returns:
+        The answer.
+    """
+    path = get_path()
+    if path is None:
+        return solve()
+
+    key = make_key(solver, part, source, args, kwargs)
+    result = get(path, key)
+    if result is None:
+        result = solve()
+        put(path, key, result)
+
+    return result
+
+
+def has_answers(solver: base.Solver, source: pathlib.Path | bytes) -> bool:
+    """Checks whether both parts of an input are cached without extra arguments.
+
+    Args:
+        solver: The solver.
+        source: The loaded input. See `base.load`.
+
+    Returns:
+        True if both answers are cached.
+    """
+    path = get_path()
+    return path is not None and all(
+        get(path, make_key(solver, part, source)) is not None for part in (1, 2)
+    )
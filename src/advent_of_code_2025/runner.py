@@ -0,0 +1,264 @@
+"""This module contains the runner for solving multiple days or inputs at once."""
+
+import concurrent.futures
+import functools
+from typing import TYPE_CHECKING
+
+from . import base, get_solver, mapreduce
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+    import pathlib
+
+    from .limits import Limits
+
+    Outcome = int | str | Exception
+
+PARTS: tuple[int, ...] = (1, 2)
+
+
+def solve_part(day: str, part: int, filepath: pathlib.Path) -> int | str:
+    """Solves a single part of a day.
+
+    This is a module level function so that it can be sent to the workers.
+
+    Args:
+        day: The two-digit day to solve.
+        part: The part to solve.
+        filepath: The path to the data file.
+
+    Returns:
+        The solution to the part.
+    """
+    solver = get_solver(day)()
+    return getattr(solver, f"part_{part}")(filepath)
+
+
+def make_executor(
+    executor: str, jobs: int | None = None
+) -> concurrent.futures.Executor:
+    """Makes the executor to run the solvers with.
+
+    The process and interpreter workers map serially, see
+    `mapreduce.mark_worker`.
+
+    Args:
+        executor: The executor type. One of `advent_of_code_2025.EXECUTORS`
+            excluding "serial".
+        jobs: The maximum number of workers. If not provided, the
+            executor's default is used.
+
+    Returns:
+        The executor.
+
+    Raises:
+        ValueError: If the executor type is not supported.
+    """
+    match executor:
+        case "process":
+            return concurrent.futures.ProcessPoolExecutor(
+                jobs, initializer=mapreduce.mark_worker
+            )
+        case "interpreter":
+            return concurrent.futures.InterpreterPoolExecutor(
+                jobs, initializer=mapreduce.mark_worker
+            )
+        case "thread":
+            return concurrent.futures.ThreadPoolExecutor(jobs)
+        case _:
+            raise ValueError(f"Unsupported executor: {executor}")
+
+
+def run(
+    inputs: dict[str, pathlib.Path],
+    executor: str = "process",
+    jobs: int | None = None,
+) -> dict[str, list[Outcome]]:
+    """Solves both parts of each day, spreading the parts across workers.
+
+    Args:
+        inputs: The two-digit days mapped to their input file.
+        executor: The executor type. One of `advent_of_code_2025.EXECUTORS`.
+        jobs: The maximum number of workers.
+
+    Returns:
+        The days, in ascending order, mapped to the outcome of each part.
+        An outcome is either the solution or the exception raised while
+        solving the part.
+    """
+    tasks = [(day, part) for day in sorted(inputs) for part in PARTS]
+    outcomes: dict[tuple[str, int], Outcome] = {}
+
+    if executor == "serial":
+        for day, part in tasks:
+            try:
+                outcomes[day, part] = solve_part(day, part, inputs[day])
+            except base.SOLVER_ERRORS as e:
+                outcomes[day, part] = e
+    else:
+        with make_executor(executor, jobs) as pool:
+            futures = {
+                pool.submit(solve_part, day, part, inputs[day]): (day, part)
+                for day, part in tasks
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    outcomes[futures[future]] = future.result()
+                except base.SOLVER_ERRORS as e:
+                    outcomes[futures[future]] = e
+
+    return {day: [outcomes[day, part] for part in PARTS] for day in sorted(inputs)}
+
+
+@functools.cache
+def _get_instance(solver: type[base.Solver]) -> base.Solver:
+    """Gets the solver instance shared by a worker's tasks.
+
+    Args:
+        solver: The solver class.
+
+    Returns:
+        The solver instance.
+    """
+    return solver()
+
+
+def solve_input(
+    solver: type[base.Solver], source: base.Input, trace_memory: bool = False
+) -> base.Results:
+    """Solves both parts of an input without printing the report.
+
+    This is a module level function so that it can be sent to the workers.
+    Each worker reuses one solver instance, keeping its caches warm.
+
+    Args:
+        solver: The solver class.
+        source: The input.
+        trace_memory: Whether to measure the peak memory of each phase.
+
+    Returns:
+        The answers and the metrics of each phase.
+    """
+    return _get_instance(solver).solve(source, trace_memory=trace_memory, verbose=False)
+
+
+def solve_inputs(
+    tasks: list[tuple[type[base.Solver], pathlib.Path | bytes]],
+    executor: str = "process",
+    jobs: int | None = None,
+    trace_memory: bool = False,
+    limits: Limits | None = None,
+) -> Generator[tuple[int, base.Results | Exception]]:
+    """Solves both parts of each solver's input, spreading them across workers.
+
+    Args:
+        tasks: The solver classes paired with their loaded input.
+        executor: The executor type. One of `advent_of_code_2025.EXECUTORS`.
+        jobs: The maximum number of workers.
+        trace_memory: Whether to measure the peak memory of each phase.
+        limits: The time and memory limits. If provided, each input is solved
+            in its own supervised process, see `limits.supervise`, and the
+            supervisors run in threads unless the executor is "serial".
+
+    Yields:
+        The index of each task and its outcome, as soon as it is solved.
+        An outcome is either the results or the exception raised while
+        solving the input.
+    """
+    solve = solve_input
+    if limits is not None:
+        from . import limits as limits_module
+
+        solve = functools.partial(limits_module.supervise, limits=limits)
+        executor = "serial" if executor == "serial" else "thread"
+
+    if executor == "serial":
+        for i, (solver, source) in enumerate(tasks):
+            try:
+                yield i, solve(solver, source, trace_memory)
+            except base.SOLVER_ERRORS as e:
+                yield i, e
+
+        return
+
+    pool = make_executor(executor, jobs)
+    try:
+        futures = {
+            pool.submit(solve, solver, source, trace_memory): i
+            for i, (solver, source) in enumerate(tasks)
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except base.SOLVER_ERRORS as e:
+                yield futures[future], e
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def solve_many(
+    solver: type[base.Solver],
+    inputs: Iterable[base.Input],
+    executor: str = "process",
+    jobs: int | None = None,
+    trace_memory: bool = False,
+    limits: Limits | None = None,
+) -> Generator[tuple[int, base.Results | Exception]]:
+    """Solves both parts of each input, spreading the inputs across workers.
+
+    Args:
+        solver: The solver class.
+        inputs: The inputs. Streams are read upfront, see `base.load`.
+        executor: The executor type. One of `advent_of_code_2025.EXECUTORS`.
+        jobs: The maximum number of workers.
+        trace_memory: Whether to measure the peak memory of each phase.
+        limits: The time and memory limits. See `solve_inputs`.
+
+    Yields:
+        The index of each input and its outcome, as soon as it is solved.
+        An outcome is either the results or the exception raised while
+        solving the input.
+    """
+    yield from solve_inputs(
+        [(solver, base.load(source)) for source in inputs],
+        executor,
+        jobs,
+        trace_memory,
+        limits,
+    )
+
+
+def solve_days(
+    inputs: dict[str, base.Input],
+    executor: str = "process",
+    jobs: int | None = None,
+    trace_memory: bool = False,
+    limits: Limits | None = None,
+) -> Generator[tuple[str, base.Results | Exception]]:
+    """Solves each day, spreading the days across workers.
+
+    Unlike `run`, both parts of a day are solved by the same worker, so the
+    parse and each part are measured as phases.
+
+    Args:
+        inputs: The two-digit days mapped to their input. Streams are read
+            upfront, see `base.load`.
+        executor: The executor type. One of `advent_of_code_2025.EXECUTORS`.
+        jobs: The maximum number of workers.
+        trace_memory: Whether to measure the peak memory of each phase.
+        limits: The time and memory limits. See `solve_inputs`.
+
+    Yields:
+        The two-digit day and its outcome, as soon as it is solved.
+        An outcome is either the results or the exception raised while
+        solving the day.
+    """
+    days = sorted(inputs)
+    for i, outcome in solve_inputs(
+        [(get_solver(day), base.load(inputs[day])) for day in days],
+        executor,
+        jobs,
+        trace_memory,
+        limits,
+    ):
+        yield days[i], outcome
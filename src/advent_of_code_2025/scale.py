@@ -0,0 +1,359 @@
+"""This module contains the scaling benchmark.
+
+Run `solver scale <DAY>` to solve geometrically growing generated inputs and
+fit how the time and peak memory of each phase grow with the input size.
+"""
+
+import argparse
+import dataclasses
+import json
+import math
+import pathlib
+import statistics
+import sys
+from typing import TYPE_CHECKING, cast
+
+from . import base, disk_cache, get_solver, parse_day, result_cache
+from .generators import get_generator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Sequence
+
+MODELS: dict[str, Callable[[float], float]] = {
+    "1": lambda _: 1.0,
+    "log n": math.log,
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log(n),
+    "n^2": lambda n: n**2,
+    "n^2 log n": lambda n: n**2 * math.log(n),
+    "n^3": lambda n: n**3,
+}
+PHASES: tuple[str, ...] = ("parse", "part_1", "part_2")
+
+
+@dataclasses.dataclass
+class Args:
+    day: str
+    min_size: int
+    max_size: int
+    factor: float
+    repeat: int
+    max_time: float
+    seed: int
+    output: pathlib.Path | None
+
+
+@dataclasses.dataclass
+class Sample:
+    """The measurements of solving an input of a size."""
+
+    size: int
+    bytes: int
+    times: dict[str, float]
+    peaks: dict[str, int]
+    counters: dict[str, int]
+
+
+@dataclasses.dataclass
+class Fit:
+    """The complexity model that best fits a measurement against the size."""
+
+    model: str
+    coefficient: float
+    exponent: float
+    error: float
+
+    def predict(self, size: int) -> float:
+        """Extrapolates the measurement.
+
+        Args:
+            size: The input size.
+
+        Returns:
+            The predicted measurement.
+        """
+        return self.coefficient * MODELS[self.model](size)
+
+
+def fit(sizes: Sequence[int], values: Sequence[float]) -> Fit:
+    """Fits the values against the sizes.
+
+    Each model `c * f(n)` is fitted in log space, so every size weighs the same
+    regardless of its magnitude, and the model with the smallest root mean
+    square error is chosen. The exponent is the slope of the log-log
+    regression.
+
+    Args:
+        sizes: The distinct input sizes, all above 1.
+        values: The positive measurement of each size.
+
+    Returns:
+        The best fit.
+    """
+    log_sizes = [math.log(n) for n in sizes]
+    log_values = [math.log(max(value, sys.float_info.min)) for value in values]
+    exponent = statistics.linear_regression(log_sizes, log_values).slope
+
+    best: Fit | None = None
+    for model, func in MODELS.items():
+        residuals = [
+            value - math.log(func(n))
+            for n, value in zip(sizes, log_values, strict=True)
+        ]
+        offset = statistics.fmean(residuals)
+        error = math.sqrt(statistics.fmean((r - offset) ** 2 for r in residuals))
+        if best is None or error < best.error:
+            best = Fit(model, math.exp(offset), exponent, error)
+
+    assert best is not None
+    return best
+
+
+def get_sizes(min_size: int, max_size: int, factor: float) -> Generator[int]:
+    """Gets the geometrically growing input sizes.
+
+    Args:
+        min_size: The first size.
+        max_size: The inclusive upper bound of the sizes.
+        factor: The growth factor between sizes. Must be above 1.
+
+    Yields:
+        The distinct sizes.
+    """
+    size = min_size
+    while size <= max_size:
+        yield size
+        size = max(size + 1, round(size * factor))
+
+
+def measure(
+    day: str,
+    size: int,
+    seed: int = 0,
+    repeat: int = 3,
+    solver: type[base.Solver] | None = None,
+) -> Sample:
+    """Solves a generated input, measuring each phase.
+
+    The time of a phase is its fastest run. The peak memory is measured by
+    an extra run with memory tracing, so tracing does not slow down the
+    timed runs. The work counted by the solver is also kept, see
+    `base.count`.
+
+    Args:
+        day: The two-digit day.
+        size: The size of the generated input.
+        seed: The random seed.
+        repeat: The number of timed runs.
+        solver: The solver class, e.g. one of the day's engines. If not
+            provided, the day's solver is used.
+
+    Returns:
+        The measurements.
+    """
+    data = "".join(f"{line}\n" for line in get_generator(day)(size, seed)).encode()
+    instance = (solver or get_solver(day))()
+
+    def run(trace_memory: bool) -> base.Results:
+        base.Solver.input_cache.clear()
+        try:
+            return instance.solve(data, trace_memory=trace_memory, verbose=False)
+        finally:
+            base.Solver.input_cache.clear()
+
+    times: dict[str, float] = {}
+    for _ in range(repeat):
+        totals: dict[str, float] = {}
+        for phase in run(trace_memory=False).phases:
+            totals[phase.name] = totals.get(phase.name, 0.0) + phase.wall
+
+        for name, total in totals.items():
+            times[name] = min(times.get(name, math.inf), total)
+
+    results = run(trace_memory=True)
+    peaks: dict[str, int] = {}
+    for phase in results.phases:
+        peaks[phase.name] = max(peaks.get(phase.name, 0), phase.peak or 0)
+
+    return Sample(size, len(data), times, peaks, results.counters)
+
+
+def fit_samples(samples: Sequence[Sample]) -> dict[str, dict[str, Fit]]:
+    """Fits the time and memory of each phase against the size.
+
+    Args:
+        samples: The measurements of at least two sizes.
+
+    Returns:
+        The phases mapped to the fit of their `time` and `memory`.
+    """
+    fits: dict[str, dict[str, Fit]] = {}
+    for phase in samples[-1].times if samples else ():
+        measured = [sample for sample in samples if phase in sample.times]
+        if len(measured) < 2:
+            continue
+
+        sizes = [sample.size for sample in measured]
+        fits[phase] = {
+            "time": fit(sizes, [sample.times[phase] for sample in measured]),
+            "memory": fit(
+                sizes, [sample.peaks.get(phase, 0) + 1 for sample in measured]
+            ),
+        }
+
+    return fits
+
+
+def dump(
+    day: str,
+    samples: Sequence[Sample],
+    fits: dict[str, dict[str, Fit]],
+    filepath: pathlib.Path,
+) -> None:
+    """Writes the measurements and fits as JSON.
+
+    Args:
+        day: The two-digit day.
+        samples: The measurements.
+        fits: The fits of each phase.
+        filepath: The path to write to.
+    """
+    data = {
+        "day": day,
+        "samples": [dataclasses.asdict(sample) for sample in samples],
+        "fits": {
+            phase: {kind: dataclasses.asdict(fit) for kind, fit in kinds.items()}
+            for phase, kinds in fits.items()
+        },
+    }
+    with open(filepath, "w", encoding=sys.getdefaultencoding()) as file:
+        json.dump(data, file, indent=2)
+        _ = file.write("\n")
+
+
+def parse_args(argv: Sequence[str] | None = None) -> Args:
+    """Parses the CLI args.
+
+    Args:
+        argv: The CLI args. If not provided, `sys.argv` is used.
+
+    Returns:
+        The parsed args.
+    """
+    parser = argparse.ArgumentParser(
+        prog="solver scale", description="Advent of code 2025 scaling benchmark."
+    )
+
+    _ = parser.add_argument(
+        "day",
+        type=parse_day,
+        help="The day to benchmark.",
+    )
+    _ = parser.add_argument(
+        "--min-size",
+        type=int,
+        default=100,
+        help="The size of the smallest generated input. See `solver generate`.",
+    )
+    _ = parser.add_argument(
+        "--max-size",
+        type=int,
+        default=100_000,
+        help="The largest size of a generated input.",
+    )
+    _ = parser.add_argument(
+        "--factor",
+        type=float,
+        default=2.0,
+        help="The growth factor between sizes.",
+    )
+    _ = parser.add_argument(
+        "--repeat",
+        "-r",
+        type=int,
+        default=3,
+        help="The number of timed runs per size.",
+    )
+    _ = parser.add_argument(
+        "--max-time",
+        type=float,
+        default=1.0,
+        help="Stop growing the size once a run takes longer than this many seconds.",
+    )
+    _ = parser.add_argument(
+        "--seed",
+        "-s",
+        type=int,
+        default=0,
+        help="The random seed.",
+    )
+    _ = parser.add_argument(
+        "--output",
+        "-o",
+        type=pathlib.Path,
+        help="Path to write the measurements and fits to as JSON.",
+    )
+
+    args = parser.parse_args(argv)
+    if args.min_size < 2:
+        parser.error("--min-size must be at least 2")
+
+    if args.factor <= 1:
+        parser.error("--factor must be above 1")
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    return Args(
+        day=cast("str", args.day),
+        min_size=cast("int", args.min_size),
+        max_size=cast("int", args.max_size),
+        factor=cast("float", args.factor),
+        repeat=cast("int", args.repeat),
+        max_time=cast("float", args.max_time),
+        seed=cast("int", args.seed),
+        output=cast("pathlib.Path | None", args.output),
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    samples: list[Sample] = []
+    print(
+        f"{'Size':>9} {'Bytes':>11} {'Phase':<10} {'Time (ms)':>11} {'Peak (KiB)':>11}"
+    )
+    for size in get_sizes(args.min_size, args.max_size, args.factor):
+        try:
+            # Cached answers and structures would skip the timed work
+            with result_cache.disabled(), disk_cache.disabled():
+                sample = measure(args.day, size, args.seed, args.repeat)
+        except base.SOLVER_ERRORS as e:  # Some days need a minimum size, e.g. day 8
+            print(f"{size:>9} {'':>11} {'error':<10} {type(e).__name__}: {e}")
+            continue
+
+        samples.append(sample)
+        for phase, time in sample.times.items():
+            print(
+                f"{size:>9} {sample.bytes:>11} {phase:<10} {time * 1e3:>11.3f} "
+                f"{sample.peaks.get(phase, 0) / 1024:>11.1f}"
+            )
+
+        for name, amount in sample.counters.items():
+            print(f"{size:>9} {sample.bytes:>11} {name}: {amount}")
+
+        if sum(sample.times[phase] for phase in PHASES) > args.max_time:
+            break
+
+    fits = fit_samples(samples)
+    print()
+    print(f"{'Phase':<10} {'Time':<14} {'Exponent':>8} {'Memory':<14} {'Exponent':>8}")
+    for phase, kinds in fits.items():
+        time, memory = kinds["time"], kinds["memory"]
+        print(
+            f"{phase:<10} {f'O({time.model})':<14} {time.exponent:>8.2f} "
+            f"{f'O({memory.model})':<14} {memory.exponent:>8.2f}"
+        )
+
+    if args.output:
+        dump(args.day, samples, fits, args.output)
@@ -0,0 +1,251 @@
+"""This module contains the warm solver daemon and its client.
+
+Run `solver serve` to start the daemon, then `solver <DAYS> --remote` to solve
+through it. The daemon keeps the solver modules imported and the parsed input
+cache warm between requests.
+
+Only the user running the daemon can connect to it: the socket is made
+readable and writable by its owner only before the daemon listens, within a
+directory that is owned by the user or root.
+
+Requests and responses are JSON objects, one per line:
+    - Request: `{"day": "01", "part": 1, "path": "/abs/input.txt"}`
+    - Response: `{"result": 3}` or `{"error": "ValueError: ..."}`
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import os
+import pathlib
+import socket
+import socketserver
+import sys
+from typing import TYPE_CHECKING, NamedTuple, cast, override
+
+from . import DAYS, base, get_solver, parse_day, parse_days
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from .runner import Outcome
+
+PARTS: tuple[int, ...] = (1, 2)
+DIRECTORY_MODE: int = 0o700
+SOCKET_MODE: int = 0o600
+
+
+class RemoteError(Exception):
+    """An error raised by the daemon while solving."""
+
+
+class Args(NamedTuple):
+    socket: pathlib.Path
+    preload: list[str]
+
+
+def default_socket() -> pathlib.Path:
+    """Gets the default socket path.
+
+    Returns:
+        The socket path within a directory of the user's runtime directory, or
+        of the temporary directory if there is none.
+    """
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if not directory:
+        import tempfile
+
+        directory = tempfile.gettempdir()
+
+    return (
+        pathlib.Path(directory) / f"advent_of_code_2025-{os.getuid()}" / "solver.sock"
+    )
+
+
+def make_socket_directory(directory: pathlib.Path) -> None:
+    """Makes the directory of the socket, if it does not exist.
+
+    A missing directory is only accessible by the user.
+
+    Args:
+        directory: The directory.
+
+    Raises:
+        PermissionError: If the directory is owned by another user, who could
+            replace the socket.
+    """
+    directory.mkdir(mode=DIRECTORY_MODE, parents=True, exist_ok=True)
+    owner = directory.stat().st_uid
+    if owner not in (os.getuid(), 0):
+        raise PermissionError(
+            f"The socket directory is owned by another user. Got: {directory}"
+        )
+
+
+@functools.cache
+def _get_solver(day: str) -> base.Solver:
+    """Gets the shared solver instance of a day.
+
+    Args:
+        day: The two-digit day.
+
+    Returns:
+        The solver.
+    """
+    return get_solver(day)()
+
+
+def solve(request: dict[str, object]) -> dict[str, object]:
+    """Solves a request.
+
+    Args:
+        request: The day, part and absolute input path.
+
+    Returns:
+        The result, or the error if the request could not be solved.
+    """
+    try:
+        day = parse_day(str(request["day"]))
+        part = request["part"]
+        if part not in PARTS:
+            raise ValueError(f"The part must be one of {PARTS}. Got: {part}")
+
+        solver = _get_solver(day)
+        filepath = pathlib.Path(str(request["path"]))
+        result = solver.part_1(filepath) if part == 1 else solver.part_2(filepath)
+    except (argparse.ArgumentTypeError, *base.SOLVER_ERRORS) as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    return {"result": result}
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """Solves each request of a connection in order."""
+
+    @override
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = cast("dict[str, object]", json.loads(line))
+                response = solve(request)
+            except (json.JSONDecodeError, TypeError) as e:
+                response = {"error": f"Invalid request: {e}"}
+
+            _ = self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    """Daemon solving requests over a Unix domain socket."""
+
+    daemon_threads: bool = True
+
+    def __init__(self, path: pathlib.Path, preload: Iterable[str] = ()) -> None:
+        """
+        Daemon solving requests over a Unix domain socket.
+
+        Args:
+            path: The socket path. A stale socket is replaced. A missing
+                directory is made, see `make_socket_directory`.
+            preload: The two-digit days to import the solvers of upfront.
+        """
+        for day in preload:
+            _ = _get_solver(day)
+
+        make_socket_directory(path.parent)
+        path.unlink(missing_ok=True)
+        self.path: pathlib.Path = path
+        super().__init__(str(path), Handler)
+
+    @override
+    def server_bind(self) -> None:
+        super().server_bind()
+        # The daemon does not listen yet, so no one can connect in between
+        self.path.chmod(SOCKET_MODE)
+
+    @override
+    def server_close(self) -> None:
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+def request(
+    path: pathlib.Path, inputs: dict[str, pathlib.Path]
+) -> dict[str, list[Outcome]]:
+    """Solves each part of the days through the daemon.
+
+    Args:
+        path: The daemon's socket path.
+        inputs: The two-digit days mapped to their input paths.
+
+    Returns:
+        The days mapped to the outcome of each part, either the result or
+        a `RemoteError`.
+    """
+    requests = [
+        {"day": day, "part": part, "path": str(filepath.resolve())}
+        for day, filepath in inputs.items()
+        for part in PARTS
+    ]
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(path))
+        with connection.makefile("rwb") as file:
+            file.writelines(json.dumps(item).encode() + b"\n" for item in requests)
+            file.flush()
+            responses = [
+                cast("dict[str, int | str]", json.loads(file.readline()))
+                for _ in requests
+            ]
+
+    outcomes: dict[str, list[Outcome]] = {day: [] for day in inputs}
+    for item, response in zip(requests, responses, strict=True):
+        outcomes[cast("str", item["day"])].append(
+            RemoteError(response["error"])
+            if "error" in response
+            else response["result"]
+        )
+
+    return outcomes
+
+
+def parse_args(argv: Sequence[str] | None = None) -> Args:
+    """Parses the CLI args.
+
+    Args:
+        argv: The CLI args. If not provided, `sys.argv` is used.
+
+    Returns:
+        The parsed args.
+    """
+    parser = argparse.ArgumentParser(
+        prog="solver serve", description="Advent of code 2025 solver daemon."
+    )
+
+    _ = parser.add_argument(
+        "--socket",
+        type=pathlib.Path,
+        default=default_socket(),
+        help="The socket path. Defaults to a socket in the user's runtime directory.",
+    )
+    _ = parser.add_argument(
+        "--preload",
+        type=parse_days,
+        default=list(DAYS),
+        help="The days to import the solvers of upfront. Defaults to all days.",
+    )
+
+    args = parser.parse_args(argv)
+    return Args(
+        socket=cast("pathlib.Path", args.socket),
+        preload=cast("list[str]", args.preload),
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    with Server(args.socket, args.preload) as server:
+        print(f"Listening on {args.socket}", file=sys.stderr)
+        with contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
@@ -0,0 +1,98 @@
+"""This module contains the startup import time report.
+
+Run `solver --startup-report [DAYS]` to show the import cost of each module
+when solving the given days.
+"""
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+PREFIX: str = "import time:"
+
+
+class Import(NamedTuple):
+    """The import cost of a module in seconds."""
+
+    name: str
+    self_time: float
+    cumulative: float
+    depth: int
+
+
+def parse(output: str) -> list[Import]:
+    """Parses the output of `python -X importtime`.
+
+    Args:
+        output: The output, with one line per imported module.
+
+    Returns:
+        The imported modules in the order they finished importing.
+    """
+    imports: list[Import] = []
+    for line in output.splitlines():
+        if not line.startswith(PREFIX):
+            continue
+
+        self_time, cumulative, name = line.removeprefix(PREFIX).split("|", 2)
+        if not self_time.strip().isnumeric():  # The header
+            continue
+
+        name = name.removeprefix(" ")
+        imports.append(
+            Import(
+                name=name.lstrip(),
+                self_time=int(self_time) / 1e6,
+                cumulative=int(cumulative) / 1e6,
+                depth=(len(name) - len(name.lstrip())) // 2,
+            )
+        )
+
+    return imports
+
+
+def measure(days: Iterable[str]) -> list[Import]:
+    """Measures the imports needed to solve the given days.
+
+    The imports are measured in a fresh interpreter, so modules already
+    imported by this process are included.
+
+    Args:
+        days: The two-digit days to import the solvers of.
+
+    Returns:
+        The imported modules in the order they finished importing.
+    """
+    code = "; ".join(
+        ["import advent_of_code_2025"]
+        + [f"import advent_of_code_2025.day_{day}.solver" for day in days]
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return parse(process.stderr)
+
+
+def report(imports: Sequence[Import], top: int = 25) -> None:
+    """Prints the modules with the largest import cost.
+
+    Args:
+        imports: The imported modules.
+        top: The number of modules to print.
+    """
+    total = sum(module.cumulative for module in imports if module.depth == 0)
+    print(f"{'Self (ms)':>10} {'Cumulative (ms)':>16} Module")
+    ranked = sorted(imports, key=lambda module: module.self_time, reverse=True)
+    for module in ranked[:top]:
+        print(
+            f"{module.self_time * 1e3:>10.3f} {module.cumulative * 1e3:>16.3f} "
+            f"{module.name}"
+        )
+
+    print(f"Total: {total * 1e3:.3f} ms over {len(imports)} modules")
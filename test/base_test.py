@@ -2,23 +2,43 @@
 
 import importlib
 import inspect
-import sys
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, NamedTuple, cast
 
 import pytest
 
-if TYPE_CHECKING:
-    import pathlib
+from advent_of_code_2025 import disk_cache, result_cache, scale
 
+if TYPE_CHECKING:
     from advent_of_code_2025.base import Solver
 
 
+class PerfCase(NamedTuple):
+    """A performance budget of a phase on a generated input.
+
+    Attributes:
+        phase: The name of the phase, e.g. "parse", "part_1" or a phase marked
+            by the solver.
+        size: The size of the generated input. See `solver generate`.
+        time: The maximum wall time in seconds, if any.
+        memory: The maximum traced peak memory in bytes, if any.
+        seed: The random seed of the generated input.
+    """
+
+    phase: str
+    size: int
+    time: float | None = None
+    memory: int | None = None
+    seed: int = 0
+
+
 class BaseTests:
     """Base tests"""
 
     cases: list[tuple[str, int | str | None, int | str | None]] = []
     test_args: dict[str, object] | None = None
     ignore_args: tuple[list[str], list[str]] = ([], [])
+    engine: str = "solver"
+    perf_cases: list[PerfCase] = []
 
     # === Test cases ===
     def pytest_generate_tests(self, metafunc: pytest.Metafunc):
@@ -28,46 +48,37 @@ class BaseTests:
         Args:
             metafunc: The test function.
         """
+        if "perf_case" in metafunc.fixturenames:
+            metafunc.parametrize(
+                "perf_case",
+                self.perf_cases,
+                ids=[f"{case.phase} - size {case.size}" for case in self.perf_cases],
+            )
+            return
+
+        if "input_data" not in metafunc.fixturenames:
+            return
+
         test_cases = [
-            (i, (input_file, solution, part))
-            for i, (input_file, *solutions) in enumerate(self.cases)
+            (i, (input_data, solution, part))
+            for i, (input_data, *solutions) in enumerate(self.cases)
             for part, solution in enumerate(solutions, start=1)
             if solution is not None
         ]
 
         metafunc.parametrize(
-            ["input_file", "solution", "part"],
+            ["input_data", "solution", "part"],
             [param for _, param in test_cases],
-            indirect=["input_file"],
             ids=[f"Test {test_id} - part {part}" for test_id, (*_, part) in test_cases],
         )
 
     # === Fixtures ===
-    @pytest.fixture
-    def input_file(
-        self,
-        tmp_path: pathlib.Path,
-        request: pytest.FixtureRequest,
-    ) -> pathlib.Path:
-        """Creates a temporary input file with the test input.
-
-        Args:
-            tmp_path: The temporary path to store the input file.
-
-        Returns:
-            Path to the temporary input file.
-        """
-        input_data = cast("str", request.param)
-        input_file = tmp_path / "input.txt"
-        with open(input_file, "w", encoding=sys.getdefaultencoding()) as file:
-            _ = file.write(input_data)
-
-        return input_file
-
     @pytest.fixture
     def solver(self) -> Solver:
         """Gets the solver for the testing day.
 
+        The solver is the `engine` module's, see `differential`.
+
         Returns:
             The solver for the day to be tested.
         """
@@ -75,7 +86,7 @@ class BaseTests:
         assert test_module is not None
         day = test_module.__name__[-2:]
 
-        module = importlib.import_module(f"advent_of_code_2025.day_{day}.solver")
+        module = importlib.import_module(f"advent_of_code_2025.day_{day}.{self.engine}")
         solver = cast("type[Solver]", getattr(module, "Solver"))
 
         return solver()
@@ -84,7 +95,7 @@ class BaseTests:
     def test_part(
         self,
         solver: Solver,
-        input_file: pathlib.Path,
+        input_data: str,
         solution: int,
         part: int,
     ):
@@ -94,4 +105,40 @@ class BaseTests:
         for ignore_arg in ignore_args:
             _ = test_args.pop(ignore_arg)
 
-        assert getattr(solver, f"part_{part}")(input_file, **test_args) == solution
+        assert getattr(solver, f"part_{part}")(input_data, **test_args) == solution
+
+    @pytest.mark.perf
+    def test_perf(
+        self,
+        solver: Solver,
+        perf_case: PerfCase,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Tests that a phase solves a generated input within its budget."""
+        monkeypatch.setenv(result_cache.ENVIRONMENT_VARIABLE, "0")
+        monkeypatch.setenv(disk_cache.ENVIRONMENT_VARIABLE, "0")
+        day = f"{solver.day:0>2}"
+
+        sample = scale.measure(
+            day, perf_case.size, perf_case.seed, repeat=1, solver=type(solver)
+        )
+
+        assert perf_case.phase in sample.times, f"{perf_case.phase} did not run"
+        failures: list[str] = []
+        time = sample.times[perf_case.phase]
+        if perf_case.time is not None and time > perf_case.time:
+            failures.append(
+                f"time: measured {time:.3f} s vs budget {perf_case.time:g} s"
+            )
+
+        peak = sample.peaks.get(perf_case.phase, 0)
+        if perf_case.memory is not None and peak > perf_case.memory:
+            failures.append(
+                f"peak memory: measured {peak / 2**20:.1f} MiB vs budget "
+                f"{perf_case.memory / 2**20:g} MiB"
+            )
+
+        assert not failures, (
+            f"Day {day} {perf_case.phase} on size {perf_case.size} is over budget, "
+            + "; ".join(failures)
+        )
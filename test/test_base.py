@@ -0,0 +1,287 @@
+"""Tests the base solver."""
+
+import io
+import itertools
+import sys
+from typing import TYPE_CHECKING, override
+
+import pytest
+
+from advent_of_code_2025 import base
+from advent_of_code_2025.day_04.solver import Solver as Day4Solver
+from advent_of_code_2025.day_09.solver import Solver as Day9Solver
+
+from . import test_day_04, test_day_09
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    import pathlib
+
+
+class CountingSolver(base.Solver):
+    """Solver that counts how often its input is parsed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.parses: int = 0
+
+    @base.parser
+    def _parse_input(self, filepath: base.Input) -> tuple[int, ...]:
+        self.parses += 1
+        with base.open_input(filepath) as file:
+            return tuple(int(line) for line in file)
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        return sum(self._parse_input(filepath))
+
+    @override
+    def part_2(self, filepath: base.Input) -> int | str:
+        return max(self._parse_input(filepath))
+
+
+@pytest.fixture(autouse=True)
+def input_cache():
+    """Clears the input cache around each test."""
+    base.Solver.input_cache.clear()
+    yield base.Solver.input_cache
+    base.Solver.input_cache.clear()
+
+
+def write(filepath: pathlib.Path, data: str) -> pathlib.Path:
+    """Writes the data to the filepath.
+
+    Args:
+        filepath: The filepath to write to.
+        data: The data to write.
+
+    Returns:
+        The filepath.
+    """
+    _ = filepath.write_text(data, encoding=sys.getdefaultencoding())
+    return filepath
+
+
+def test_parses_once(tmp_path: pathlib.Path):
+    """Tests that both parts share a single parse of the same content."""
+    first = write(tmp_path / "a.txt", "1\n2\n3\n")
+    second = write(tmp_path / "b.txt", "1\n2\n3\n")
+    solver = CountingSolver()
+
+    assert solver.part_1(first) == 6
+    assert solver.part_2(first) == 3
+    assert CountingSolver().part_1(second) == 6
+    assert solver.parses == 1
+
+
+def test_reparses_changed_input(tmp_path: pathlib.Path):
+    """Tests that a changed input is not served from the cache."""
+    filepath = write(tmp_path / "input.txt", "1\n2\n")
+    solver = CountingSolver()
+    assert solver.part_1(filepath) == 3
+
+    _ = write(filepath, "5\n")
+    assert solver.part_1(filepath) == 5
+    assert solver.parses == 2
+
+
+def test_evicts_least_recently_used(
+    tmp_path: pathlib.Path, input_cache: base.InputCache
+):
+    """Tests that the cache is bounded."""
+    solver = CountingSolver()
+    filepaths = [
+        write(tmp_path / f"{i}.txt", f"{i}\n") for i in range(input_cache.maxsize + 1)
+    ]
+
+    for filepath in filepaths:
+        _ = solver.part_1(filepath)
+
+    assert len(input_cache) == input_cache.maxsize
+    _ = solver.part_1(filepaths[-1])
+    assert solver.parses == len(filepaths)
+    _ = solver.part_1(filepaths[0])
+    assert solver.parses == len(filepaths) + 1
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ("L68\nR48\n", [b"L68", b"R48"]),
+        ("L68\r\nR48", [b"L68", b"R48"]),
+        ("a\n\nb\n", [b"a", b"", b"b"]),
+        ("", []),
+    ],
+)
+def test_mapped_lines(tmp_path: pathlib.Path, data: str, expected: list[bytes]):
+    """Tests iterating the lines of a mapped input."""
+    with base.MappedInput(write(tmp_path / "input.txt", data)) as mapped:
+        assert [line.tobytes() for line in mapped.lines()] == expected
+
+
+def test_mapped_fields(tmp_path: pathlib.Path):
+    """Tests iterating the fields of a mapped input."""
+    filepath = write(tmp_path / "input.txt", "11-22,95-115\n998-1012\n")
+    with base.MappedInput(filepath) as mapped:
+        fields = list(mapped.fields(b",-"))
+        assert all(isinstance(field, memoryview) for field in fields)
+        assert [int(field) for field in fields] == [11, 22, 95, 115, 998, 1012]
+        assert [field.tobytes() for field in mapped.fields(start=6, end=12)] == [
+            b"95-115"
+        ]
+        del fields
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 100])
+def test_mapped_ranges(tmp_path: pathlib.Path, count: int):
+    """Tests splitting a mapped input into ranges of whole lines."""
+    data = "".join(f"{i}\n" for i in range(10))
+    with base.MappedInput(write(tmp_path / "input.txt", data)) as mapped:
+        ranges = list(mapped.ranges(count))
+        assert len(ranges) <= count
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        assert all(end == start for (_, end), (start, _) in itertools.pairwise(ranges))
+        assert all(mapped.data[end - 1] == ord("\n") for _, end in ranges)
+        assert [
+            int(line) for start, end in ranges for line in mapped.lines(start, end)
+        ] == list(range(10))
+
+
+def test_phases_not_recorded():
+    """Tests that phases are only measured while recording."""
+    with base.phase("idle"):
+        pass
+
+    with base.recording() as phases:
+        pass
+
+    assert phases == []
+
+
+def test_nested_phases():
+    """Tests that nested phases are recorded and measured."""
+    with base.recording(trace_memory=True) as phases, base.phase("outer"):
+        with base.phase("inner"):
+            data = bytearray(2**20)
+            del data
+
+        small = bytearray(2**10)
+        del small
+
+    inner, outer = phases
+    assert (inner.name, outer.name) == ("inner", "outer")
+    assert outer.wall >= inner.wall >= 0
+    assert inner.cpu >= 0
+    assert inner.peak is not None
+    assert outer.peak is not None
+    assert outer.peak >= inner.peak >= 2**20
+
+
+def test_phase_listener():
+    """Tests that the listener sees the running phases."""
+    seen: list[tuple[str, ...]] = []
+
+    with (
+        base.recording(listener=seen.append),
+        base.recording(),
+        base.phase("outer"),
+        pytest.raises(ValueError, match="inner"),
+        base.phase("inner"),
+    ):
+        raise ValueError("inner")
+
+    assert seen == [("outer",), ("outer", "inner"), ()]
+
+
+def test_counters():
+    """Tests that the work is counted per phase while recording."""
+    base.count("ignored")
+
+    with base.recording() as phases, base.counting() as counters:
+        with base.phase("outer"):
+            base.count("steps", 2)
+            with base.phase("inner"):
+                base.count("steps")
+                base.count("pushes", 3)
+
+        base.count("steps")
+
+    inner, outer = phases
+    assert inner.counters == {"steps": 1, "pushes": 3}
+    assert outer.counters == {"steps": 3, "pushes": 3}
+    assert counters == {"steps": 4, "pushes": 3}
+    assert not base.counting_enabled()
+
+
+def test_solver_counters(tmp_path: pathlib.Path):
+    """Tests that the work counted by a solver is returned with the results."""
+    filepath = write(tmp_path / "input.txt", test_day_04.TestDay4.cases[0][0])
+
+    results = Day4Solver().solve(filepath, verbose=False)
+
+    assert isinstance(results.part_2, int)
+    assert results.counters.keys() == {"neighbor_decrements"}
+    assert 0 < results.counters["neighbor_decrements"] <= 8 * results.part_2
+    assert results.phases[-1].counters == results.counters
+
+
+def test_solve_results(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]):
+    """Tests that solving returns the answers and the metrics of each phase."""
+    filepath = write(tmp_path / "input.txt", "1\n2\n3\n")
+
+    results = CountingSolver().solve(filepath)
+
+    assert (results.part_1, results.part_2) == (6, 3)
+    assert [phase.name for phase in results.phases] == ["parse", "part_1", "part_2"]
+    assert all(phase.peak is None for phase in results.phases)
+    assert "Part 1: 6" in capsys.readouterr().out
+
+
+def test_solver_phases(tmp_path: pathlib.Path):
+    """Tests that the phases marked by a solver are recorded."""
+    filepath = write(tmp_path / "input.txt", test_day_09.TestDay9.cases[0][0])
+
+    results = Day9Solver().solve(filepath)
+
+    assert [phase.name for phase in results.phases] == [
+        "sort",
+        "parse",
+        "part_1",
+        "part_2",
+    ]
+
+
+@pytest.mark.parametrize(
+    "make_input",
+    [
+        lambda data: data,
+        str.encode,
+        lambda data: memoryview(data.encode()),
+        io.StringIO,
+        lambda data: io.BytesIO(data.encode()),
+    ],
+    ids=["str", "bytes", "memoryview", "text stream", "binary stream"],
+)
+def test_in_memory_input(make_input: Callable[[str], base.Input]):
+    """Tests solving inputs that are not files."""
+    solver = CountingSolver()
+
+    assert solver.part_1(make_input("1\n2\n3\n")) == 6
+    assert solver.part_2(make_input("1\n2\n3\n")) == 3
+    assert solver.parses == 1
+
+
+def test_stream_read_once(capsys: pytest.CaptureFixture[str]):
+    """Tests that a stream is read once when solving both parts."""
+    results = CountingSolver().solve(io.StringIO("1\n2\n3\n"))
+
+    assert (results.part_1, results.part_2) == (6, 3)
+    assert "Part 2: 3" in capsys.readouterr().out
+
+
+def test_mapped_bytes():
+    """Tests iterating an input that is not a file."""
+    with base.MappedInput("11-22,95-115\n") as mapped:
+        assert [int(field) for field in mapped.fields(b",-")] == [11, 22, 95, 115]
+        assert [line.tobytes() for line in mapped.lines()] == [b"11-22,95-115"]
@@ -0,0 +1,86 @@
+"""Tests the benchmark harness."""
+
+import json
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from advent_of_code_2025 import bench, disk_cache, result_cache
+
+from . import test_day_05, test_day_09
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def test_stats():
+    """Tests summarising the timings."""
+    stats = bench.Stats.from_samples([float(x) for x in range(20, 0, -1)])
+
+    assert stats.min == 1
+    assert stats.median == 10.5
+    assert stats.p95 == pytest.approx(19.05)
+
+
+def test_compare():
+    """Tests flagging the phases slower than the baseline."""
+    baseline = {
+        "01": {
+            "part_1": bench.Stats.from_samples([1.0]),
+            "part_2": bench.Stats.from_samples([1.0]),
+        },
+        "02": {"parse": bench.Stats.from_samples([1e-6])},
+    }
+    results = {
+        "01": {
+            "part_1": bench.Stats.from_samples([1.05]),
+            "part_2": bench.Stats.from_samples([1.5]),
+        },
+        "02": {"parse": bench.Stats.from_samples([1e-5])},
+        "03": {"parse": bench.Stats.from_samples([1.0])},
+    }
+
+    regressions = bench.compare(results, baseline, threshold=0.1, min_difference=1e-3)
+
+    assert [(r.day, r.phase) for r in regressions] == [("01", "part_2")]
+    assert regressions[0].change == pytest.approx(0.5)
+
+
+def test_main(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+):
+    """Tests writing the results and comparing against them."""
+    monkeypatch.setenv(result_cache.ENVIRONMENT_VARIABLE, str(tmp_path / "db"))
+    input_file = tmp_path / "input.txt"
+    _ = input_file.write_text(
+        test_day_05.TestDay5.cases[0][0], encoding=sys.getdefaultencoding()
+    )
+    output = tmp_path / "results.json"
+
+    bench.main(["5", "-i", str(input_file), "-r", "3", "-o", str(output)])
+
+    with open(output, encoding=sys.getdefaultencoding()) as file:
+        results = json.load(file)
+    assert list(results["days"]["05"]) == list(bench.PHASES)
+    assert len(results["days"]["05"]["part_1"]["samples"]) == 3
+
+    bench.main(["5", "-i", str(input_file), "--compare", str(output)])
+    assert "05 part_1" in capsys.readouterr().out
+    assert result_cache.get_path() == tmp_path / "db"
+
+
+def test_main_skips_disk_cache(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """Tests that the timed runs do not load the cached structures."""
+    monkeypatch.setenv(disk_cache.ENVIRONMENT_VARIABLE, str(tmp_path / "cache"))
+    input_file = tmp_path / "input.txt"
+    _ = input_file.write_text(
+        test_day_09.TestDay9.cases[0][0], encoding=sys.getdefaultencoding()
+    )
+
+    bench.main(["9", "-i", str(input_file), "-r", "1"])
+
+    assert disk_cache.get_directory() == tmp_path / "cache"
+    assert not (tmp_path / "cache").exists()
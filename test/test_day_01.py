@@ -1,9 +1,15 @@
 """Tests day 1 solver."""
 
+import functools
+import io
 import textwrap
 from typing import final
 
-from .base_test import BaseTests
+from advent_of_code_2025 import mapreduce
+from advent_of_code_2025.day_01 import parallel, solver, streaming
+from advent_of_code_2025.generators import get_generator
+
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -28,3 +34,91 @@ class TestDay1(BaseTests):
             6,
         )
     ]
+
+    perf_cases = [
+        PerfCase("parse", 100_000, time=1.5, memory=64 << 20),
+        PerfCase("part_2", 100_000, time=0.5),
+    ]
+
+
+@final
+class TestDay1Vectorized(BaseTests):
+    """Tests the day 1 vectorized solver."""
+
+    engine = "vectorized"
+    cases = TestDay1.cases
+
+    perf_cases = [
+        PerfCase("parse", 1_000_000, time=3.0, memory=512 << 20),
+        PerfCase("part_2", 1_000_000, time=0.5),
+    ]
+
+
+@final
+class TestDay1Parallel(BaseTests):
+    """Tests the day 1 chunk-parallel solver."""
+
+    engine = "parallel"
+    cases = TestDay1.cases
+
+    perf_cases = [PerfCase("parse", 100_000, time=2.0, memory=16 << 20)]
+
+    def test_compose(self):
+        """Tests that composing the summaries of chunks summarises them all."""
+        lines = [line.encode() for line in get_generator("01")(500, 1)]
+        summaries = [
+            parallel.summarise(map(memoryview, lines[start : start + 70]))
+            for start in range(0, len(lines), 70)
+        ]
+
+        assert functools.reduce(parallel.compose, summaries) == parallel.summarise(
+            map(memoryview, lines)
+        )
+
+    def test_summarise_input(self):
+        """Tests summarising the chunks of an input in parallel."""
+        data = "".join(f"{line}\n" for line in get_generator("01")(2000, 2)).encode()
+
+        try:
+            summary = parallel.summarise_input(
+                data, jobs=4, executor="thread", chunk_size=256
+            )
+        finally:
+            mapreduce.shutdown()
+
+        reference = solver.Solver()
+        assert summary.zeros[parallel.START] == reference.part_1(data)
+        assert summary.crossings[parallel.START] == reference.part_2(data)
+
+
+@final
+class TestDay1Streaming(BaseTests):
+    """Tests the day 1 streaming solver."""
+
+    engine = "streaming"
+    cases = TestDay1.cases
+
+    perf_cases = [PerfCase("parse", 100_000, time=2.0, memory=16 << 20)]
+
+    def test_rotate(self):
+        """Tests the counts after each rotation."""
+        tracker = streaming.DialTracker()
+
+        tracker.rotate("L68")
+        assert tracker == streaming.DialTracker(82, 0, 1)
+        tracker.rotate(b"L30")
+        tracker.rotate(memoryview(b"R48"))
+        assert tracker == streaming.DialTracker(0, 1, 2)
+        tracker.rotate_all(["L5", "R160"])
+        assert tracker == streaming.DialTracker(55, 1, 4)
+
+    def test_follow(self):
+        """Tests yielding the counts as each line is read."""
+        data, part_1, part_2 = TestDay1.cases[0]
+        tracker = streaming.DialTracker()
+
+        counts = list(tracker.follow(io.BytesIO(f"{data}\n".encode())))
+
+        assert len(counts) == len(data.splitlines())
+        assert counts[-1] == (part_1, part_2)
+        assert counts == sorted(counts)
@@ -3,7 +3,11 @@
 import textwrap
 from typing import final
 
-from .base_test import BaseTests
+import pytest
+
+from advent_of_code_2025.day_02 import closed_form
+
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -19,3 +23,42 @@ class TestDay2(BaseTests):
             4174379265,
         )
     ]
+
+    perf_cases = [PerfCase("part_2", 2_000, time=0.5)]
+
+
+@final
+class TestDay2ClosedForm(BaseTests):
+    """Tests the day 2 closed-form solver."""
+
+    engine = "closed_form"
+    cases = TestDay2.cases + [
+        ("1-1000000000000000000,5-10", 495495495540950040450040950, None)
+    ]
+
+    perf_cases = [PerfCase("part_2", 20_000, time=0.5)]
+
+    @pytest.mark.parametrize(
+        ("n", "expected"), [(1, 1), (2, -1), (4, 0), (6, 1), (12, 0), (30, -1)]
+    )
+    def test_mobius(self, n: int, expected: int):
+        """Tests the Möbius function."""
+        assert closed_form.mobius(n) == expected
+
+    def test_sum_repeats(self):
+        """Tests summing the repeats within a range."""
+        assert closed_form.sum_repeats(1000, 9999, 4, 2) == sum(range(1010, 10000, 101))
+        assert closed_form.sum_repeats(1188511880, 1188511890, 10, 5) == 1188511885
+
+
+@final
+class TestDay2MergeSweep(BaseTests):
+    """Tests the day 2 merge-sweep solver."""
+
+    engine = "merge_sweep"
+    cases = TestDay2.cases
+
+    perf_cases = [
+        PerfCase("parse", 20_000, time=0.5),
+        PerfCase("part_1", 20_000, time=0.5),
+    ]
@@ -3,7 +3,7 @@
 import textwrap
 from typing import final
 
-from .base_test import BaseTests
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -20,5 +20,14 @@ class TestDay3(BaseTests):
                 """),
             357,
             3121910778619,
-        )
+        ),
+        (
+            "987654321111111 \r\n811111111111119\t\r\n",
+            98 + 89,
+            987654321111 + 811111111119,
+        ),
+    ]
+
+    perf_cases = [
+        PerfCase("part_2", 5_000, time=1.5),
     ]
@@ -3,7 +3,7 @@
 import textwrap
 from typing import final
 
-from .base_test import BaseTests
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -28,3 +28,7 @@ class TestDay4(BaseTests):
             43,
         )
     ]
+
+    perf_cases = [
+        PerfCase("part_2", 200, time=1.0),
+    ]
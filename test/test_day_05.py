@@ -3,7 +3,7 @@
 import textwrap
 from typing import final
 
-from .base_test import BaseTests
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -29,3 +29,7 @@ class TestDay5(BaseTests):
             14,
         )
     ]
+
+    perf_cases = [
+        PerfCase("parse", 20_000, time=1.0, memory=64 << 20),
+    ]
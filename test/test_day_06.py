@@ -3,7 +3,7 @@
 import textwrap
 from typing import final
 
-from .base_test import BaseTests
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -22,3 +22,7 @@ class TestDay6(BaseTests):
             3263827,
         )
     ]
+
+    perf_cases = [
+        PerfCase("part_2", 20_000, time=1.5, memory=128 << 20),
+    ]
@@ -3,7 +3,7 @@
 import textwrap
 from typing import final
 
-from .base_test import BaseTests
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -34,3 +34,7 @@ class TestDay7(BaseTests):
             40,
         )
     ]
+
+    perf_cases = [
+        PerfCase("part_1", 200, time=0.5),
+    ]
@@ -3,7 +3,7 @@
 import textwrap
 from typing import final
 
-from .base_test import BaseTests
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -41,3 +41,8 @@ class TestDay8(BaseTests):
             25272,
         )
     ]
+
+    perf_cases = [
+        PerfCase("edges", 1_000, time=2.0, memory=256 << 20),
+        PerfCase("part_2", 1_000, time=1.0),
+    ]
@@ -3,7 +3,7 @@
 import textwrap
 from typing import final
 
-from .base_test import BaseTests
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -26,3 +26,7 @@ class TestDay9(BaseTests):
             24,
         )
     ]
+
+    perf_cases = [
+        PerfCase("part_2", 400, time=3.0, memory=64 << 20),
+    ]
@@ -3,7 +3,7 @@
 import textwrap
 from typing import final
 
-from .base_test import BaseTests
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -21,3 +21,7 @@ class TestDay10(BaseTests):
             33,
         )
     ]
+
+    perf_cases = [
+        PerfCase("part_2", 50, time=3.0),
+    ]
@@ -3,7 +3,7 @@
 import textwrap
 from typing import final
 
-from .base_test import BaseTests
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -46,3 +46,7 @@ class TestDay11(BaseTests):
             2,
         ),
     ]
+
+    perf_cases = [
+        PerfCase("part_2", 500, time=0.5),
+    ]
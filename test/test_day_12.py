@@ -2,7 +2,7 @@
 
 from typing import final
 
-from .base_test import BaseTests
+from .base_test import BaseTests, PerfCase
 
 
 @final
@@ -10,3 +10,7 @@ class TestDay12(BaseTests):
     """Tests the day 12 solver."""
 
     cases = []
+
+    perf_cases = [
+        PerfCase("part_1", 5_000, time=0.5),
+    ]
@@ -0,0 +1,77 @@
+"""Tests the differential testing of the engines."""
+
+from typing import override
+
+import pytest
+
+from advent_of_code_2025 import DAYS, base, differential, disk_cache, result_cache
+from advent_of_code_2025.day_01.solver import Solver as Day1Solver
+
+
+class BuggySolver(Day1Solver):
+    """A day 1 engine that misses the full rotations."""
+
+    @override
+    def part_2(self, filepath: base.Input) -> int | str:
+        answer = super().part_2(filepath)
+        assert isinstance(answer, int)
+        return answer - sum(
+            full_rotations for _, full_rotations in self._parse_input(filepath)
+        )
+
+
+@pytest.fixture(autouse=True)
+def no_caches(monkeypatch: pytest.MonkeyPatch):
+    """Solves every part with the engine."""
+    monkeypatch.setenv(result_cache.ENVIRONMENT_VARIABLE, "0")
+    monkeypatch.setenv(disk_cache.ENVIRONMENT_VARIABLE, "0")
+
+
+def test_get_engines():
+    """Tests that the reference is not an engine."""
+    assert differential.get_engines("03") == {}
+
+
+def test_shrink():
+    """Tests removing the lines and fields that do not fail."""
+    lines = [str(i) for i in range(100)] + ["1-2,7-9,3-4"]
+
+    assert differential.shrink(
+        lines, lambda lines: "42" in lines and "7-9" in lines[-1]
+    ) == ["42", "7-9"]
+
+
+def test_check():
+    """Tests shrinking the mismatch of a buggy engine."""
+    (mismatch,) = differential.check("01", BuggySolver, [50], range(3))
+
+    assert mismatch.part == 2
+    assert len(mismatch.lines) == 1
+    assert int(mismatch.lines[0][1:]) >= 100
+    assert mismatch.expected != mismatch.actual
+
+
+def test_main(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    """Tests reporting a mismatch."""
+    monkeypatch.setattr(
+        differential, "get_engines", lambda _: {"test_differential": BuggySolver}
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        differential.main(["1", "-n", "20", "-s", "2"])
+
+    assert exc_info.value.code == 1
+    assert "Day 01 test_differential: part 2 mismatch" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    ("day", "engine"),
+    [(day, engine) for day in DAYS for engine in differential.get_engines(day)],
+)
+def test_engine(day: str, engine: str):
+    """Tests that an engine matches the reference on generated inputs."""
+    mismatches = differential.check(
+        day, differential.get_engines(day)[engine], [10, 100], range(5)
+    )
+
+    assert not mismatches, mismatches
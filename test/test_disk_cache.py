@@ -0,0 +1,110 @@
+"""Tests the disk cache."""
+
+import sys
+from typing import TYPE_CHECKING
+
+import numpy
+import pytest
+
+from advent_of_code_2025 import base, disk_cache
+from advent_of_code_2025.day_09.solver import Solver
+
+from . import test_day_09
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.fixture
+def input_file(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Creates the day 9 example input.
+
+    Args:
+        tmp_path: The temporary path to store the input file.
+
+    Returns:
+        Path to the input file.
+    """
+    input_file = tmp_path / "input.txt"
+    _ = input_file.write_text(
+        test_day_09.TestDay9.cases[0][0], encoding=sys.getdefaultencoding()
+    )
+    return input_file
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """Enables the disk cache in a temporary directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(disk_cache.ENVIRONMENT_VARIABLE, str(cache_dir))
+    base.Solver.input_cache.clear()
+    yield cache_dir
+    base.Solver.input_cache.clear()
+
+
+def test_stores_and_loads(input_file: pathlib.Path, cache_dir: pathlib.Path):
+    """Tests that the structures are stored and memory-mapped on later runs."""
+    _, part_1, part_2 = test_day_09.TestDay9.cases[0]
+    assert Solver().part_1(input_file) == part_1
+
+    (entry,) = cache_dir.glob(f"*/day_09/{base.input_digest(input_file)}/areas")
+    assert sorted(path.name for path in entry.iterdir()) == [
+        "0-of-3.npy",
+        "1-of-3.npy",
+        "2-of-3.npy",
+    ]
+
+    base.Solver.input_cache.clear()
+    areas, _, _ = Solver()._get_areas(input_file)  # noqa: SLF001
+    assert isinstance(areas, numpy.memmap)
+    assert Solver().part_2(input_file) == part_2
+
+
+@pytest.mark.parametrize(
+    "removed", [["0-of-3.npy", "1-of-3.npy", "2-of-3.npy"], ["1-of-3.npy"]]
+)
+def test_rebuilds_incomplete_entry(
+    input_file: pathlib.Path, cache_dir: pathlib.Path, removed: list[str]
+):
+    """Tests that an entry partly removed, e.g. by a concurrent clear, is rebuilt."""
+    _ = Solver().part_1(input_file)
+    (entry,) = cache_dir.glob("*/day_09/*/areas")
+    for name in removed:
+        (entry / name).unlink()
+
+    base.Solver.input_cache.clear()
+    assert len(Solver()._get_areas(input_file)) == 3  # noqa: SLF001
+    assert Solver().part_2(input_file) == test_day_09.TestDay9.cases[0][2]
+    assert len(list(entry.glob("*.npy"))) == 3
+
+
+def test_disabled(
+    input_file: pathlib.Path, cache_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Tests that nothing is stored when the cache is bypassed."""
+    monkeypatch.setenv(disk_cache.ENVIRONMENT_VARIABLE, "0")
+
+    assert Solver().part_1(input_file) == test_day_09.TestDay9.cases[0][1]
+    assert not cache_dir.exists()
+
+
+def test_disabled_context(cache_dir: pathlib.Path):
+    """Tests that the cache is only disabled within the context."""
+    with disk_cache.disabled():
+        assert disk_cache.get_directory() is None
+
+    assert disk_cache.get_directory() == cache_dir
+
+
+def test_clear(input_file: pathlib.Path, cache_dir: pathlib.Path):
+    """Tests that clearing the cache only removes its entries."""
+    _ = Solver().part_1(input_file)
+    other = cache_dir / "other" / "notes.txt"
+    other.parent.mkdir()
+    _ = other.write_text("kept", encoding=sys.getdefaultencoding())
+
+    disk_cache.clear()
+
+    assert not list(cache_dir.rglob("*.npy"))
+    assert sorted(path.name for path in cache_dir.iterdir()) == ["other"]
+    assert other.exists()
@@ -0,0 +1,37 @@
+"""Tests the input generators."""
+
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+
+from advent_of_code_2025 import DAYS, generators, get_solver
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.mark.parametrize("day", DAYS)
+def test_solvable(day: str, tmp_path: pathlib.Path):
+    """Tests that the generated inputs can be solved."""
+    # Day 8 connects the 1000 closest pairs
+    size = 1000 if day == "08" else 40
+    input_file = tmp_path / "input.txt"
+    generators.main([day, "--size", str(size), "--seed", "1", "-o", str(input_file)])
+
+    solver = get_solver(day)()
+    for part in (solver.part_1, solver.part_2):
+        assert isinstance(part(input_file), int | str)
+
+
+@pytest.mark.parametrize("day", DAYS)
+def test_seeded(day: str):
+    """Tests that the same seed generates the same input."""
+    inputs: list[str] = []
+    for seed in (1, 1, 2):
+        file = io.StringIO()
+        generators.write(day, 20, file, seed=seed)
+        inputs.append(file.getvalue())
+
+    assert inputs[0] == inputs[1]
+    assert inputs[0] != inputs[2]
@@ -0,0 +1,181 @@
+"""Tests the time and memory limits."""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING, override
+
+import pytest
+
+import advent_of_code_2025
+from advent_of_code_2025 import base, limits, runner
+from advent_of_code_2025.day_01.solver import Solver as Day1Solver
+
+from . import test_day_01, test_day_08
+
+if TYPE_CHECKING:
+    import pathlib
+
+MEMORY_LIMIT: int = 4 << 30  # Above the address space in use by the test process
+
+
+class SlowSolver(base.Solver):
+    """Solver whose first part never finishes in time."""
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        with self.phase("wait"):
+            time.sleep(60)
+
+        return 0
+
+    @override
+    def part_2(self, filepath: base.Input) -> int | str:
+        return 0
+
+
+class HungrySolver(base.Solver):
+    """Solver whose second part allocates far more than its limit."""
+
+    @override
+    def part_1(self, filepath: base.Input) -> int | str:
+        return 0
+
+    @override
+    def part_2(self, filepath: base.Input) -> int | str:
+        return len(bytearray(MEMORY_LIMIT * 2))
+
+
+@pytest.mark.parametrize(
+    ("limit", "expected"),
+    [
+        ("5", ((None, None), 5.0)),
+        ("11=0.5", (("11", None), 0.5)),
+        ("3.2=10", (("03", 2), 10.0)),
+    ],
+)
+def test_parse_time_limit(limit: str, expected: tuple[limits.Key, float]):
+    """Tests parsing time limits."""
+    assert limits.parse_time_limit(limit) == expected
+
+
+@pytest.mark.parametrize(
+    ("limit", "expected"),
+    [
+        ("1024", ((None, None), 1024)),
+        ("10=512M", (("10", None), 512 << 20)),
+        ("8.1=2GiB", (("08", 1), 2 << 30)),
+    ],
+)
+def test_parse_memory_limit(limit: str, expected: tuple[limits.Key, int]):
+    """Tests parsing memory limits."""
+    assert limits.parse_memory_limit(limit) == expected
+
+
+@pytest.mark.parametrize("limit", ["0", "x", "13=1", "1.3=1", "1=-1"])
+def test_parse_invalid_limit(limit: str):
+    """Tests rejecting invalid limits."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        _ = limits.parse_time_limit(limit)
+
+    with pytest.raises(argparse.ArgumentTypeError):
+        _ = limits.parse_memory_limit(limit)
+
+
+def test_most_specific_limit():
+    """Tests that the most specific limit applies."""
+    time_limits = {(None, None): 1.0, ("11", None): 2.0, ("11", 1): 3.0}
+    limit = limits.Limits(time_limits, {})
+
+    assert limit.get("time", "01", "part_1") == 1.0
+    assert limit.get("time", "11", "parse") == 2.0
+    assert limit.get("time", "11", "part_2") == 2.0
+    assert limit.get("time", "11", "part_1") == 3.0
+    assert limit.get("memory", "11", "part_1") is None
+
+
+def test_supervise():
+    """Tests solving an input in a supervised worker."""
+    results = limits.supervise(
+        Day1Solver,
+        test_day_01.TestDay1.cases[0][0].encode(),
+        limits=limits.Limits({}, {}),
+    )
+
+    assert (results.part_1, results.part_2) == test_day_01.TestDay1.cases[0][1:]
+    assert [phase.name for phase in results.phases] == ["parse", "part_1", "part_2"]
+
+
+def test_time_limit():
+    """Tests that a phase running past its time limit is aborted."""
+    start = time.perf_counter()
+    with pytest.raises(limits.LimitExceededError) as exc_info:
+        _ = limits.supervise(
+            SlowSolver, b"", limits=limits.Limits({(None, None): 0.5}, {})
+        )
+
+    assert time.perf_counter() - start < 30
+    assert exc_info.value.kind == "time"
+    assert exc_info.value.phases == ("part_1", "wait")
+    assert str(exc_info.value) == "part_1 > wait exceeded the time limit of 0.5 s"
+
+
+def test_memory_limit():
+    """Tests that a phase allocating past its memory limit is aborted."""
+    with pytest.raises(limits.LimitExceededError) as exc_info:
+        _ = limits.supervise(
+            HungrySolver, b"", limits=limits.Limits({}, {(None, None): MEMORY_LIMIT})
+        )
+
+    assert exc_info.value.kind == "memory"
+    assert exc_info.value.phases == ("part_2",)
+
+
+def test_memory_limit_numpy(tmp_path: pathlib.Path):
+    """Tests that a limit too small to load numpy is reported as exceeded."""
+    filepath = tmp_path / "input.txt"
+    _ = filepath.write_text(
+        test_day_08.TestDay8.cases[0][0], encoding=sys.getdefaultencoding()
+    )
+
+    # A fresh interpreter, so that numpy is first imported under the limit
+    args = ["8", "-i", str(filepath), "--memory-limit", "50M"]
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import advent_of_code_2025; advent_of_code_2025.main({args!r})",
+        ],
+        capture_output=True,
+        check=False,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+    assert process.returncode == 1
+    assert "parse exceeded the memory limit of 50 MiB" in process.stdout
+
+
+def test_cli(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+):
+    """Tests reporting the exceeded limits from the CLI."""
+    filepath = tmp_path / "input.txt"
+    _ = filepath.write_text(
+        test_day_01.TestDay1.cases[0][0], encoding=sys.getdefaultencoding()
+    )
+
+    advent_of_code_2025.main(["1", "-i", str(filepath), "--time-limit", "60"])
+    assert f"Part 2: {test_day_01.TestDay1.cases[0][2]}" in capsys.readouterr().out
+
+    monkeypatch.setattr(runner, "get_solver", lambda _: HungrySolver)
+    with pytest.raises(SystemExit) as exc_info:
+        advent_of_code_2025.main(["1", "-i", str(filepath), "--memory-limit", "4G"])
+
+    assert exc_info.value.code == 1
+    output = capsys.readouterr().out
+    assert "Part 2: part_2 exceeded the memory limit of 4 GiB" in output
@@ -0,0 +1,175 @@
+"""Tests the map-reduce engine."""
+
+import functools
+import operator
+import os
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from advent_of_code_2025 import base, generators, mapreduce, runner
+from advent_of_code_2025.day_03.solver import _get_maximum_number_from_line
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+    import pathlib
+
+
+@pytest.fixture(autouse=True)
+def pools() -> Generator[None]:
+    """Shuts down the pools made by a test, so no workers outlive it."""
+    yield
+    mapreduce.shutdown()
+
+
+def collect(lines: Iterable[memoryview]) -> list[int]:
+    """Collects the lines as numbers.
+
+    Args:
+        lines: The lines.
+
+    Returns:
+        The number of each line.
+    """
+    return [int(line) for line in lines]
+
+
+@pytest.fixture
+def input_file(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Creates an input of a thousand numbered lines.
+
+    Args:
+        tmp_path: The temporary path to store the input file.
+
+    Returns:
+        Path to the input file.
+    """
+    input_file = tmp_path / "input.txt"
+    _ = input_file.write_text(
+        "".join(f"{i}\n" for i in range(1000)), encoding=sys.getdefaultencoding()
+    )
+    return input_file
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_map_reduce_in_order(input_file: pathlib.Path, executor: str, in_memory: bool):
+    """Tests that the partial results are reduced in input order."""
+    source = input_file.read_bytes() if in_memory else input_file
+
+    result = mapreduce.map_reduce(
+        source, collect, operator.add, jobs=4, executor=executor, chunk_size=64
+    )
+
+    assert result == list(range(1000))
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_sum_lines(tmp_path: pathlib.Path, executor: str):
+    """Tests summing a day's lines in parallel against the serial sum."""
+    input_file = tmp_path / "input.txt"
+    with open(input_file, "w", encoding=sys.getdefaultencoding()) as file:
+        generators.write("03", 200, file)
+
+    func = functools.partial(_get_maximum_number_from_line, 12)
+    expected = mapreduce.sum_lines(input_file, func, executor="serial")
+    assert (
+        mapreduce.sum_lines(input_file, func, jobs=3, executor=executor, chunk_size=1)
+        == expected
+    )
+
+
+def count_lines(lines: Iterable[memoryview]) -> int:
+    """Counts the lines as work.
+
+    Args:
+        lines: The lines.
+
+    Returns:
+        Zero.
+    """
+    base.count("lines", sum(1 for _ in lines))
+    return 0
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_map_reduce_counts(input_file: pathlib.Path, executor: str):
+    """Tests that the work counted by the workers is kept."""
+    with base.counting() as counters:
+        _ = mapreduce.map_reduce(
+            input_file,
+            count_lines,
+            operator.add,
+            jobs=4,
+            executor=executor,
+            chunk_size=64,
+        )
+
+    assert counters == {"lines": 1000}
+
+
+def test_small_input_runs_in_process(input_file: pathlib.Path):
+    """Tests that inputs smaller than two chunks are not sent to workers."""
+    result = mapreduce.map_reduce(
+        input_file, lambda lines: sum(1 for _ in lines), operator.add, jobs=4
+    )
+
+    assert result == 1000
+
+
+def worker_ids(lines: Iterable[memoryview]) -> set[int]:
+    """Gets the process that mapped the lines.
+
+    Args:
+        lines: The lines.
+
+    Returns:
+        The ID of this process.
+    """
+    _ = sum(1 for _ in lines)
+    return {os.getpid()}
+
+
+def map_worker_ids(source: pathlib.Path) -> set[int]:
+    """Maps an input across processes, getting the processes that mapped it.
+
+    Args:
+        source: The input.
+
+    Returns:
+        The ID of each process that mapped a chunk.
+    """
+    return mapreduce.map_reduce(
+        source, worker_ids, operator.or_, jobs=4, executor="process", chunk_size=64
+    )
+
+
+def test_runner_worker_maps_serially(input_file: pathlib.Path):
+    """Tests that the runner's workers do not start pools of their own."""
+    with runner.make_executor("process", 1) as pool:
+        worker_id, *others = pool.submit(map_worker_ids, input_file).result()
+
+    assert not others
+    assert worker_id != os.getpid()
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_pool_reused(
+    input_file: pathlib.Path, executor: str, monkeypatch: pytest.MonkeyPatch
+):
+    """Tests that the calls share one pool per executor and number of jobs."""
+    made: list[str] = []
+
+    def make_executor(executor: str, jobs: int | None = None):
+        made.append(executor)
+        return runner_make_executor(executor, jobs)
+
+    runner_make_executor = runner.make_executor
+    monkeypatch.setattr(runner, "make_executor", make_executor)
+    for _ in range(2):
+        _ = mapreduce.sum_lines(
+            input_file, len, jobs=2, executor=executor, chunk_size=64
+        )
+
+    assert made == [executor]
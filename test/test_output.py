@@ -0,0 +1,127 @@
+"""Tests the machine-readable output."""
+
+import io
+import json
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+import advent_of_code_2025
+from advent_of_code_2025 import base, output
+
+from . import test_day_01, test_day_03
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def test_make_records():
+    """Tests making a record of each phase."""
+    data = test_day_01.TestDay1.cases[0][0]
+    results = base.Results(
+        "1",
+        3,
+        6,
+        [
+            base.Phase("parse", 0.5, 0.25, None, {}),
+            base.Phase("part_1", 1.0, 0.5, 64, {}),
+            base.Phase("part_2", 2.0, 1.0, 128, {"steps": 5}),
+        ],
+        {"steps": 5},
+    )
+
+    records = output.make_records("01", results, "-", data)
+
+    assert [
+        (record["part"], record["phase"], record["answer"]) for record in records
+    ] == [(None, "parse", None), (1, "part_1", 3), (2, "part_2", 6)]
+    assert records[2] == {
+        "day": 1,
+        "part": 2,
+        "phase": "part_2",
+        "answer": 6,
+        "error": None,
+        "input": "-",
+        "input_hash": base.input_digest(data),
+        "wall_time": 2.0,
+        "cpu_time": 1.0,
+        "peak_memory": 128,
+        "counters": {"steps": 5},
+    }
+
+
+def test_make_error_record(tmp_path: pathlib.Path):
+    """Tests making the record of a failed input."""
+    filepath = tmp_path / "missing.txt"
+
+    (record,) = output.make_records(
+        "01", FileNotFoundError("missing"), str(filepath), filepath
+    )
+
+    assert record["error"] == "FileNotFoundError: missing"
+    assert record["input_hash"] is None
+    assert record["wall_time"] is None
+
+
+def test_ndjson(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    """Tests writing a record per line for a single day."""
+    data = test_day_01.TestDay1.cases[0][0].encode()
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+
+    advent_of_code_2025.main(["1", "-i", "-", "--format", "ndjson"])
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["phase"] for record in records] == ["parse", "part_1", "part_2"]
+    assert [record["answer"] for record in records[1:]] == list(
+        test_day_01.TestDay1.cases[0][1:]
+    )
+    assert all(record["input_hash"] == base.input_digest(data) for record in records)
+    assert all(record["peak_memory"] is not None for record in records)
+
+
+def test_json(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]):
+    """Tests writing a single array for multiple days."""
+    for day, (data, *_) in (
+        ("01", test_day_01.TestDay1.cases[0]),
+        ("03", test_day_03.TestDay3.cases[0]),
+    ):
+        _ = (tmp_path / f"{day}.txt").write_text(
+            data, encoding=sys.getdefaultencoding()
+        )
+
+    with pytest.raises(SystemExit) as exc_info:
+        advent_of_code_2025.main(
+            [
+                "1-3",
+                "-i",
+                str(tmp_path / "{day}.txt"),
+                "--format",
+                "json",
+                "--executor",
+                "serial",
+            ]
+        )
+
+    assert exc_info.value.code == 1
+    records = json.loads(capsys.readouterr().out)
+    answers = {
+        (record["day"], record["part"]): record["answer"]
+        for record in records
+        if record["part"]
+    }
+    assert answers == {
+        (1, 1): test_day_01.TestDay1.cases[0][1],
+        (1, 2): test_day_01.TestDay1.cases[0][2],
+        (3, 1): test_day_03.TestDay3.cases[0][1],
+        (3, 2): test_day_03.TestDay3.cases[0][2],
+    }
+    assert [
+        record["error"] is not None for record in records if record["day"] == 2
+    ] == [True]
+
+
+def test_format_requires_local():
+    """Tests rejecting formats the daemon and profilers cannot record."""
+    with pytest.raises(SystemExit):
+        _ = advent_of_code_2025.parse_args(["1", "--format", "json", "--remote"])
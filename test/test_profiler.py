@@ -0,0 +1,88 @@
+"""Tests the profilers."""
+
+import pstats
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+
+import advent_of_code_2025
+from advent_of_code_2025 import profiler, result_cache
+
+from . import test_day_01
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def busy(seconds: float) -> None:
+    """Keeps the thread busy.
+
+    Args:
+        seconds: How long to be busy for.
+    """
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_sampler():
+    """Tests that the sampler records collapsed stacks."""
+    with profiler.Sampler(interval=0.001) as sampler:
+        busy(0.05)
+
+    stacks = sampler.collapsed().splitlines()
+    assert stacks
+    assert any(";busy (" in stack for stack in stacks)
+    assert all(stack.rsplit(" ", 1)[1].isnumeric() for stack in stacks)
+
+
+@pytest.mark.parametrize(
+    ("name", "extension"),
+    [("cprofile", "pstats"), ("sample", "folded"), ("tracemalloc", "tracemalloc")],
+)
+def test_profiling(tmp_path: pathlib.Path, name: str, extension: str):
+    """Tests that each profiler saves its report."""
+    with profiler.profiling(name, "busy", tmp_path):
+        busy(0.02)
+
+    assert (tmp_path / f"busy.{extension}").is_file()
+
+
+def test_profile_cli(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+):
+    """Tests profiling the parse and each part from the CLI."""
+    database = tmp_path / "results.sqlite3"
+    monkeypatch.setenv(result_cache.ENVIRONMENT_VARIABLE, str(database))
+    input_file = tmp_path / "input.txt"
+    _ = input_file.write_text(
+        test_day_01.TestDay1.cases[0][0], encoding=sys.getdefaultencoding()
+    )
+    output = tmp_path / "profiles"
+
+    advent_of_code_2025.main(
+        [
+            "1",
+            "-i",
+            str(input_file),
+            "--profile",
+            "cprofile",
+            "--profile-output",
+            str(output),
+        ]
+    )
+
+    assert sorted(path.name for path in output.iterdir()) == [
+        "day_01_parse.pstats",
+        "day_01_part_1.pstats",
+        "day_01_part_2.pstats",
+    ]
+    assert pstats.Stats(str(output / "day_01_part_2.pstats")).total_calls
+    assert "Part 2: 6" in capsys.readouterr().out
+    assert not tracemalloc.is_tracing()
+    assert not database.exists()  # The answers were solved, not cached
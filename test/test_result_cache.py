@@ -0,0 +1,189 @@
+"""Tests the answer cache."""
+
+import inspect
+import os
+import pathlib
+import sqlite3
+import sys
+from typing import override
+
+import pytest
+
+import advent_of_code_2025
+from advent_of_code_2025 import base, mapreduce, result_cache
+from advent_of_code_2025.day_01.solver import Solver as Day1Solver
+from advent_of_code_2025.day_02.solver import Solver as Day2Solver
+
+from . import test_day_01
+
+
+class CountingSolver(base.Solver):
+    """Solver that counts how often each part is solved."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.parses: int = 0
+        self.solves: int = 0
+
+    @override
+    def parse(self, filepath: base.Input) -> None:
+        self.parses += 1
+
+    @override
+    def part_1(self, filepath: base.Input, scale: int = 1) -> int | str:
+        self.solves += 1
+        with base.open_input(filepath) as file:
+            return sum(int(line) for line in file) * scale
+
+    @override
+    def part_2(self, filepath: base.Input) -> int | str:
+        self.solves += 1
+        return "done"
+
+
+@pytest.fixture(autouse=True)
+def database(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    """Enables the answer cache in a temporary database.
+
+    Args:
+        tmp_path: The temporary path to store the database.
+        monkeypatch: Restores the environment after the test.
+
+    Returns:
+        The database path.
+    """
+    database = tmp_path / "results.sqlite3"
+    monkeypatch.setenv(result_cache.ENVIRONMENT_VARIABLE, str(database))
+    return database
+
+
+def test_answers_once():
+    """Tests that an answer is solved once per input and arguments."""
+    solver = CountingSolver()
+
+    assert solver.part_1("1\n2\n") == 3
+    assert CountingSolver().part_1(b"1\n2\n") == 3
+    assert solver.part_1("1\n2\n", scale=2) == 6
+    assert solver.part_1("1\n3\n") == 4
+    assert solver.solves == 3
+
+
+class OtherEngine(CountingSolver):
+    """Another engine of the same day, which must not reuse its answers."""
+
+    @override
+    def part_1(self, filepath: base.Input, scale: int = 1) -> int | str:
+        return -super().part_1(filepath, scale)
+
+
+def test_engines_do_not_share_answers():
+    """Tests that the answers are keyed by the solver's class."""
+    assert CountingSolver().part_1("1\n2\n") == 3
+    assert OtherEngine().part_1("1\n2\n") == -3
+    assert CountingSolver().part_1("1\n2\n") == 3
+
+
+def test_rebuilds_outdated_database(database: pathlib.Path):
+    """Tests that a database of an older schema is rebuilt."""
+    connection = sqlite3.connect(database)
+    _ = connection.execute("CREATE TABLE answers (day TEXT, part INTEGER)")
+    connection.commit()
+    connection.close()
+
+    assert CountingSolver().part_1("1\n2\n") == 3
+    solver = CountingSolver()
+    assert solver.part_1("1\n2\n") == 3
+    assert solver.solves == 0
+
+
+def test_solve_skips_parse(capsys: pytest.CaptureFixture[str]):
+    """Tests that the parse is skipped when both answers are cached."""
+    solver = CountingSolver()
+
+    _ = solver.solve("1\n2\n")
+    results = solver.solve("1\n2\n")
+
+    assert (results.part_1, results.part_2) == (3, "done")
+    assert (solver.parses, solver.solves) == (1, 2)
+    assert capsys.readouterr().out.count("Part 2: done") == 2
+
+
+def test_disabled(database: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """Tests that nothing is cached when the cache is bypassed."""
+    monkeypatch.setenv(result_cache.ENVIRONMENT_VARIABLE, "0")
+    solver = CountingSolver()
+
+    _ = solver.part_1("1\n")
+    _ = solver.part_1("1\n")
+
+    assert solver.solves == 2
+    assert not database.exists()
+
+
+def test_disabled_context(database: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """Tests that the cache is only disabled within the context."""
+    with result_cache.disabled():
+        assert result_cache.get_path() is None
+
+    assert result_cache.get_path() == database
+
+    monkeypatch.delenv(result_cache.ENVIRONMENT_VARIABLE)
+    with result_cache.disabled():
+        pass
+
+    assert result_cache.ENVIRONMENT_VARIABLE not in os.environ
+
+
+def test_fingerprint():
+    """Tests that each day's code has its own fingerprint."""
+    assert result_cache.fingerprint(Day1Solver) == result_cache.fingerprint(Day1Solver)
+    assert result_cache.fingerprint(Day1Solver) != result_cache.fingerprint(Day2Solver)
+
+
+def test_source_files():
+    """Tests that the fingerprint covers the shared modules but not other days."""
+    filepaths = result_cache.source_files(Day1Solver)
+
+    assert pathlib.Path(base.__file__) in filepaths
+    assert pathlib.Path(mapreduce.__file__) in filepaths
+    assert pathlib.Path(inspect.getfile(Day1Solver)) in filepaths
+    assert pathlib.Path(inspect.getfile(Day2Solver)) not in filepaths
+
+
+def test_evicts_least_recently_used(database: pathlib.Path):
+    """Tests that the cache is bounded."""
+    keys = [("1", "", 1, f"{i}", "", "") for i in range(3)]
+
+    result_cache.put(database, keys[0], 0, max_entries=2)
+    result_cache.put(database, keys[1], 1, max_entries=2)
+    assert result_cache.get(database, keys[0]) == 0
+    result_cache.put(database, keys[2], 2, max_entries=2)
+
+    assert result_cache.get(database, keys[0]) == 0
+    assert result_cache.get(database, keys[1]) is None
+    assert result_cache.get(database, keys[2]) == 2
+
+
+def test_cli(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+):
+    """Tests enabling and clearing the cache from the CLI."""
+    monkeypatch.delenv(result_cache.ENVIRONMENT_VARIABLE)
+    database = tmp_path / "cli.sqlite3"
+    filepath = tmp_path / "input.txt"
+    _ = filepath.write_text(
+        test_day_01.TestDay1.cases[0][0], encoding=sys.getdefaultencoding()
+    )
+
+    advent_of_code_2025.main(
+        ["1", "-i", str(filepath), "--result-cache", str(database)]
+    )
+    assert database.exists()
+    assert f"Part 1: {test_day_01.TestDay1.cases[0][1]}" in capsys.readouterr().out
+
+    advent_of_code_2025.main(
+        ["1", "-i", str(filepath), "--no-result-cache", "--clear-result-cache"]
+    )
+    assert not database.exists()
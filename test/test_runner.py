@@ -0,0 +1,151 @@
+"""Tests the multi-day runner."""
+
+import concurrent.futures
+import io
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+import advent_of_code_2025
+from advent_of_code_2025 import base, runner
+from advent_of_code_2025.day_01.solver import Solver
+
+from . import test_day_01, test_day_03
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.mark.parametrize(
+    ("days", "expected"),
+    [
+        ("3", ["03"]),
+        ("1,4,8-10", ["01", "04", "08", "09", "10"]),
+        ("10-12,2,11", ["02", "10", "11", "12"]),
+        ("all", [f"{day:0>2}" for day in range(1, 13)]),
+    ],
+)
+def test_parse_days(days: str, expected: list[str]):
+    """Tests parsing the days to solve."""
+    assert advent_of_code_2025.parse_args([days]).days == expected
+
+
+@pytest.mark.parametrize("days", ["0", "13", "4-2", "1,x", "1-"])
+def test_parse_invalid_days(days: str):
+    """Tests rejecting invalid days."""
+    with pytest.raises(SystemExit):
+        _ = advent_of_code_2025.parse_args([days])
+
+
+def test_input_path():
+    """Tests selecting the input path for each day."""
+    args = advent_of_code_2025.parse_args(["1"])
+    assert str(args.input_path("01")) == "input.txt"
+
+    args = advent_of_code_2025.parse_args(["1,2"])
+    assert str(args.input_path("02")) == "inputs/day_02.txt"
+
+    args = advent_of_code_2025.parse_args(["1,2", "-i", "data/{day}.in"])
+    assert str(args.input_path("01")) == "data/01.in"
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        "serial",
+        "thread",
+        pytest.param(
+            "interpreter",
+            marks=pytest.mark.skipif(
+                not hasattr(concurrent.futures, "InterpreterPoolExecutor"),
+                reason="Requires Python 3.14",
+            ),
+        ),
+    ],
+)
+def test_run(tmp_path: pathlib.Path, executor: str):
+    """Tests that the days are solved and returned in order."""
+    inputs: dict[str, pathlib.Path] = {}
+    for day, (data, *_) in (
+        ("03", test_day_03.TestDay3.cases[0]),
+        ("01", test_day_01.TestDay1.cases[0]),
+    ):
+        inputs[day] = tmp_path / f"{day}.txt"
+        _ = inputs[day].write_text(data, encoding=sys.getdefaultencoding())
+
+    inputs["02"] = tmp_path / "missing.txt"
+
+    outcomes = runner.run(inputs, executor=executor, jobs=2)
+
+    assert list(outcomes) == ["01", "02", "03"]
+    assert outcomes["01"] == list(test_day_01.TestDay1.cases[0][1:])
+    assert outcomes["03"] == list(test_day_03.TestDay3.cases[0][1:])
+    assert all(isinstance(outcome, FileNotFoundError) for outcome in outcomes["02"])
+
+
+def test_interpreter_unsupported_days(capsys: pytest.CaptureFixture[str]):
+    """Tests rejecting the days the interpreter executor cannot solve."""
+    with pytest.raises(SystemExit):
+        _ = advent_of_code_2025.parse_args(["7-9", "--executor", "interpreter"])
+
+    assert "numpy or scipy: 8, 9" in capsys.readouterr().err
+    assert advent_of_code_2025.parse_args(["1-7", "--executor", "interpreter"])
+    assert advent_of_code_2025.parse_args(
+        ["8", "--executor", "interpreter", "--time-limit", "5"]
+    )
+
+
+def test_stdin(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    """Tests reading a single day's input from stdin."""
+    data = test_day_01.TestDay1.cases[0][0].encode()
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+
+    advent_of_code_2025.main(["1", "-i", "-"])
+
+    assert f"Part 2: {test_day_01.TestDay1.cases[0][2]}" in capsys.readouterr().out
+    with pytest.raises(SystemExit):
+        _ = advent_of_code_2025.parse_args(["1,2", "-i", "-"])
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread", "process"])
+def test_solve_many(tmp_path: pathlib.Path, executor: str):
+    """Tests that each input is solved and streamed back with its index."""
+    inputs: list[base.Input] = [
+        test_day_01.TestDay1.cases[0][0],
+        tmp_path / "missing.txt",
+        test_day_01.TestDay1.cases[0][0].encode(),
+    ]
+
+    outcomes = dict(Solver().solve_many(inputs, jobs=2, executor=executor))
+
+    assert sorted(outcomes) == [0, 1, 2]
+    assert isinstance(outcomes[1], FileNotFoundError)
+    for i in (0, 2):
+        results = outcomes[i]
+        assert isinstance(results, base.Results)
+        assert (results.part_1, results.part_2) == test_day_01.TestDay1.cases[0][1:]
+        assert [phase.name for phase in results.phases] == ["parse", "part_1", "part_2"]
+
+
+def test_solve_many_cli(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]):
+    """Tests solving a day for multiple inputs from the CLI."""
+    filepaths = [tmp_path / f"{i}.txt" for i in range(3)]
+    for filepath in filepaths:
+        _ = filepath.write_text(
+            test_day_01.TestDay1.cases[0][0], encoding=sys.getdefaultencoding()
+        )
+
+    advent_of_code_2025.main(
+        ["1", "-i", *map(str, filepaths), "--executor", "thread", "-j", "2"]
+    )
+
+    output = capsys.readouterr().out
+    assert sorted(
+        line.removeprefix("Input: ")
+        for line in output.splitlines()
+        if line.startswith("Input: ")
+    ) == sorted(map(str, filepaths))
+    assert output.count(f"Part 1: {test_day_01.TestDay1.cases[0][1]}") == 3
+    with pytest.raises(SystemExit):
+        _ = advent_of_code_2025.parse_args(["1,2", "-i", "a.txt", "b.txt"])
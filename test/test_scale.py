@@ -0,0 +1,67 @@
+"""Tests the scaling benchmark."""
+
+import json
+import math
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from advent_of_code_2025 import disk_cache, scale
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.mark.parametrize(
+    ("model", "exponent"),
+    [("1", 0.0), ("n", 1.0), ("n log n", 1.1), ("n^2", 2.0), ("n^3", 3.0)],
+)
+def test_fit(model: str, exponent: float):
+    """Tests recovering the model of exact measurements."""
+    sizes = list(scale.get_sizes(100, 100_000, 2))
+    values = [3e-6 * scale.MODELS[model](n) for n in sizes]
+
+    result = scale.fit(sizes, values)
+
+    assert result.model == model
+    assert result.coefficient == pytest.approx(3e-6)
+    assert result.exponent == pytest.approx(exponent, abs=0.1)
+    assert result.predict(10**6) == pytest.approx(3e-6 * scale.MODELS[model](10**6))
+
+
+def test_fit_noise():
+    """Tests that noisy quadratic measurements fit a quadratic."""
+    sizes = list(scale.get_sizes(100, 100_000, 2))
+    values = [n**2 * (1.1 if i % 2 else 0.9) for i, n in enumerate(sizes)]
+
+    assert scale.fit(sizes, values).model == "n^2"
+
+
+def test_get_sizes():
+    """Tests growing the sizes geometrically."""
+    assert list(scale.get_sizes(2, 20, 1.5)) == [2, 3, 4, 6, 9, 14]
+
+
+def test_main(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+):
+    """Tests measuring and fitting a day."""
+    monkeypatch.setenv(disk_cache.ENVIRONMENT_VARIABLE, str(tmp_path / "cache"))
+    output = tmp_path / "scale.json"
+
+    scale.main(["1", "--max-size", "800", "-r", "1", "-o", str(output)])
+
+    with open(output, encoding=sys.getdefaultencoding()) as file:
+        results = json.load(file)
+    assert [sample["size"] for sample in results["samples"]] == [100, 200, 400, 800]
+    assert list(results["fits"]) == list(scale.PHASES)
+    assert all(
+        math.isfinite(fit["exponent"])
+        for kinds in results["fits"].values()
+        for fit in kinds.values()
+    )
+    assert "parse" in capsys.readouterr().out
+    assert disk_cache.get_directory() == tmp_path / "cache"
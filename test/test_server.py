@@ -0,0 +1,114 @@
+"""Tests the solver daemon."""
+
+import os
+import stat
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+import advent_of_code_2025
+from advent_of_code_2025 import server
+
+from . import test_day_01, test_day_03
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    import pathlib
+
+
+@pytest.fixture
+def socket_path(tmp_path: pathlib.Path) -> Generator[pathlib.Path]:
+    """Serves the daemon in a background thread.
+
+    Args:
+        tmp_path: The temporary path to store the socket.
+
+    Yields:
+        The socket path.
+    """
+    path = tmp_path / "daemon" / "solver.sock"
+    with server.Server(path, preload=["01"]) as daemon:
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        yield path
+        daemon.shutdown()
+        thread.join()
+
+    assert not path.exists()
+
+
+def test_request(tmp_path: pathlib.Path, socket_path: pathlib.Path):
+    """Tests that the days are solved through the daemon."""
+    inputs: dict[str, pathlib.Path] = {}
+    for day, (data, *_) in (
+        ("01", test_day_01.TestDay1.cases[0]),
+        ("03", test_day_03.TestDay3.cases[0]),
+    ):
+        inputs[day] = tmp_path / f"{day}.txt"
+        _ = inputs[day].write_text(data, encoding=sys.getdefaultencoding())
+
+    inputs["02"] = tmp_path / "missing.txt"
+
+    for _ in range(2):
+        outcomes = server.request(socket_path, inputs)
+
+        assert outcomes["01"] == list(test_day_01.TestDay1.cases[0][1:])
+        assert outcomes["03"] == list(test_day_03.TestDay3.cases[0][1:])
+        assert all(
+            isinstance(outcome, server.RemoteError) for outcome in outcomes["02"]
+        )
+        assert "FileNotFoundError" in str(outcomes["02"][0])
+
+
+def test_permissions(socket_path: pathlib.Path):
+    """Tests that only the user can access the socket."""
+    assert stat.S_IMODE(socket_path.stat().st_mode) == server.SOCKET_MODE
+    assert stat.S_IMODE(socket_path.parent.stat().st_mode) == server.DIRECTORY_MODE
+
+
+def test_default_socket(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    """Tests that the default socket is within a directory of the user."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    path = server.default_socket()
+
+    assert path.parent.parent == tmp_path
+    assert str(os.getuid()) in path.parent.name
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        {"day": "13", "part": 1, "path": "x"},
+        {"day": "all", "part": 1, "path": "x"},
+        {"day": "1,2", "part": 1, "path": "x"},
+        {"day": "1", "part": 3, "path": "x"},
+        {},
+    ],
+)
+def test_solve_invalid(request_: dict[str, object]):
+    """Tests that invalid requests are answered with an error."""
+    assert "error" in server.solve(request_)
+
+
+def test_remote_cli(
+    tmp_path: pathlib.Path,
+    socket_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+):
+    """Tests solving through the daemon from the CLI."""
+    filepath = tmp_path / "input.txt"
+    _ = filepath.write_text(
+        test_day_01.TestDay1.cases[0][0], encoding=sys.getdefaultencoding()
+    )
+
+    advent_of_code_2025.main(["1", "-i", str(filepath), "--remote", str(socket_path)])
+
+    assert capsys.readouterr().out.splitlines() == [
+        "Day 1",
+        f"Part 1: {test_day_01.TestDay1.cases[0][1]}",
+        "===========================",
+        f"Part 2: {test_day_01.TestDay1.cases[0][2]}",
+    ]
@@ -0,0 +1,74 @@
+"""Tests the startup import time report."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import advent_of_code_2025
+from advent_of_code_2025 import startup
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       234 |        234 |   _io
+import time:       725 |        959 | _frozen_importlib_external
+import time:       120 |        120 |     token
+import time:      1290 |       1410 |   tokenize
+import time:      3184 |       4594 | inspect
+"""
+
+
+def test_parse():
+    """Tests parsing the output of `python -X importtime`."""
+    assert startup.parse(OUTPUT) == [
+        startup.Import("_io", 234e-6, 234e-6, 1),
+        startup.Import("_frozen_importlib_external", 725e-6, 959e-6, 0),
+        startup.Import("token", 120e-6, 120e-6, 2),
+        startup.Import("tokenize", 1290e-6, 1410e-6, 1),
+        startup.Import("inspect", 3184e-6, 4594e-6, 0),
+    ]
+
+
+def test_report(capsys: pytest.CaptureFixture[str]):
+    """Tests reporting the modules with the largest import cost."""
+    startup.report(startup.parse(OUTPUT), top=2)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[-1] for line in lines[1:3]] == ["inspect", "tokenize"]
+    assert lines[-1] == "Total: 5.553 ms over 5 modules"
+
+
+def test_parse_args():
+    """Tests that the days are optional only for the report."""
+    assert advent_of_code_2025.parse_args(["--startup-report"]).days == list(
+        advent_of_code_2025.DAYS
+    )
+    with pytest.raises(SystemExit):
+        _ = advent_of_code_2025.parse_args([])
+
+
+@pytest.mark.parametrize(
+    ("module", "deferred"),
+    [
+        ("advent_of_code_2025", ["dataclasses", "concurrent.futures", "cProfile"]),
+        (
+            "advent_of_code_2025.day_01.solver",
+            ["dataclasses", "hashlib", "mmap", "tracemalloc", "concurrent.futures"],
+        ),
+        ("advent_of_code_2025.day_10.solver", ["scipy"]),
+    ],
+)
+def test_deferred_imports(module: str, deferred: list[str]):
+    """Tests that heavy dependencies are not imported at startup."""
+    code = (
+        f"import sys, {module}; print(*(m for m in {deferred!r} if m in sys.modules))"
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert process.stdout.split() == []